@@ -10,7 +10,7 @@ API endpoints for brand kit CRUD operations:
 - DELETE /brand-kits/{id} - Soft-delete brand kit
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Header
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from datetime import datetime, timezone
 from bson import ObjectId
@@ -27,6 +27,9 @@ from backend.models.user import UserInDB
 from backend.auth.dependencies import get_current_active_user
 from backend.database.mongodb import get_db
 from backend.auth.schemas import ErrorResponse
+from backend.services.etags import CACHE_CONTROL, etag_matches, make_etag, not_modified
+from backend.services.fast_json import model_response
+from backend.services.onepager_render import compile_brand_stylesheets
 
 router = APIRouter(prefix="/brand-kits", tags=["Brand Kits"])
 
@@ -134,7 +137,7 @@ async def get_my_brand_kits(
 
     brand_kits = await cursor.to_list(length=None)
 
-    return [BrandKitResponse(**brand_kit_helper(kit)) for kit in brand_kits]
+    return model_response(List[BrandKitResponse], [brand_kit_helper(kit) for kit in brand_kits])
 
 
 @router.get(
@@ -147,6 +150,7 @@ async def get_my_brand_kits(
 )
 async def get_brand_kit(
     brand_kit_id: str,
+    if_none_match: Optional[str] = Header(None),
     current_user: UserInDB = Depends(get_current_active_user),
     db: AsyncIOMotorDatabase = Depends(get_db)
 ):
@@ -155,6 +159,9 @@ async def get_brand_kit(
 
     Requires ownership verification - users can only access their own brand kits.
 
+    The response carries a strong `ETag` derived from `updated_at`; send it
+    back in `If-None-Match` to get `304 Not Modified` when nothing changed.
+
     **Path Parameters:**
     - brand_kit_id: MongoDB ObjectId of the brand kit
 
@@ -188,7 +195,14 @@ async def get_brand_kit(
             detail="Not authorized to access this brand kit"
         )
 
-    return BrandKitResponse(**brand_kit_helper(brand_kit))
+    etag = make_etag("brand_kit", brand_kit["_id"], brand_kit.get("updated_at"))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    return model_response(
+        BrandKitResponse, brand_kit_helper(brand_kit),
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
 
 
 @router.put(
@@ -202,6 +216,7 @@ async def get_brand_kit(
 async def update_brand_kit(
     brand_kit_id: str,
     update_data: BrandKitUpdate,
+    background_tasks: BackgroundTasks,
     current_user: UserInDB = Depends(get_current_active_user),
     db: AsyncIOMotorDatabase = Depends(get_db)
 ):
@@ -288,6 +303,10 @@ async def update_brand_kit(
     # Fetch updated document
     updated_brand_kit = await db.brand_kits.find_one({"_id": ObjectId(brand_kit_id)})
 
+    # Compile the new stylesheets before the next preview/export needs them
+    if update_data.color_palette is not None or update_data.typography is not None:
+        background_tasks.add_task(compile_brand_stylesheets, updated_brand_kit)
+
     return BrandKitResponse(**brand_kit_helper(updated_brand_kit))
 
 
@@ -59,6 +59,46 @@ class Settings(BaseSettings):
     huggingface_api_token: str = ""  # Hugging Face API token
     gemini_api_key: str = ""  # Google Gemini API key
     
+    # PDF Rendering
+    pdf_browser_pool_size: int = 2  # Warm Chromium instances kept for PDF export (0 disables the pool)
+    pdf_browser_max_renders: int = 200  # Recycle a pooled browser after this many renders (0 = never)
+    pdf_render_backend: str = "threads"  # Options: threads (warm browser pool), processes (render worker processes)
+    pdf_render_processes: int = 0  # Render worker processes when backend=processes (0 = one per CPU core)
+    pdf_readiness_mode: str = "ready"  # Options: ready (network idle + fonts + images), fixed (legacy 1s wait)
+    pdf_readiness_timeout_ms: int = 5000  # Hard deadline for the readiness wait
+    pdf_cache_dir: str = ""  # Defaults to backend/output/pdf_cache
+    pdf_cache_max_bytes: int = 512 * 1024 * 1024  # LRU size bound for the cache directory, shared by all workers (0 disables)
+    pdf_batch_max_concurrency: int = 4  # Pages rendered in parallel by a batch export
+    pdf_batch_max_items: int = 60  # Max one-pager × format × template combinations per batch
+    pdf_render_max_concurrency: int = 0  # Renders in flight per process (0 = render processes or browser pool size)
+    pdf_render_max_queue: int = 20  # Renders allowed to wait for a slot before 429
+    pdf_render_max_queued_per_user: int = 4  # Per-user share of the wait queue
+    raster_default_dpi: int = 150  # Image export resolution when no DPI is requested
+    raster_max_dpi: int = 300  # Upper bound for requested image DPI
+    thumbnail_width_px: int = 320  # Width of list-view thumbnails
+    html_cache_max_bytes: int = 16 * 1024 * 1024  # In-memory LRU of rendered one-pager HTML (0 disables)
+    html_fragment_cache_max_bytes: int = 8 * 1024 * 1024  # In-memory LRU of rendered template sections (0 disables)
+    render_model_cache_size: int = 256  # Memoized one-pager render models (0 disables)
+    jinja_bytecode_cache_dir: str = ""  # Compiled PDF template cache, defaults to backend/output/jinja_cache
+    css_bundle_dir: str = ""  # Minified per-brand stylesheets, defaults to backend/output/css_bundles
+    css_bundle_cache_max_bytes: int = 4 * 1024 * 1024  # In-memory LRU of compiled stylesheets (0 disables)
+    last_accessed_flush_seconds: float = 5.0  # Buffered last_accessed timestamps are written this often
+    last_accessed_max_pending: int = 10000  # Pending one-pagers that trigger an early flush
+    onepager_list_max_skip: int = 1000  # Largest deprecated ?skip= offset on GET /onepagers (use the cursor beyond)
+    version_keyframe_interval: int = 20  # Versions stored as JSON Patch deltas between full keyframes
+
+    # Background Export Jobs
+    export_job_workers: int = 2  # Jobs rendered in parallel per API process (0 disables workers)
+    export_job_poll_seconds: float = 2.0  # Idle queue poll interval
+    export_job_lease_seconds: int = 300  # A running job is reclaimed after its lease expires
+    export_job_max_attempts: int = 3  # Render attempts before a job is marked failed
+    export_job_retention_hours: int = 24  # Finished jobs (and their PDFs) expire after this
+
+    # Local Font Store (Google Fonts served offline to the PDF engine)
+    font_store_dir: str = ""  # Defaults to backend/assets/fonts
+    font_cache_max_bytes: int = 32 * 1024 * 1024  # In-memory LRU of woff2 bytes
+    font_store_offline: bool = True  # False: fetch fonts missing from the store from the Google Fonts CDN (opt-in)
+
     # Logging
     log_level: str = "INFO"
     
@@ -64,6 +64,8 @@ class MongoDB:
         - Users: unique index on email
         - Brand Kits: indexes on user_id, is_active
         - One-Pagers: indexes on user_id, created_at, status
+        - One-Pager Versions: unique index on (onepager_id, version)
+        - Export Jobs: queue order (status, created_at), user_id, lease_id, TTL on expires_at
         """
         if cls.database is None:
             return
@@ -88,8 +90,24 @@ class MongoDB:
             await onepagers_collection.create_index("status")
             await onepagers_collection.create_index([("user_id", 1), ("status", 1)])
             await onepagers_collection.create_index([("user_id", 1), ("created_at", -1)])
+            # Keyset pagination of list_onepagers (created_at, _id newest first)
+            await onepagers_collection.create_index([("user_id", 1), ("created_at", -1), ("_id", -1)])
+            await onepagers_collection.create_index([("user_id", 1), ("status", 1), ("created_at", -1), ("_id", -1)])
             logger.info("✅ Created indexes on onepagers (user_id, created_at, status)")
 
+            # One-pager versions collection indexes
+            versions_collection = cls.database.onepager_versions
+            await versions_collection.create_index([("onepager_id", 1), ("version", -1)], unique=True)
+            logger.info("✅ Created unique index on onepager_versions (onepager_id, version)")
+
+            # Export jobs collection indexes
+            export_jobs_collection = cls.database.export_jobs
+            await export_jobs_collection.create_index([("status", 1), ("created_at", 1)])  # Queue claim order
+            await export_jobs_collection.create_index("user_id")
+            await export_jobs_collection.create_index("lease_id", sparse=True)  # Lease heartbeat and ownership
+            await export_jobs_collection.create_index("expires_at", expireAfterSeconds=0)  # TTL for finished jobs
+            logger.info("✅ Created indexes on export_jobs (status, user_id, lease_id, expires_at TTL)")
+
         except Exception as e:
             logger.warning(f"⚠️ Error creating indexes: {e}")
     
@@ -0,0 +1,6 @@
+"""
+Export Jobs Module
+==================
+
+Background PDF export jobs with persisted state and progress polling.
+"""
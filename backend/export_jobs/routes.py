@@ -0,0 +1,200 @@
+"""
+Export Job Routes
+=================
+
+API endpoints for background PDF export:
+- POST /export-jobs - Queue a PDF export (202 Accepted)
+- GET /export-jobs/{id} - Poll job status and progress
+- GET /export-jobs/{id}/download - Download the finished PDF
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from datetime import datetime, timezone
+from bson import ObjectId
+import io
+import logging
+
+from backend.export_jobs.schemas import ExportJobCreate, ExportJobResponse
+from backend.models.export_job import ExportJobStatus, EXPORT_JOB_HEAVY_FIELDS, export_job_helper
+from backend.models.user import UserInDB
+from backend.auth.dependencies import get_current_active_user
+from backend.database.mongodb import get_db
+from backend.auth.schemas import ErrorResponse
+from backend.services.onepager_render import get_brand_kit_doc, render_onepager_html
+from backend.services.pdf_cache import make_pdf_cache_key
+from backend.services.export_jobs import export_job_workers
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/export-jobs", tags=["Export Jobs"])
+
+
+async def _get_owned_job(db: AsyncIOMotorDatabase, job_id: str, current_user: UserInDB, projection=None):
+    """Fetch an export job and verify the current user owns it."""
+    if not ObjectId.is_valid(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid export job ID format"
+        )
+
+    job_doc = await db.export_jobs.find_one({"_id": ObjectId(job_id)}, projection)
+    if not job_doc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found"
+        )
+
+    if str(job_doc["user_id"]) != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this export job"
+        )
+
+    return job_doc
+
+
+@router.post(
+    "",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid one-pager ID"},
+        403: {"model": ErrorResponse, "description": "User doesn't own this one-pager"},
+        404: {"model": ErrorResponse, "description": "One-pager not found"}
+    }
+)
+async def create_export_job(
+    job_data: ExportJobCreate,
+    current_user: UserInDB = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    """
+    Queue a PDF export and return immediately.
+
+    The HTML is rendered now (so the PDF reflects the one-pager as it was
+    when the export was requested); the PDF itself is produced by the
+    background workers. Poll `GET /export-jobs/{id}` until `status` is
+    `completed`, then fetch `download_url`.
+
+    **Returns:**
+    - 202 with the queued job (status, progress, timestamps)
+    """
+    if not ObjectId.is_valid(job_data.onepager_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid one-pager ID format"
+        )
+
+    onepager_doc = await db.onepagers.find_one({"_id": ObjectId(job_data.onepager_id)})
+    if not onepager_doc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="One-pager not found"
+        )
+
+    if str(onepager_doc["user_id"]) != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to export this one-pager"
+        )
+
+    # Same template priority as the synchronous export endpoint
+    requested_template = job_data.template.value if job_data.template else None
+    selected_template = onepager_doc.get("pdf_template") or requested_template or "minimalist"
+    page_format = job_data.format.value
+
+    brand_kit_doc = await get_brand_kit_doc(db, onepager_doc)
+    html = render_onepager_html(onepager_doc, brand_kit_doc, selected_template)
+
+    now = datetime.now(timezone.utc)
+    job_doc = {
+        "user_id": ObjectId(current_user.id),
+        "onepager_id": onepager_doc["_id"],
+        "status": ExportJobStatus.QUEUED.value,
+        "stage": "queued",
+        "progress": 0,
+        "format": page_format,
+        "template": selected_template,
+        "html": html,
+        "cache_key": make_pdf_cache_key(html, page_format),
+        "attempts": 0,
+        "error": None,
+        "created_at": now,
+        "updated_at": now
+    }
+    result = await db.export_jobs.insert_one(job_doc)
+    job_doc["_id"] = result.inserted_id
+
+    export_job_workers.notify()
+    logger.info(f"📥 Queued export job {result.inserted_id} for onepager {job_data.onepager_id}")
+
+    return ExportJobResponse(**export_job_helper(job_doc))
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ExportJobResponse,
+    responses={
+        403: {"model": ErrorResponse, "description": "User doesn't own this job"},
+        404: {"model": ErrorResponse, "description": "Export job not found"}
+    }
+)
+async def get_export_job(
+    job_id: str,
+    current_user: UserInDB = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    """
+    Get export job status and progress.
+
+    **Returns:**
+    - Job status (queued, running, completed, failed), progress 0-100,
+      current stage and download_url once completed
+    """
+    job_doc = await _get_owned_job(db, job_id, current_user, EXPORT_JOB_HEAVY_FIELDS)
+    return ExportJobResponse(**export_job_helper(job_doc))
+
+
+@router.get(
+    "/{job_id}/download",
+    responses={
+        200: {"content": {"application/pdf": {}}, "description": "Finished PDF"},
+        403: {"model": ErrorResponse, "description": "User doesn't own this job"},
+        404: {"model": ErrorResponse, "description": "Export job not found"},
+        409: {"model": ErrorResponse, "description": "Job has not completed"}
+    }
+)
+async def download_export_job(
+    job_id: str,
+    current_user: UserInDB = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    """
+    Download the PDF produced by a completed export job.
+
+    **Errors:**
+    - 409: Job is still queued/running or has failed
+    """
+    job_doc = await _get_owned_job(db, job_id, current_user, {"html": 0})
+
+    if job_doc["status"] != ExportJobStatus.COMPLETED.value:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export job is {job_doc['status']}"
+        )
+
+    pdf_bytes = bytes(job_doc["result_pdf"])
+    filename = f"onepager_{job_doc['onepager_id']}_{job_doc['format']}.pdf"
+
+    return StreamingResponse(
+        io.BytesIO(pdf_bytes),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename=\"{filename}\"",
+            "ETag": f'"{job_doc["cache_key"]}"',
+            "X-PDF-Format": job_doc["format"],
+            "X-PDF-Size-KB": str(int(len(pdf_bytes) / 1024))
+        }
+    )
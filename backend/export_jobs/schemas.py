@@ -0,0 +1,77 @@
+"""
+Export Job API Schemas
+======================
+
+Pydantic request/response models for background export job endpoints.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+from backend.models.export_job import ExportJobStatus
+from backend.onepagers.schemas import PDFPageFormat, PDFTemplate
+
+
+class ExportJobCreate(BaseModel):
+    """Request model for submitting a background PDF export."""
+    onepager_id: str = Field(..., description="One-pager to export")
+    format: PDFPageFormat = Field(default=PDFPageFormat.LETTER, description="Page format")
+    template: Optional[PDFTemplate] = Field(
+        None,
+        description="Template (defaults to the one-pager's saved pdf_template)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "onepager_id": "507f1f77bcf86cd799439011",
+                "format": "a4",
+                "template": "minimalist"
+            }
+        }
+
+
+class ExportJobResponse(BaseModel):
+    """Status/progress view of an export job."""
+    id: str = Field(description="Export job ID")
+    onepager_id: str = Field(description="Exported one-pager ID")
+    status: ExportJobStatus = Field(description="queued, running, completed or failed")
+    progress: int = Field(description="Progress percentage (0-100)")
+    stage: Optional[str] = Field(None, description="Current processing stage")
+    format: str = Field(description="Page format")
+    template: str = Field(description="Template used")
+    attempts: int = Field(description="Render attempts so far")
+    error: Optional[str] = Field(None, description="Last error message")
+    size_bytes: Optional[int] = Field(None, description="PDF size once completed")
+    download_url: Optional[str] = Field(None, description="Download URL once completed")
+    created_at: datetime = Field(description="Submission timestamp")
+    updated_at: datetime = Field(description="Last status change")
+    finished_at: Optional[datetime] = Field(None, description="Completion/failure timestamp")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "65a1f77bcf86cd7994390aa1",
+                "onepager_id": "507f1f77bcf86cd799439011",
+                "status": "running",
+                "progress": 50,
+                "stage": "rendering_pdf",
+                "format": "a4",
+                "template": "minimalist",
+                "attempts": 1,
+                "error": None,
+                "size_bytes": None,
+                "download_url": None,
+                "created_at": "2024-01-15T10:30:00Z",
+                "updated_at": "2024-01-15T10:30:01Z",
+                "finished_at": None
+            }
+        }
+
+
+__all__ = [
+    "ExportJobCreate",
+    "ExportJobResponse",
+    "ExportJobStatus"
+]
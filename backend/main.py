@@ -23,10 +23,24 @@ import time
 
 from backend.config import settings
 from backend.database.mongodb import MongoDB
+from backend.services.browser_pool import browser_pool
+from backend.services.render_processes import render_process_pool
+from backend.services.page_readiness import readiness_stats
+from backend.services.font_store import font_store
+from backend.services.pdf_cache import pdf_cache
+from backend.services.pdf_html_generator import pdf_html_generator
+from backend.services.html_cache import html_render_cache
+from backend.services.fragment_cache import fragment_cache
+from backend.services.css_bundles import css_bundles
+from backend.services.render_model import render_model_cache
+from backend.services.render_scheduler import render_scheduler, RenderQueueFullError
+from backend.services.export_jobs import export_job_workers
+from backend.services.access_tracker import access_tracker
 from backend.auth.routes import router as auth_router
 from backend.routes.export import router as export_router
 from backend.brand_kits.routes import router as brand_kits_router
 from backend.onepagers.routes import router as onepagers_router
+from backend.export_jobs.routes import router as export_jobs_router
 
 
 # Configure logging
@@ -43,8 +57,11 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
     
     Handles startup and shutdown events:
-    - Startup: Connect to MongoDB, create indexes
-    - Shutdown: Close database connections gracefully
+    - Startup: Connect to MongoDB, create indexes, warm the PDF browser pool,
+      start background export job workers and the last_accessed flusher
+    - Shutdown: Stop export workers (requeueing in-flight jobs), flush
+      pending last_accessed updates, stop the browser pool, close database
+      connections gracefully
     """
     # Startup
     logger.info("🚀 Starting Marketing One-Pager Backend API")
@@ -54,11 +71,36 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Failed to connect to database: {e}")
         raise
+
+    # Compile PDF templates now so requests only pay for rendering
+    pdf_html_generator.precompile()
+
+    # Report the local font store (missing default fonts render with system fonts)
+    font_store.check()
+
+    # Warm Chromium instances for PDF export (failures fall back to per-request browsers)
+    # Google Fonts requests are answered from the local font store
+    if settings.pdf_render_backend == "processes":
+        await render_process_pool.start()
+    else:
+        if font_store.install_routes not in browser_pool.context_hooks:
+            browser_pool.context_hooks.append(font_store.install_routes)
+        await browser_pool.start()
+
+    # Drain queued background exports (including jobs left by a previous run)
+    await export_job_workers.start(MongoDB.get_database())
+
+    # Batch last_accessed writes from one-pager reads
+    await access_tracker.start(MongoDB.get_database())
     
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down Marketing One-Pager Backend API")
+    await export_job_workers.stop()
+    await access_tracker.stop()
+    await browser_pool.stop()
+    await render_process_pool.stop()
     await MongoDB.close_database_connection()
     logger.info("✅ Database connection closed")
 
@@ -103,6 +145,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],  # List pagination cursor, conditional GETs
 )
 
 
@@ -122,6 +165,25 @@ async def add_process_time_header(request: Request, call_next):
     return response
 
 
+# Render backpressure handler
+@app.exception_handler(RenderQueueFullError)
+async def render_queue_full_handler(request: Request, exc: RenderQueueFullError):
+    """
+    Reject renders when the PDF render queue is full.
+
+    Returns 429 with Retry-After so clients back off instead of piling
+    more Chromium work onto a saturated server.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(exc.retry_after)},
+        content={
+            "detail": f"PDF renderer is busy ({exc.reason}), retry in {exc.retry_after}s",
+            "error_code": "RENDER_QUEUE_FULL"
+        }
+    )
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -144,6 +206,7 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(brand_kits_router, prefix="/api/v1")
 app.include_router(onepagers_router, prefix="/api/v1")
+app.include_router(export_jobs_router, prefix="/api/v1")
 app.include_router(export_router)  # Export routes already include /api/export prefix
 
 
@@ -170,6 +233,18 @@ async def health_check():
         "service": "Marketing One-Pager API",
         "version": "0.1.0",
         "database": db_status,
+        "pdf_browser_pool": browser_pool.stats(),
+        "pdf_render_processes": render_process_pool.stats(),
+        "pdf_readiness": readiness_stats,
+        "font_store": font_store.stats(),
+        "pdf_cache": pdf_cache.stats(),
+        "html_cache": html_render_cache.stats(),
+        "html_fragment_cache": fragment_cache.stats(),
+        "css_bundles": css_bundles.stats(),
+        "render_models": render_model_cache.stats(),
+        "pdf_render_queue": render_scheduler.stats(),
+        "export_jobs": export_job_workers.stats(),
+        "last_accessed_buffer": access_tracker.stats(),
         "environment": settings.api_env
     }
 
@@ -206,7 +281,13 @@ async def root():
             "get": "/api/v1/onepagers/{id}",
             "iterate": "/api/v1/onepagers/{id}/iterate",
             "delete": "/api/v1/onepagers/{id}",
-            "export_pdf": "/api/v1/onepagers/{id}/export/pdf?format=letter|a4|tabloid"
+            "export_pdf": "/api/v1/onepagers/{id}/export/pdf?format=letter|a4|tabloid",
+            "export_batch": "/api/v1/onepagers/export/batch"
+        },
+        "export_jobs": {
+            "create": "/api/v1/export-jobs",
+            "status": "/api/v1/export-jobs/{id}",
+            "download": "/api/v1/export-jobs/{id}/download"
         },
         "features": {
             "pdf_export": "✅ In-house PDF generation with Brand Kit styling",
@@ -0,0 +1,53 @@
+"""
+Export Job Model
+================
+
+MongoDB document helpers for background PDF export jobs.
+Jobs live in the export_jobs collection and are drained by the worker
+pool in backend/services/export_jobs.py.
+"""
+
+from enum import Enum
+from typing import Any, Dict
+
+
+class ExportJobStatus(str, Enum):
+    """Export job lifecycle states."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+# Fields that are never returned by status endpoints (large payloads)
+EXPORT_JOB_HEAVY_FIELDS = {"html": 0, "result_pdf": 0}
+
+
+def export_job_helper(job_doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Transform MongoDB export job document to API response format.
+
+    Args:
+        job_doc: Raw MongoDB document
+
+    Returns:
+        Dictionary ready for ExportJobResponse model
+    """
+    job_id = str(job_doc["_id"])
+    completed = job_doc["status"] == ExportJobStatus.COMPLETED.value
+    return {
+        "id": job_id,
+        "onepager_id": str(job_doc["onepager_id"]),
+        "status": job_doc["status"],
+        "progress": job_doc.get("progress", 0),
+        "stage": job_doc.get("stage"),
+        "format": job_doc["format"],
+        "template": job_doc["template"],
+        "attempts": job_doc.get("attempts", 0),
+        "error": job_doc.get("error"),
+        "size_bytes": job_doc.get("size_bytes"),
+        "download_url": f"/api/v1/export-jobs/{job_id}/download" if completed else None,
+        "created_at": job_doc["created_at"],
+        "updated_at": job_doc["updated_at"],
+        "finished_at": job_doc.get("finished_at")
+    }
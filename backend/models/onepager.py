@@ -165,6 +165,32 @@ class OnePagerLayout(BaseModel):
 
 # Helper Functions for API Responses
 
+# Documents written before version_count existed number versions by their
+# embedded history length
+VERSION_COUNT_EXPR = {"$ifNull": ["$version_count", {"$size": {"$ifNull": ["$version_history", []]}}]}
+
+# Fields read by onepager_helper, without the (possibly large) legacy
+# version_history. Unmigrated documents have no version_count yet, so the
+# server counts their embedded history instead of shipping it.
+ONEPAGER_DETAIL_PROJECTION = {
+    "user_id": 1,
+    "brand_kit_id": 1,
+    "title": 1,
+    "status": 1,
+    "content": 1,
+    "layout": 1,
+    "style_overrides": 1,
+    "generation_metadata": 1,
+    "version_count": VERSION_COUNT_EXPR,
+    "layout_params": 1,
+    "design_rationale": 1,
+    "pdf_template": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "last_accessed": 1
+}
+
+
 def onepager_helper(onepager_doc: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform MongoDB onepager document to API response format.
@@ -185,7 +211,7 @@ def onepager_helper(onepager_doc: Dict[str, Any]) -> Dict[str, Any]:
         "layout": onepager_doc.get("layout", []),
         "style_overrides": onepager_doc.get("style_overrides", {}),
         "generation_metadata": onepager_doc.get("generation_metadata", {}),
-        "version_history": onepager_doc.get("version_history", []),
+        "version_count": onepager_doc.get("version_count", len(onepager_doc.get("version_history") or [])),
         "layout_params": onepager_doc.get("layout_params"),
         "design_rationale": onepager_doc.get("design_rationale"),
         "pdf_template": onepager_doc.get("pdf_template", "minimalist"),  # Default to minimalist if not set
@@ -195,6 +221,16 @@ def onepager_helper(onepager_doc: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Fields read by onepager_summary_helper (list views fetch nothing else)
+ONEPAGER_SUMMARY_PROJECTION = {
+    "title": 1,
+    "status": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "brand_kit_id": 1
+}
+
+
 def onepager_summary_helper(onepager_doc: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform MongoDB onepager document to summary format for list views.
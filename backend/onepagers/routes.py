@@ -10,11 +10,12 @@ API endpoints for one-pager creation and iteration:
 - DELETE /onepagers/{id} - Delete one-pager
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Header
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from datetime import datetime, timezone
 from bson import ObjectId
 from typing import List, Optional, Dict, Any
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,19 +28,128 @@ from backend.onepagers.schemas import (
     OnePagerSummary,
     OnePagerStatus,
     OnePagerContent,
-    ContentSection
+    ContentSection,
+    OnePagerBatchExport,
+    PDFPageFormat,
+    VersionSnapshot,
+    VersionListResponse
+)
+from backend.models.onepager import (
+    onepager_helper, onepager_summary_helper, ONEPAGER_DETAIL_PROJECTION, ONEPAGER_SUMMARY_PROJECTION
 )
-from backend.models.onepager import onepager_helper, onepager_summary_helper
 from backend.models.user import UserInDB
 from backend.auth.dependencies import get_current_active_user
 from backend.database.mongodb import get_db
 from backend.auth.schemas import ErrorResponse
+from backend.services.access_tracker import access_tracker
 from backend.services.ai_service import ai_service
+from backend.services.etags import CACHE_CONTROL, etag_matches, make_etag, not_modified
+from backend.services.fast_json import ORJSONResponse, model_response
+from backend.services.html_cache import make_html_cache_key
+from backend.services.onepager_render import (
+    get_brand_kit_doc, render_onepager_html, stream_onepager_html, compile_brand_stylesheets
+)
+from backend.services.onepager_versions import (
+    delete_versions, get_version, list_versions, migrate_embedded_history, store_pending_version
+)
+from backend.services.onepager_writes import (
+    OnePagerAccessError, OnePagerWriteConflictError, update_onepager_fields
+)
+from backend.services.pagination import KEYSET_SORT, decode_cursor, encode_cursor, keyset_filter
+from backend.services.render_model import with_render_snapshot
+from backend.services.render_scheduler import render_scheduler, RenderQueueFullError
 from backend.config import settings
 
 router = APIRouter(prefix="/onepagers", tags=["One-Pagers"])
 
 
+async def _apply_onepager_update(
+    db: AsyncIOMotorDatabase,
+    onepager: Dict[str, Any],
+    current_user: UserInDB,
+    update_doc: Dict[str, Any],
+    computed: Optional[Dict[str, Any]] = None,
+    change_description: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Apply an edit (and optional version snapshot) in one round trip.
+
+    Returns:
+        Updated one-pager document
+
+    Raises:
+        HTTPException: 404 if the one-pager disappeared, 403 if it isn't owned,
+            409 if it changed since it was read (the edit was computed from stale data)
+    """
+    try:
+        updated_onepager = await update_onepager_fields(
+            db,
+            onepager,
+            ObjectId(current_user.id),
+            update_doc,
+            computed=computed,
+            change_description=change_description
+        )
+    except OnePagerAccessError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to update this one-pager"
+        )
+    except OnePagerWriteConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="One-pager was modified by another request, reload and retry"
+        )
+
+    if not updated_onepager:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="One-pager not found"
+        )
+    return updated_onepager
+
+
+async def _get_versioned_onepager(
+    db: AsyncIOMotorDatabase,
+    onepager_id: str,
+    current_user: UserInDB,
+    action: str
+) -> Dict[str, Any]:
+    """
+    Fetch an owned one-pager for a version endpoint.
+
+    Moves a legacy embedded version_history into onepager_versions first.
+
+    Raises:
+        HTTPException: 400 invalid ID, 404 not found, 403 not owned
+    """
+    if not ObjectId.is_valid(onepager_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid one-pager ID format"
+        )
+
+    onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
+    if not onepager:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="One-pager not found"
+        )
+
+    if str(onepager["user_id"]) != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to {action} this one-pager"
+        )
+
+    if "version_history" in onepager:
+        await migrate_embedded_history(db, onepager)
+    # A previous edit died before writing its version
+    if await store_pending_version(db, onepager):
+        del onepager["pending_version"]
+    return onepager
+
+
 @router.post(
     "",
     response_model=OnePagerResponse,
@@ -258,12 +368,13 @@ async def create_onepager(
             "last_generated_at": now,
             "product_id": onepager_data.product_id
         },
-        "version_history": [],
+        "version_count": 0,  # Versions are stored in onepager_versions
         "pdf_template": "minimalist",  # Default PDF template
         "created_at": now,
         "updated_at": now,
         "last_accessed": now
     }
+    onepager_doc = with_render_snapshot({}, onepager_doc)
 
     # Insert into database
     result = await db.onepagers.insert_one(onepager_doc)
@@ -277,11 +388,24 @@ async def create_onepager(
     "",
     response_model=List[OnePagerSummary],
     responses={
+        200: {
+            "description": "One-pager summaries, newest first",
+            "headers": {
+                "X-Next-Cursor": {
+                    "description": "Opaque cursor for the next page, pass it back as ?cursor=. Absent on the last page.",
+                    "schema": {"type": "string"}
+                }
+            }
+        },
         400: {"model": ErrorResponse, "description": "Invalid query parameters"}
     }
 )
 async def list_onepagers(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    skip: int = Query(
+        0, ge=0, le=settings.onepager_list_max_skip, deprecated=True,
+        description="Deprecated offset, capped at onepager_list_max_skip; page with cursor instead"
+    ),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
     status: Optional[OnePagerStatus] = Query(None, description="Filter by status"),
     current_user: UserInDB = Depends(get_current_active_user),
@@ -290,10 +414,14 @@ async def list_onepagers(
     """
     List user's one-pagers with pagination and filtering.
 
-    Returns a paginated list of one-pager summaries (without full content).
+    Returns a page of one-pager summaries (without full content), newest
+    first. When more one-pagers follow, the X-Next-Cursor response header
+    holds an opaque cursor; pass it back as ?cursor= to fetch the next page
+    in constant time regardless of how deep it is.
 
     **Query Parameters:**
-    - skip: Number of records to skip (default: 0)
+    - cursor: Cursor from the previous page's X-Next-Cursor header
+    - skip: Deprecated offset (default: 0, max: onepager_list_max_skip; ignored with cursor)
     - limit: Maximum records to return (default: 20, max: 100)
     - status: Filter by status (draft, wireframe, styled, final)
 
@@ -301,7 +429,7 @@ async def list_onepagers(
     - List of one-pager summaries
 
     **Errors:**
-    - 400: Invalid query parameters
+    - 400: Invalid query parameters or cursor
     """
     # Build query
     query = {"user_id": ObjectId(current_user.id)}
@@ -309,15 +437,27 @@ async def list_onepagers(
     if status:
         query["status"] = status.value
 
-    # Fetch one-pagers with pagination
-    cursor = db.onepagers.find(query).sort("created_at", -1).skip(skip).limit(limit)
+    if cursor:
+        try:
+            query.update(keyset_filter(*decode_cursor(cursor)))
+        except ValueError:
+            # The status query parameter shadows fastapi.status here
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        skip = 0
+
+    # Fetch one more than requested to know whether another page follows
+    db_cursor = db.onepagers.find(query, ONEPAGER_SUMMARY_PROJECTION).sort(KEYSET_SORT).skip(skip).limit(limit + 1)
 
-    onepagers = await cursor.to_list(length=limit)
+    onepagers = await db_cursor.to_list(length=limit + 1)
+    headers = {}
+    if len(onepagers) > limit:
+        onepagers = onepagers[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(onepagers[-1])
 
-    # Convert to summaries
-    summaries = [OnePagerSummary(**onepager_summary_helper(op)) for op in onepagers]
+    # Summaries are flat and already in response shape: serialize them directly
+    summaries = [onepager_summary_helper(op) for op in onepagers]
 
-    return summaries
+    return ORJSONResponse(summaries, headers=headers)
 
 
 @router.get(
@@ -330,6 +470,7 @@ async def list_onepagers(
 )
 async def get_onepager(
     onepager_id: str,
+    if_none_match: Optional[str] = Header(None),
     current_user: UserInDB = Depends(get_current_active_user),
     db: AsyncIOMotorDatabase = Depends(get_db)
 ):
@@ -339,6 +480,10 @@ async def get_onepager(
     Returns full one-pager document with all content, layout, and metadata.
     Requires ownership verification.
 
+    The response carries a weak `ETag` derived from `updated_at`; send it
+    back in `If-None-Match` to get `304 Not Modified` when nothing was
+    edited (`last_accessed` may have advanced in the meantime).
+
     **Path Parameters:**
     - onepager_id: MongoDB ObjectId of the one-pager
 
@@ -356,8 +501,8 @@ async def get_onepager(
             detail="Invalid one-pager ID format"
         )
 
-    # Find one-pager
-    onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
+    # Find one-pager (version history is served by GET /{onepager_id}/versions)
+    onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)}, ONEPAGER_DETAIL_PROJECTION)
 
     if not onepager:
         raise HTTPException(
@@ -372,13 +517,21 @@ async def get_onepager(
             detail="Not authorized to access this one-pager"
         )
 
-    # Update last_accessed timestamp
-    await db.onepagers.update_one(
-        {"_id": ObjectId(onepager_id)},
-        {"$set": {"last_accessed": datetime.now(timezone.utc)}}
+    # Update last_accessed timestamp (written in batches by the access tracker)
+    access_tracker.record(onepager["_id"])
+
+    # Every edit bumps updated_at; version_count covers lazily migrated history.
+    # Weak: last_accessed is in the body but advances without an edit
+    etag = make_etag(
+        "onepager", onepager["_id"], onepager.get("updated_at"), onepager.get("version_count"), weak=True
     )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
 
-    return OnePagerResponse(**onepager_helper(onepager))
+    return model_response(
+        OnePagerResponse, onepager_helper(onepager),
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
 
 
 @router.patch(
@@ -463,14 +616,8 @@ async def update_onepager(
             )
         update_doc["pdf_template"] = pdf_template
 
-    # Update in database
-    await db.onepagers.update_one(
-        {"_id": ObjectId(onepager_id)},
-        {"$set": update_doc}
-    )
-
-    # Fetch updated document
-    updated_onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
+    # Update in database (also refreshes the render snapshot)
+    updated_onepager = await _apply_onepager_update(db, onepager, current_user, update_doc)
 
     return OnePagerResponse(**onepager_helper(updated_onepager))
 
@@ -551,14 +698,8 @@ async def update_onepager_content(
     if content_update.subheadline is not None:
         update_doc["content.subheadline"] = content_update.subheadline
 
-    # Update in database
-    await db.onepagers.update_one(
-        {"_id": ObjectId(onepager_id)},
-        {"$set": update_doc}
-    )
-
-    # Fetch updated document
-    updated_onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
+    # Update in database (also refreshes the render snapshot)
+    updated_onepager = await _apply_onepager_update(db, onepager, current_user, update_doc)
 
     return OnePagerResponse(**onepager_helper(updated_onepager))
 
@@ -628,6 +769,7 @@ async def iterate_onepager(
     # Build update document
     now = datetime.now(timezone.utc)
     update_doc = {"updated_at": now}
+    computed = {}
 
     # Handle AI-guided refinement via feedback
     if iteration_data.feedback:
@@ -713,42 +855,30 @@ async def iterate_onepager(
                 logger.info(f"🔍 AI returned {len(refined_data['sections'])} sections")
                 update_doc["content.sections"] = refined_data["sections"]
 
-        # Update generation metadata
-        update_doc["generation_metadata.prompts"] = onepager["generation_metadata"]["prompts"] + [iteration_data.feedback]
-        update_doc["generation_metadata.iterations"] = onepager["generation_metadata"].get("iterations", 0) + 1
+        # Update generation metadata (appended server-side, so concurrent iterations don't drop prompts)
+        computed["generation_metadata.prompts"] = {"$concatArrays": [
+            {"$ifNull": ["$generation_metadata.prompts", []]},
+            [{"$literal": iteration_data.feedback}]
+        ]}
+        computed["generation_metadata.iterations"] = {
+            "$add": [{"$ifNull": ["$generation_metadata.iterations", 0]}, 1]
+        }
         update_doc["generation_metadata.last_generated_at"] = now
 
     # Note: layout_changes, style_overrides, and apply_brand_styles
     # are not currently part of OnePagerIterate schema, so we skip them
 
-    # Update in database first
-    await db.onepagers.update_one(
-        {"_id": ObjectId(onepager_id)},
-        {"$set": update_doc}
-    )
-
-    # Fetch updated document
-    updated_onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
-
-    # Create version snapshot with UPDATED content and layout_params
-    version_snapshot = {
-        "version": len(onepager.get("version_history", [])) + 1,
-        "content": updated_onepager["content"],  # Use updated content
-        "layout": updated_onepager.get("layout", []),
-        "layout_params": updated_onepager.get("layout_params"),  # Include layout parameters
-        "created_at": now,
-        "change_description": iteration_data.feedback[:200] if iteration_data.feedback else "Manual update"
-    }
-
-    # Add version to history
-    await db.onepagers.update_one(
-        {"_id": ObjectId(onepager_id)},
-        {"$push": {"version_history": version_snapshot}}
+    # Update in database and record a version snapshot of the UPDATED content
+    # and layout_params, numbered atomically
+    final_onepager = await _apply_onepager_update(
+        db,
+        onepager,
+        current_user,
+        update_doc,
+        computed=computed,
+        change_description=iteration_data.feedback[:200] if iteration_data.feedback else "Manual update"
     )
 
-    # Fetch final document with version history
-    final_onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
-
     return OnePagerResponse(**onepager_helper(final_onepager))
 
 
@@ -853,6 +983,7 @@ async def suggest_layout_params(
 async def update_layout_params(
     onepager_id: str,
     layout_params: Dict[str, Any],
+    background_tasks: BackgroundTasks,
     current_user: UserInDB = Depends(get_current_active_user),
     db: AsyncIOMotorDatabase = Depends(get_db)
 ):
@@ -884,23 +1015,25 @@ async def update_layout_params(
     if not validated_params:
         raise HTTPException(status_code=400, detail="Invalid layout parameters")
 
-    # Update onepager
-    now = datetime.now(timezone.utc).isoformat()
+    # Update in database (also refreshes the render snapshot)
     update_doc = {
-        "$set": {
-            "layout_params": validated_params.dict(),
-            "updated_at": now
-        }
+        "layout_params": validated_params.dict(),
+        "updated_at": datetime.now(timezone.utc)
     }
-
-    await db.onepagers.update_one({"_id": onepager_oid}, update_doc)
-
-    # Fetch updated onepager
-    updated_onepager = await db.onepagers.find_one({"_id": onepager_oid})
+    updated_onepager = await _apply_onepager_update(db, onepager, current_user, update_doc)
 
     logger.info(f"✅ Layout params updated directly for onepager {onepager_id}")
 
-    return onepager_helper(updated_onepager)
+    # Compile the stylesheet for the new layout before the next preview
+    brand_kit_doc = await get_brand_kit_doc(db, updated_onepager)
+    background_tasks.add_task(
+        compile_brand_stylesheets,
+        brand_kit_doc,
+        template_names=[updated_onepager.get("pdf_template") or "minimalist"],
+        layout_params=updated_onepager.get("layout_params")
+    )
+
+    return OnePagerResponse(**onepager_helper(updated_onepager))
 
 
 @router.post(
@@ -934,32 +1067,10 @@ async def restore_onepager_version(
     - 404: One-pager or version not found
     - 403: User doesn't own this one-pager
     """
-    # Validate ObjectId format
-    if not ObjectId.is_valid(onepager_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid one-pager ID format"
-        )
-
-    # Find one-pager
-    onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
-
-    if not onepager:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="One-pager not found"
-        )
-
-    # Verify ownership
-    if str(onepager["user_id"]) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to restore this one-pager"
-        )
+    onepager = await _get_versioned_onepager(db, onepager_id, current_user, "restore")
 
     # Find the version snapshot
-    version_history = onepager.get("version_history", [])
-    version_snapshot = next((v for v in version_history if v["version"] == version), None)
+    version_snapshot = await get_version(db, onepager["_id"], version)
 
     if not version_snapshot:
         raise HTTPException(
@@ -976,38 +1087,94 @@ async def restore_onepager_version(
     }
 
     # Restore layout_params if present in snapshot
-    if "layout_params" in version_snapshot:
+    if version_snapshot.get("layout_params") is not None:
         update_doc["layout_params"] = version_snapshot["layout_params"]
 
-    # Update in database
-    await db.onepagers.update_one(
-        {"_id": ObjectId(onepager_id)},
-        {"$set": update_doc}
+    # Update in database and record a new version snapshot for the restore action
+    final_onepager = await _apply_onepager_update(
+        db,
+        onepager,
+        current_user,
+        update_doc,
+        change_description=f"Restored to version {version}"
     )
 
-    # Fetch updated document
-    updated_onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
+    return OnePagerResponse(**onepager_helper(final_onepager))
 
-    # Create new version snapshot for the restore action
-    restore_snapshot = {
-        "version": len(version_history) + 1,
-        "content": version_snapshot["content"],
-        "layout": version_snapshot["layout"],
-        "layout_params": version_snapshot.get("layout_params"),  # Include layout params in snapshot
-        "created_at": now,
-        "change_description": f"Restored to version {version}"
+
+@router.get(
+    "/{onepager_id}/versions",
+    response_model=VersionListResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "One-pager not found"},
+        403: {"model": ErrorResponse, "description": "Not authorized to access this one-pager"}
     }
+)
+async def list_onepager_versions(
+    onepager_id: str,
+    skip: int = Query(0, ge=0, description="Number of versions to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of versions to return"),
+    current_user: UserInDB = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    """
+    List a one-pager's saved versions, newest first.
 
-    # Add restore snapshot to history
-    await db.onepagers.update_one(
-        {"_id": ObjectId(onepager_id)},
-        {"$push": {"version_history": restore_snapshot}}
-    )
+    **Path Parameters:**
+    - onepager_id: MongoDB ObjectId of the one-pager
 
-    # Fetch final document with updated history
-    final_onepager = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
+    **Query Parameters:**
+    - skip: Number of versions to skip (default: 0)
+    - limit: Maximum versions to return (default: 20, max: 100)
 
-    return OnePagerResponse(**onepager_helper(final_onepager))
+    **Returns:**
+    - Page of version snapshots and the total number of versions
+
+    **Errors:**
+    - 404: One-pager not found
+    - 403: User doesn't own this one-pager
+    """
+    onepager = await _get_versioned_onepager(db, onepager_id, current_user, "access")
+    items, total = await list_versions(db, onepager["_id"], skip=skip, limit=limit)
+    return model_response(VersionListResponse, {"items": items, "total": total, "skip": skip, "limit": limit})
+
+
+@router.get(
+    "/{onepager_id}/versions/{version}",
+    response_model=VersionSnapshot,
+    responses={
+        404: {"model": ErrorResponse, "description": "One-pager or version not found"},
+        403: {"model": ErrorResponse, "description": "Not authorized to access this one-pager"}
+    }
+)
+async def get_onepager_version(
+    onepager_id: str,
+    version: int,
+    current_user: UserInDB = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    """
+    Get one saved version of a one-pager.
+
+    **Path Parameters:**
+    - onepager_id: MongoDB ObjectId of the one-pager
+    - version: Version number
+
+    **Returns:**
+    - Version snapshot (content, layout, layout_params)
+
+    **Errors:**
+    - 404: One-pager or version not found
+    - 403: User doesn't own this one-pager
+    """
+    onepager = await _get_versioned_onepager(db, onepager_id, current_user, "access")
+    version_snapshot = await get_version(db, onepager["_id"], version)
+    if not version_snapshot:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Version {version} not found in version history"
+        )
+    return model_response(VersionSnapshot, version_snapshot)
 
 
 @router.delete(
@@ -1061,12 +1228,34 @@ async def delete_onepager(
             detail="Not authorized to delete this one-pager"
         )
 
-    # Hard delete
+    # Hard delete (including saved versions)
     await db.onepagers.delete_one({"_id": ObjectId(onepager_id)})
+    await delete_versions(db, onepager["_id"])
 
     return None  # 204 No Content
 
 
+# Preview-specific CSS overrides to remove height constraints
+PREVIEW_OVERRIDE_CSS = """
+        <style>
+            /* Preview Mode Overrides - Remove fixed heights for scrollable preview */
+            body {
+                height: auto !important;
+                min-height: 11in !important;
+                overflow: visible !important;
+            }
+            .page-container {
+                height: auto !important;
+                min-height: 11in !important;
+                overflow: visible !important;
+            }
+        </style>
+        """
+
+# Part of the preview ETag, so deploys that change the overrides invalidate it
+PREVIEW_CSS_HASH = hashlib.sha256(PREVIEW_OVERRIDE_CSS.encode()).hexdigest()[:16]
+
+
 @router.get(
     "/{onepager_id}/preview/html",
     tags=["One-Pagers", "Preview"],
@@ -1087,6 +1276,11 @@ async def preview_onepager_html(
         enum=["minimalist", "bold", "business", "product"],
         description="Template style to preview"
     ),
+    stream: bool = Query(
+        False,
+        description="Send the HTML as a chunked stream, <head> first"
+    ),
+    if_none_match: Optional[str] = Header(None),
     current_user: UserInDB = Depends(get_current_active_user),
     db: AsyncIOMotorDatabase = Depends(get_db)
 ):
@@ -1098,19 +1292,20 @@ async def preview_onepager_html(
 
     **Query Parameters:**
     - template: Template style (minimalist, bold, business, product) - default: minimalist
+    - stream: Stream the HTML in chunks so the iframe can load fonts and CSS
+      while the body is still rendering - default: false
 
     **Returns:**
     - HTML string with Brand Kit styling applied
+    - Strong `ETag` built from the HTML cache key; send it back in
+      `If-None-Match` to get `304 Not Modified` without re-rendering
 
     **Use Case:**
     - Display in iframe for WYSIWYG PDF preview
     - Show actual PDF appearance in Styled mode
     """
-    from fastapi.responses import HTMLResponse
+    from fastapi.responses import HTMLResponse, StreamingResponse
     import logging
-    from backend.services.pdf_html_generator import PDFHTMLGenerator
-    from backend.models.onepager import OnePagerLayout
-    from backend.models.brand_kit import BrandKitInDB
 
     logger = logging.getLogger(__name__)
 
@@ -1138,135 +1333,42 @@ async def preview_onepager_html(
             detail="Not authorized to preview this one-pager"
         )
 
-    # Fetch Brand Kit if associated
-    brand_kit_doc = None
-    if onepager_doc.get("brand_kit_id"):
-        brand_kit_doc = await db.brand_kits.find_one({
-            "_id": onepager_doc["brand_kit_id"]
-        })
-
-        if not brand_kit_doc:
-            logger.warning(f"Brand Kit {onepager_doc['brand_kit_id']} not found, using defaults")
-
-    # Use default brand kit if not found
-    if not brand_kit_doc:
-        brand_kit_doc = {
-            "_id": ObjectId(),
-            "user_id": onepager_doc["user_id"],
-            "company_name": onepager_doc.get("title", "Company"),
-            "brand_voice": "Professional and engaging",
-            "color_palette": {
-                "primary": "#0ea5e9",
-                "secondary": "#64748b",
-                "accent": "#10b981",
-                "text": "#1f2937",
-                "background": "#ffffff"
-            },
-            "typography": {
-                "heading_font": "Montserrat",
-                "body_font": "Inter",
-                "heading_size": "32px",
-                "body_size": "16px"
-            },
-            "is_active": True,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        }
+    # Fetch Brand Kit if associated (defaults when missing)
+    brand_kit_doc = await get_brand_kit_doc(db, onepager_doc)
 
     try:
-        # Convert documents to Pydantic models (same logic as PDF export)
-        onepager_layout_data = {
-            "title": onepager_doc.get("title", "Untitled"),
-            "elements": [],
-            "version": 1,
-            "dimensions": {"width": 1080, "height": 1920, "unit": "px"}
-        }
-
-        # Map content sections to elements
-        has_hero_section = False
-        if "content" in onepager_doc and "sections" in onepager_doc["content"]:
-            for idx, section in enumerate(onepager_doc["content"]["sections"]):
-                section_type = section.get("type", "text_block")
-                section_content = section.get("content", {})
-
-                # Handle hero type: convert string content to proper dict format
-                if section_type == "hero" and isinstance(section_content, str):
-                    section_content = {
-                        "headline": onepager_doc["content"].get("headline", section.get("title", "")),
-                        "subheadline": onepager_doc["content"].get("subheadline", ""),
-                        "description": section_content
-                    }
-                    has_hero_section = True
-
-                element = {
-                    "id": section.get("id", f"section-{idx}"),
-                    "type": section_type,
-                    "title": section.get("title"),
-                    "content": section_content,
-                    "styling": section.get("styling"),
-                    "order": section.get("order", idx)
-                }
-                onepager_layout_data["elements"].append(element)
-
-                if section_type == "hero":
-                    has_hero_section = True
-
-        # Add headline as hero element if exists and no hero section already present
-        if not has_hero_section and "content" in onepager_doc and "headline" in onepager_doc["content"]:
-            hero_element = {
-                "id": "hero-main",
-                "type": "hero",
-                "content": {
-                    "headline": onepager_doc["content"]["headline"],
-                    "subheadline": onepager_doc["content"].get("subheadline"),
-                    "description": onepager_doc["content"].get("description", "")
-                },
-                "order": 0
-            }
-            onepager_layout_data["elements"].insert(0, hero_element)
-
-        # Normalize order values
-        for idx, element in enumerate(onepager_layout_data["elements"]):
-            element["order"] = idx
-
-        onepager = OnePagerLayout(**onepager_layout_data)
-        brand_kit = BrandKitInDB(**brand_kit_doc)
-
-        # Extract layout_params from database (if exists)
-        layout_params = onepager_doc.get("layout_params", {})
-
         # Use pdf_template from database, fall back to query parameter
         selected_template = onepager_doc.get("pdf_template") or template or "minimalist"
 
-        # Generate HTML with Brand Kit styling
-        logger.info(f"Generating HTML preview with template: {selected_template}")
-        html_generator = PDFHTMLGenerator()
-        html = html_generator.generate_html(onepager, brand_kit, template_name=selected_template, layout_params=layout_params)
+        # The HTML cache key covers everything the rendered HTML depends on
+        headers = {}
+        html_key = make_html_cache_key(onepager_doc, brand_kit_doc, selected_template)
+        if html_key is not None:
+            etag = make_etag("preview", html_key, PREVIEW_CSS_HASH)
+            if etag_matches(if_none_match, etag):
+                logger.info(f"HTML preview unchanged for onepager {onepager_id}, returning 304")
+                return not_modified(etag)
+            headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+        if stream:
+            # Preview CSS is written into the stream right before </head>
+            logger.info(f"Streaming HTML preview with template: {selected_template}")
+            chunks = stream_onepager_html(
+                onepager_doc, brand_kit_doc, selected_template, head_extra=PREVIEW_OVERRIDE_CSS
+            )
+            return StreamingResponse(chunks, media_type="text/html; charset=utf-8", headers=headers)
 
-        # Add preview-specific CSS overrides to remove height constraints
-        preview_css = """
-        <style>
-            /* Preview Mode Overrides - Remove fixed heights for scrollable preview */
-            body {
-                height: auto !important;
-                min-height: 11in !important;
-                overflow: visible !important;
-            }
-            .page-container {
-                height: auto !important;
-                min-height: 11in !important;
-                overflow: visible !important;
-            }
-        </style>
-        """
+        # Generate HTML with Brand Kit styling (same logic as PDF export)
+        logger.info(f"Generating HTML preview with template: {selected_template}")
+        html = render_onepager_html(onepager_doc, brand_kit_doc, selected_template)
 
         # Inject preview CSS before closing </head> tag
-        html = html.replace('</head>', preview_css + '</head>')
+        html = html.replace('</head>', PREVIEW_OVERRIDE_CSS + '</head>')
 
         logger.info(f"✅ HTML preview generated successfully ({len(html)} characters)")
 
         # Return HTML for iframe display
-        return HTMLResponse(content=html, status_code=200)
+        return HTMLResponse(content=html, status_code=200, headers=headers)
 
     except Exception as e:
         logger.error(f"HTML preview generation failed: {e}", exc_info=True)
@@ -1286,7 +1388,8 @@ async def preview_onepager_html(
             "description": "PDF file download with Brand Kit styling applied"
         },
         404: {"model": ErrorResponse, "description": "One-pager or Brand Kit not found"},
-        403: {"model": ErrorResponse, "description": "User doesn't own this one-pager"}
+        403: {"model": ErrorResponse, "description": "User doesn't own this one-pager"},
+        429: {"model": ErrorResponse, "description": "PDF renderer is saturated, retry later"}
     }
 )
 async def export_onepager_pdf(
@@ -1301,6 +1404,11 @@ async def export_onepager_pdf(
         enum=["minimalist", "bold", "business", "product"],
         description="Template style: minimalist (clean 2-column), bold (diagonal/asymmetric), business (data-focused grid), product (visual showcase)"
     ),
+    formats: Optional[List[PDFPageFormat]] = Query(
+        None,
+        description="Export several page formats at once (repeat the parameter); returns a ZIP rendered from a single page load"
+    ),
+    if_none_match: Optional[str] = Header(None),
     current_user: UserInDB = Depends(get_current_active_user),
     db: AsyncIOMotorDatabase = Depends(get_db)
 ):
@@ -1311,11 +1419,18 @@ async def export_onepager_pdf(
     1. Fetches onepager and validates ownership
     2. Retrieves associated Brand Kit
     3. Generates styled HTML with brand colors/fonts
-    4. Converts to PDF using Puppeteer
+    4. Converts to PDF using Playwright (or serves it from the PDF cache)
     5. Returns as downloadable file
 
+    PDFs are cached by a hash of the final HTML, format and print options.
+    The hash is returned as a strong `ETag`; send it back in `If-None-Match`
+    to get `304 Not Modified` when nothing changed.
+
     **Query Parameters:**
     - format: Page format (letter, a4, tabloid) - default: letter
+    - formats: Optional list of formats (e.g. `formats=letter&formats=a4`);
+      with more than one, a ZIP with one PDF per format is returned. All
+      formats are printed from one page load, so extras are cheap.
 
     **Returns:**
     - PDF file with Brand Kit styling applied
@@ -1326,6 +1441,7 @@ async def export_onepager_pdf(
     - 400: Invalid one-pager ID format
     - 403: User doesn't own this one-pager
     - 404: One-pager or Brand Kit not found
+    - 429: PDF renderer is saturated (see Retry-After header)
     - 500: PDF generation failed
 
     **Example:**
@@ -1334,13 +1450,12 @@ async def export_onepager_pdf(
     Authorization: Bearer <token>
     ```
     """
-    from fastapi.responses import StreamingResponse
+    from fastapi.responses import StreamingResponse, Response
     import io
     import logging
-    from backend.services.pdf_html_generator import PDFHTMLGenerator
     from backend.services.pdf_generator import PDFGenerator
-    from backend.models.onepager import OnePagerLayout
-    from backend.models.brand_kit import BrandKitInDB
+    from backend.services.pdf_cache import pdf_cache, make_pdf_cache_key, combine_pdf_cache_keys
+    from backend.services.batch_export import stream_zip
 
     logger = logging.getLogger(__name__)
     
@@ -1368,143 +1483,410 @@ async def export_onepager_pdf(
             detail="Not authorized to export this one-pager"
         )
 
-    # Fetch Brand Kit if associated
-    brand_kit_doc = None
-    if onepager_doc.get("brand_kit_id"):
-        brand_kit_doc = await db.brand_kits.find_one({
-            "_id": onepager_doc["brand_kit_id"]
-        })
-
-        if not brand_kit_doc:
-            logger.warning(f"Brand Kit {onepager_doc['brand_kit_id']} not found, using defaults")
-
-    # Use default brand kit if not found
-    if not brand_kit_doc:
-        brand_kit_doc = {
-            "_id": ObjectId(),  # Temporary ID for default brand kit
-            "user_id": onepager_doc["user_id"],  # Use the onepager's user_id
-            "company_name": onepager_doc.get("title", "Company"),
-            "brand_voice": "Professional and engaging",
-            "color_palette": {
-                "primary": "#0ea5e9",
-                "secondary": "#64748b",
-                "accent": "#10b981",
-                "text": "#1f2937",
-                "background": "#ffffff"
-            },
-            "typography": {
-                "heading_font": "Montserrat",
-                "body_font": "Inter",
-                "heading_size": "32px",
-                "body_size": "16px"
-            },
-            "is_active": True,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
-        }
+    # Fetch Brand Kit if associated (defaults when missing)
+    brand_kit_doc = await get_brand_kit_doc(db, onepager_doc)
 
     try:
-        # Convert documents to Pydantic models
-        # Map database structure to OnePagerLayout
-        onepager_layout_data = {
-            "title": onepager_doc.get("title", "Untitled"),
-            "elements": [],
-            "version": 1,
-            "dimensions": {"width": 1080, "height": 1920, "unit": "px"}
-        }
-
-        # Map content sections to elements
-        has_hero_section = False
-        if "content" in onepager_doc and "sections" in onepager_doc["content"]:
-            for idx, section in enumerate(onepager_doc["content"]["sections"]):
-                section_type = section.get("type", "text_block")
-                section_content = section.get("content", {})
-
-                # Handle hero type: convert string content to proper dict format
-                if section_type == "hero" and isinstance(section_content, str):
-                    # Use OnePager's headline as the hero headline
-                    section_content = {
-                        "headline": onepager_doc["content"].get("headline", section.get("title", "")),
-                        "subheadline": onepager_doc["content"].get("subheadline", ""),
-                        "description": section_content
-                    }
-                    has_hero_section = True
-
-                element = {
-                    "id": section.get("id", f"section-{idx}"),
-                    "type": section_type,
-                    "title": section.get("title"),  # Include title from section
-                    "content": section_content,
-                    "styling": section.get("styling"),
-                    "order": section.get("order", idx)
-                }
-                onepager_layout_data["elements"].append(element)
-
-                # Track if we already have a hero section
-                if section_type == "hero":
-                    has_hero_section = True
-
-        # Add headline as hero element if exists and no hero section already present
-        if not has_hero_section and "content" in onepager_doc and "headline" in onepager_doc["content"]:
-            hero_element = {
-                "id": "hero-main",
-                "type": "hero",
-                "content": {
-                    "headline": onepager_doc["content"]["headline"],
-                    "subheadline": onepager_doc["content"].get("subheadline"),
-                    "description": onepager_doc["content"].get("description", "")
-                },
-                "order": 0
-            }
-            onepager_layout_data["elements"].insert(0, hero_element)
-
-        # Normalize order values to ensure uniqueness
-        # Reassign sequential order values after building elements array
-        for idx, element in enumerate(onepager_layout_data["elements"]):
-            element["order"] = idx
-
-        onepager = OnePagerLayout(**onepager_layout_data)
-        brand_kit = BrandKitInDB(**brand_kit_doc)
-
-        # Extract layout_params from database (if exists)
-        layout_params = onepager_doc.get("layout_params", {})
-
         # Use pdf_template from database, fall back to query parameter
         # Priority: database field > query parameter > default (minimalist)
         selected_template = onepager_doc.get("pdf_template") or template or "minimalist"
 
         # Generate HTML with Brand Kit styling, layout params, and selected template
         logger.info(f"Generating HTML from onepager layout with template: {selected_template}")
-        logger.info(f"Layout params: {layout_params}")
-        html_generator = PDFHTMLGenerator()
-        html = html_generator.generate_html(onepager, brand_kit, template_name=selected_template, layout_params=layout_params)
-
-        # Generate PDF
-        logger.info(f"Generating PDF with format: {format}")
-        pdf_generator = PDFGenerator()
-        pdf_bytes = await pdf_generator.generate_pdf(
-            html,
-            page_format=format
-        )
+        html = render_onepager_html(onepager_doc, brand_kit_doc, selected_template)
 
-        logger.info(f"✅ PDF generated successfully: {len(pdf_bytes) / 1024:.1f} KB")
+        page_formats = list(dict.fromkeys(f.value for f in formats)) if formats else [format]
+
+        # Content-addressed cache keys double as a strong ETag
+        cache_keys = {f: make_pdf_cache_key(html, f) for f in page_formats}
+        if len(page_formats) == 1:
+            etag = f'"{cache_keys[page_formats[0]]}"'
+        else:
+            etag = f'"{combine_pdf_cache_keys(cache_keys.values())}"'
+
+        if etag_matches(if_none_match, etag):
+            logger.info(f"PDF unchanged for onepager {onepager_id}, returning 304")
+            return not_modified(etag)
+
+        pdfs = {f: await pdf_cache.get(key) for f, key in cache_keys.items()}
+        missing_formats = [f for f, pdf_bytes in pdfs.items() if pdf_bytes is None]
+
+        if not missing_formats:
+            cache_status = "HIT"
+            logger.info(f"✅ PDF served from cache: {', '.join(page_formats)}")
+        else:
+            # Generate every missing format from a single page load
+            cache_status = "MISS" if len(missing_formats) == len(page_formats) else "PARTIAL"
+            logger.info(f"Generating PDF with formats: {', '.join(missing_formats)}")
+
+            pdf_generator = PDFGenerator()
+            rendered = await pdf_generator.generate_pdfs(
+                html,
+                missing_formats,
+                user_id=str(current_user.id)
+            )
+            for f in missing_formats:
+                pdfs[f] = rendered[f]
+                await pdf_cache.put(cache_keys[f], rendered[f])
+
+            logger.info(f"✅ PDF generated successfully: {sum(len(pdfs[f]) for f in missing_formats) / 1024:.1f} KB")
+
+        base_filename = onepager_doc['title'].replace(' ', '_')
+
+        if len(page_formats) > 1:
+            async def zip_entries():
+                for f in page_formats:
+                    yield f"{base_filename}_{f}.pdf", pdfs[f]
+
+            return StreamingResponse(
+                stream_zip(zip_entries()),
+                media_type="application/zip",
+                headers={
+                    "Content-Disposition": f"attachment; filename=\"{base_filename}_formats.zip\"",
+                    "ETag": etag,
+                    "X-PDF-Cache": cache_status,
+                    "X-PDF-Format": ",".join(page_formats)
+                }
+            )
+
+        page_format = page_formats[0]
+        pdf_bytes = pdfs[page_format]
 
         # Return as downloadable file
-        filename = f"{onepager_doc['title'].replace(' ', '_')}_{format}.pdf"
+        filename = f"{base_filename}_{page_format}.pdf"
         
         return StreamingResponse(
             io.BytesIO(pdf_bytes),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename=\"{filename}\"",
-                "X-PDF-Format": format,
+                "ETag": etag,
+                "X-PDF-Cache": cache_status,
+                "X-PDF-Format": page_format,
                 "X-PDF-Size-KB": str(int(len(pdf_bytes) / 1024))
             }
         )
 
+    except RenderQueueFullError:
+        # Handled by the app-level 429 handler (Retry-After)
+        raise
     except Exception as e:
         logger.error(f"PDF export failed: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"PDF generation failed: {str(e)}"
         )
+
+
+IMAGE_MEDIA_TYPES = {
+    "png": "image/png",
+    "jpeg": "image/jpeg",
+    "webp": "image/webp"
+}
+
+
+async def _image_response(
+    onepager_id: str,
+    current_user: UserInDB,
+    db: AsyncIOMotorDatabase,
+    image_format: str,
+    page_format: str,
+    template: Optional[str],
+    if_none_match: Optional[str],
+    dpi: Optional[int] = None,
+    thumbnail_width: Optional[int] = None,
+    quality: Optional[int] = None,
+    disposition: str = "attachment"
+):
+    """
+    Render (or serve from cache) a raster image of a one-pager.
+
+    Shared by the image export and thumbnail endpoints. Images are taken
+    from the same Chromium page pipeline as the PDF (print media, page
+    size), so they match the exported PDF.
+    """
+    from fastapi.responses import Response
+    from backend.services.pdf_generator import PDFGenerator, PDFGeneratorError, build_raster_options
+    from backend.services.pdf_cache import pdf_cache, make_image_cache_key
+
+    if not ObjectId.is_valid(onepager_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid one-pager ID format"
+        )
+
+    onepager_doc = await db.onepagers.find_one({"_id": ObjectId(onepager_id)})
+    if not onepager_doc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="One-pager not found"
+        )
+
+    if str(onepager_doc["user_id"]) != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to export this one-pager"
+        )
+
+    try:
+        raster_options = build_raster_options(image_format, page_format, dpi, thumbnail_width, quality)
+    except PDFGeneratorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    brand_kit_doc = await get_brand_kit_doc(db, onepager_doc)
+    selected_template = onepager_doc.get("pdf_template") or template or "minimalist"
+    html = render_onepager_html(onepager_doc, brand_kit_doc, selected_template)
+
+    cache_key = make_image_cache_key(html, raster_options)
+    etag = f'"{cache_key}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    image_bytes = await pdf_cache.get(cache_key)
+    cache_status = "HIT"
+    if image_bytes is None:
+        cache_status = "MISS"
+        try:
+            image_bytes = await PDFGenerator().generate_image(
+                html,
+                image_format=image_format,
+                page_format=page_format,
+                dpi=dpi,
+                thumbnail_width=thumbnail_width,
+                quality=quality,
+                user_id=str(current_user.id)
+            )
+        except PDFGeneratorError as e:
+            logger.error(f"Image export failed: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Image generation failed: {str(e)}"
+            )
+        await pdf_cache.put(cache_key, image_bytes)
+
+    filename = f"{onepager_doc['title'].replace(' ', '_')}_{page_format}.{image_format}"
+    return Response(
+        content=image_bytes,
+        media_type=IMAGE_MEDIA_TYPES[image_format],
+        headers={
+            "Content-Disposition": f"{disposition}; filename=\"{filename}\"",
+            "ETag": etag,
+            "Cache-Control": CACHE_CONTROL,
+            "X-PDF-Cache": cache_status
+        }
+    )
+
+
+@router.get(
+    "/{onepager_id}/export/image",
+    tags=["One-Pagers", "Export"],
+    summary="Export one-pager as PNG/JPEG/WebP",
+    responses={
+        200: {
+            "content": {"image/png": {}, "image/jpeg": {}, "image/webp": {}},
+            "description": "Raster image matching the PDF export"
+        },
+        404: {"model": ErrorResponse, "description": "One-pager not found"},
+        403: {"model": ErrorResponse, "description": "User doesn't own this one-pager"},
+        429: {"model": ErrorResponse, "description": "PDF renderer is saturated, retry later"}
+    }
+)
+async def export_onepager_image(
+    onepager_id: str,
+    image_format: str = Query("png", enum=["png", "jpeg", "webp"], description="Image format"),
+    format: str = Query("letter", enum=["letter", "a4", "tabloid"], description="Page format"),
+    template: str = Query("minimalist", enum=["minimalist", "bold", "business", "product"]),
+    dpi: Optional[int] = Query(None, ge=24, le=600, description="Resolution (default 150, max raster_max_dpi)"),
+    quality: Optional[int] = Query(None, ge=1, le=100, description="JPEG/WebP quality"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: UserInDB = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    """
+    Export one-pager as a raster image.
+
+    Captured from the same headless Chromium page pipeline as the PDF
+    export (print media, page-size viewport), so the image matches the PDF
+    instead of a hand-drawn approximation.
+
+    **Query Parameters:**
+    - image_format: png, jpeg or webp - default: png
+    - format: Page format (letter, a4, tabloid) - default: letter
+    - dpi: Output resolution - default: 150
+    - quality: JPEG/WebP quality (1-100)
+
+    **Errors:**
+    - 400: Invalid one-pager ID or DPI
+    - 403: User doesn't own this one-pager
+    - 404: One-pager not found
+    - 429: PDF renderer is saturated (see Retry-After header)
+    """
+    return await _image_response(
+        onepager_id, current_user, db,
+        image_format=image_format,
+        page_format=format,
+        template=template,
+        if_none_match=if_none_match,
+        dpi=dpi,
+        quality=quality
+    )
+
+
+@router.get(
+    "/{onepager_id}/thumbnail",
+    tags=["One-Pagers", "Export"],
+    summary="Small WebP thumbnail for list views",
+    responses={
+        200: {"content": {"image/webp": {}, "image/png": {}, "image/jpeg": {}}, "description": "Thumbnail"},
+        404: {"model": ErrorResponse, "description": "One-pager not found"},
+        403: {"model": ErrorResponse, "description": "User doesn't own this one-pager"},
+        429: {"model": ErrorResponse, "description": "PDF renderer is saturated, retry later"}
+    }
+)
+async def get_onepager_thumbnail(
+    onepager_id: str,
+    format: str = Query("letter", enum=["letter", "a4", "tabloid"], description="Page format"),
+    image_format: str = Query("webp", enum=["png", "jpeg", "webp"], description="Image format"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: UserInDB = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    """
+    Get a small thumbnail (settings.thumbnail_width_px wide) of a one-pager.
+
+    Rendered on demand and cached per content, so repeat list views are
+    served from cache.
+    """
+    return await _image_response(
+        onepager_id, current_user, db,
+        image_format=image_format,
+        page_format=format,
+        template=None,
+        if_none_match=if_none_match,
+        thumbnail_width=settings.thumbnail_width_px,
+        disposition="inline"
+    )
+
+
+@router.post(
+    "/export/batch",
+    tags=["One-Pagers", "Export"],
+    summary="Export many one-pagers/formats/templates as a ZIP",
+    responses={
+        200: {
+            "content": {"application/zip": {}},
+            "description": "ZIP archive streamed as PDFs finish rendering"
+        },
+        400: {"model": ErrorResponse, "description": "Invalid IDs or batch too large"},
+        404: {"model": ErrorResponse, "description": "One-pager not found"},
+        403: {"model": ErrorResponse, "description": "User doesn't own a one-pager"}
+    }
+)
+async def export_onepagers_batch(
+    batch: OnePagerBatchExport,
+    current_user: UserInDB = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_db)
+):
+    """
+    Export one-pager IDs × formats × templates as a single ZIP download.
+
+    Renders run concurrently on the shared browser pool (bounded by
+    `pdf_batch_max_concurrency`) and reuse the PDF cache. ZIP entries are
+    streamed as each render completes. Renders that fail are listed in an
+    `_errors.txt` entry instead of failing the whole download.
+
+    **Request Body:**
+    - onepager_ids: One-pager IDs (1-50)
+    - formats: Page formats (letter, a4, tabloid) - default: [letter]
+    - templates: Templates (minimalist, bold, business, product) - default: each one-pager's saved template
+
+    **Returns:**
+    - ZIP with one folder per one-pager containing `<template>_<format>.pdf`
+
+    **Errors:**
+    - 400: Invalid one-pager ID or too many combinations
+    - 403: User doesn't own one of the one-pagers
+    - 404: One-pager not found
+    - 429: PDF renderer is saturated (see Retry-After header)
+    """
+    from fastapi.responses import StreamingResponse
+    from backend.services.batch_export import stream_pdf_batch_zip
+
+    # Validate ObjectId format (deduplicated, order preserved)
+    onepager_ids = list(dict.fromkeys(batch.onepager_ids))
+    invalid_ids = [i for i in onepager_ids if not ObjectId.is_valid(i)]
+    if invalid_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid one-pager ID format: {', '.join(invalid_ids)}"
+        )
+
+    formats = list(dict.fromkeys(f.value for f in batch.formats))
+    templates = list(dict.fromkeys(t.value for t in batch.templates)) if batch.templates else [None]
+
+    total_items = len(onepager_ids) * len(formats) * len(templates)
+    if total_items > settings.pdf_batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch too large: {total_items} PDFs requested, maximum is {settings.pdf_batch_max_items}"
+        )
+
+    # Fetch all one-pagers in one query and verify ownership before streaming
+    cursor = db.onepagers.find({"_id": {"$in": [ObjectId(i) for i in onepager_ids]}})
+    docs_by_id = {str(doc["_id"]): doc for doc in await cursor.to_list(length=len(onepager_ids))}
+
+    missing_ids = [i for i in onepager_ids if i not in docs_by_id]
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"One-pager not found: {', '.join(missing_ids)}"
+        )
+
+    if any(str(doc["user_id"]) != str(current_user.id) for doc in docs_by_id.values()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to export one or more of these one-pagers"
+        )
+
+    # Build render jobs (HTML rendered once per one-pager/template, shared across formats)
+    jobs = []
+    brand_kits_by_id: Dict[Any, Dict[str, Any]] = {}
+    try:
+        for onepager_id in onepager_ids:
+            onepager_doc = docs_by_id[onepager_id]
+
+            brand_kit_key = onepager_doc.get("brand_kit_id") or onepager_id
+            if brand_kit_key not in brand_kits_by_id:
+                brand_kits_by_id[brand_kit_key] = await get_brand_kit_doc(db, onepager_doc)
+            brand_kit_doc = brand_kits_by_id[brand_kit_key]
+
+            folder = f"{onepager_doc['title'].replace(' ', '_').replace('/', '_')}_{onepager_id[-6:]}"
+            for template in templates:
+                selected_template = template or onepager_doc.get("pdf_template") or "minimalist"
+                html = render_onepager_html(onepager_doc, brand_kit_doc, selected_template)
+                for page_format in formats:
+                    jobs.append({
+                        "filename": f"{folder}/{selected_template}_{page_format}.pdf",
+                        "html": html,
+                        "format": page_format
+                    })
+    except Exception as e:
+        logger.error(f"Batch export HTML generation failed: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"HTML generation failed: {str(e)}"
+        )
+
+    # Reject with 429 now rather than failing halfway through the stream
+    render_scheduler.check_capacity(str(current_user.id))
+
+    logger.info(f"📦 Batch export: {len(jobs)} PDFs for {len(onepager_ids)} one-pager(s)")
+
+    return StreamingResponse(
+        stream_pdf_batch_zip(jobs, user_id=str(current_user.id)),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": "attachment; filename=\"onepagers_export.zip\"",
+            "X-Batch-Items": str(len(jobs))
+        }
+    )
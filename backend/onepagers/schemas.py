@@ -28,6 +28,13 @@ class PDFTemplate(str, Enum):
     PRODUCT = "product"
 
 
+class PDFPageFormat(str, Enum):
+    """PDF page format options for export."""
+    LETTER = "letter"
+    A4 = "a4"
+    TABLOID = "tabloid"
+
+
 class ContentSection(BaseModel):
     """Content section within a one-pager."""
     id: str = Field(description="Section identifier")
@@ -79,10 +86,19 @@ class VersionSnapshot(BaseModel):
     version: int = Field(description="Version number")
     content: OnePagerContent = Field(description="Content at this version")
     layout: List[LayoutBlock] = Field(description="Layout at this version")
+    layout_params: Optional[Dict[str, Any]] = Field(None, description="Layout parameters at this version")
     created_at: datetime = Field(description="When this version was created")
     change_description: Optional[str] = Field(None, description="What changed")
 
 
+class VersionListResponse(BaseModel):
+    """Paginated version history (newest first)."""
+    items: List[VersionSnapshot] = Field(description="Versions on this page")
+    total: int = Field(description="Total number of versions")
+    skip: int = Field(description="Versions skipped")
+    limit: int = Field(description="Page size")
+
+
 # Request Models
 
 class CTAData(BaseModel):
@@ -222,6 +238,34 @@ class OnePagerIterate(BaseModel):
         }
 
 
+class OnePagerBatchExport(BaseModel):
+    """Request model for exporting many one-pagers/formats/templates as a ZIP."""
+    onepager_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="One-pager IDs to export"
+    )
+    formats: List[PDFPageFormat] = Field(
+        default_factory=lambda: [PDFPageFormat.LETTER],
+        min_length=1,
+        description="Page formats to render for every one-pager"
+    )
+    templates: Optional[List[PDFTemplate]] = Field(
+        None,
+        description="Templates to render (defaults to each one-pager's saved pdf_template)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "onepager_ids": ["507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012"],
+                "formats": ["letter", "a4"],
+                "templates": ["minimalist", "bold"]
+            }
+        }
+
+
 # Response Models
 
 class OnePagerSummary(BaseModel):
@@ -257,7 +301,7 @@ class OnePagerResponse(BaseModel):
     layout: List[LayoutBlock] = Field(description="Layout blocks")
     style_overrides: Dict[str, Any] = Field(default_factory=dict, description="Style overrides")
     generation_metadata: GenerationMetadata = Field(description="AI generation metadata")
-    version_history: List[VersionSnapshot] = Field(default_factory=list, description="Version history")
+    version_count: int = Field(default=0, description="Number of saved versions (see GET /onepagers/{id}/versions)")
     layout_params: Optional[LayoutParams] = Field(None, description="Layout parameters for design customization")
     design_rationale: Optional[str] = Field(None, description="AI's explanation for layout design choices")
     pdf_template: str = Field(default="minimalist", description="PDF template for export (minimalist, bold, business, product)")
@@ -286,7 +330,7 @@ class OnePagerResponse(BaseModel):
                     "ai_model": "gpt-4",
                     "last_generated_at": "2024-01-15T14:20:00Z"
                 },
-                "version_history": [],
+                "version_count": 2,
                 "created_at": "2024-01-15T10:30:00Z",
                 "updated_at": "2024-01-15T14:20:00Z",
                 "last_accessed": "2024-01-15T15:00:00Z"
@@ -300,6 +344,8 @@ __all__ = [
     "OnePagerUpdate",
     "OnePagerContentUpdate",
     "OnePagerIterate",
+    "OnePagerBatchExport",
+    "PDFPageFormat",
     "OnePagerResponse",
     "OnePagerSummary",
     "OnePagerStatus",
@@ -308,6 +354,7 @@ __all__ = [
     "LayoutBlock",
     "GenerationMetadata",
     "VersionSnapshot",
+    "VersionListResponse",
     "CTAData",
     "VisualData"
 ]
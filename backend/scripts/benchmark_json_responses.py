@@ -0,0 +1,184 @@
+"""
+Benchmark JSON Responses
+========================
+
+Measures the per-request CPU of the read endpoints' JSON paths (see
+backend/services/fast_json.py) on a large one-pager.
+
+**What it does:**
+- Builds a synthetic stored one-pager with many sections, layout blocks
+  and prompts, plus a page of list summaries
+- Serves them from an in-process FastAPI app, called directly through
+  ASGI (no database, no network, no HTTP client), through each path:
+  - previous: OnePagerResponse(**onepager_helper(doc)) returned with
+    response_model and the standard JSONResponse
+  - orjson class: the same route with ORJSONResponse as response class
+    (what making it the app default would do)
+  - trusted: model_response() (validated once, encoded by pydantic-core,
+    FastAPI validation/serialization skipped); summaries as plain dicts
+    through ORJSONResponse
+- Checks every path returns the same JSON and times the requests (best
+  of several rounds, minus the cost of an empty route)
+
+**How to run:**
+    python -m backend.scripts.benchmark_json_responses
+    python -m backend.scripts.benchmark_json_responses --sections 120 --repeat 500
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+from bson import ObjectId
+from fastapi import FastAPI
+
+from backend.models.onepager import LayoutParams, onepager_helper, onepager_summary_helper
+from backend.onepagers.schemas import OnePagerResponse, OnePagerSummary
+from backend.services.fast_json import ORJSONResponse, model_response
+
+
+def build_onepager(sections: int, prompts: int) -> Dict[str, Any]:
+    """A stored one-pager as read from MongoDB (naive UTC datetimes)."""
+    now = datetime(2025, 3, 1, 12, 30, 0, 123000)
+    return {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "brand_kit_id": ObjectId(),
+        "title": "Launch plan",
+        "status": "styled",
+        "content": {
+            "headline": "Grow faster with less effort",
+            "subheadline": "Plan, publish and measure campaigns in one place",
+            "sections": [
+                {"id": f"s{i}", "type": "text", "title": f"Section {i}",
+                 "content": "Plan, publish and measure campaigns. " * 20, "order": i}
+                for i in range(sections)
+            ],
+            "features": [f"Feature {i}" for i in range(20)],
+            "benefits": [f"Benefit {i}" for i in range(20)],
+            "visuals": [{"url": f"https://cdn.example.com/{i}.png", "alt": f"Visual {i}"} for i in range(10)]
+        },
+        "layout": [
+            {"block_id": f"block-s{i}", "type": "text", "position": {"x": 0, "y": i * 100},
+             "size": {"width": "100%", "height": "auto"}, "order": i}
+            for i in range(sections)
+        ],
+        "style_overrides": {},
+        "generation_metadata": {
+            "prompts": [f"Make section {i} punchier for enterprise buyers" for i in range(prompts)],
+            "iterations": prompts,
+            "ai_model": "gpt-4",
+            "last_generated_at": now
+        },
+        "version_count": prompts,
+        "layout_params": LayoutParams().model_dump(),
+        "pdf_template": "bold",
+        "created_at": now,
+        "updated_at": now,
+        "last_accessed": now
+    }
+
+
+def build_app(doc: Dict[str, Any], summaries: List[Dict[str, Any]]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/empty")
+    async def empty():
+        return None
+
+    @app.get("/previous/onepager", response_model=OnePagerResponse)
+    async def previous_onepager():
+        return OnePagerResponse(**onepager_helper(doc))
+
+    @app.get("/orjson/onepager", response_model=OnePagerResponse, response_class=ORJSONResponse)
+    async def orjson_onepager():
+        return OnePagerResponse(**onepager_helper(doc))
+
+    @app.get("/trusted/onepager", response_model=OnePagerResponse)
+    async def trusted_onepager():
+        return model_response(OnePagerResponse, onepager_helper(doc))
+
+    @app.get("/previous/list", response_model=List[OnePagerSummary])
+    async def previous_list():
+        return [OnePagerSummary(**onepager_summary_helper(op)) for op in summaries]
+
+    @app.get("/orjson/list", response_model=List[OnePagerSummary], response_class=ORJSONResponse)
+    async def orjson_list():
+        return [OnePagerSummary(**onepager_summary_helper(op)) for op in summaries]
+
+    @app.get("/trusted/list", response_model=List[OnePagerSummary])
+    async def trusted_list():
+        return ORJSONResponse([onepager_summary_helper(op) for op in summaries])
+
+    return app
+
+
+async def request(app: FastAPI, path: str) -> bytes:
+    """Call a GET route through ASGI and return the response body."""
+    scope = {
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "headers": [], "http_version": "1.1", "scheme": "http",
+        "server": ("bench", 80), "client": ("bench", 1), "root_path": ""
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def time_path(app: FastAPI, path: str, repeat: int, rounds: int = 5) -> float:
+    """Best average milliseconds per request over several rounds."""
+    await request(app, path)
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await request(app, path)
+        best = min(best, (time.perf_counter() - start) / repeat * 1000)
+    return best
+
+
+async def run(args: argparse.Namespace) -> None:
+    doc = build_onepager(args.sections, args.prompts)
+    summaries = [build_onepager(1, 1) for _ in range(args.page)]
+    app = build_app(doc, summaries)
+
+    empty_ms = await time_path(app, "/empty", args.repeat)
+    for endpoint in ("onepager", "list"):
+        bodies = {path: await request(app, f"/{path}/{endpoint}") for path in ("previous", "orjson", "trusted")}
+        expected = json.loads(bodies["previous"])
+        assert all(json.loads(body) == expected for body in bodies.values()), f"{endpoint}: bodies differ"
+
+        timings = {
+            path: await time_path(app, f"/{path}/{endpoint}", args.repeat) - empty_ms
+            for path in ("previous", "orjson", "trusted")
+        }
+        print(f"GET {endpoint} ({len(bodies['previous']) / 1024:.1f} KB), "
+              f"framework overhead of {empty_ms:.3f} ms subtracted")
+        for path, ms in timings.items():
+            print(f"  {path:15s} {ms:8.3f} ms  ({timings['previous'] / ms:.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=60, help="Sections (and layout blocks) per one-pager")
+    parser.add_argument("--prompts", type=int, default=100, help="Prompts in generation_metadata")
+    parser.add_argument("--page", type=int, default=100, help="Summaries per list page")
+    parser.add_argument("--repeat", type=int, default=200, help="Requests per round")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
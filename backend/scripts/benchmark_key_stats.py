@@ -0,0 +1,150 @@
+"""
+Benchmark Key Stats Extraction
+==============================
+
+Compares the previous extract_key_stats (string concatenation, eight
+separate regex scans, two extra element walks) with the current
+single-pass matcher in backend/services/pdf_html_generator.py.
+
+**What it does:**
+- Builds synthetic one-pagers with many sections of filler text
+- Checks both implementations return identical stats
+- Times the legacy version, the new version with an empty memo cache
+  (cold), and the new version on unchanged content (memoized)
+
+**How to run:**
+    python -m backend.scripts.benchmark_key_stats
+    python -m backend.scripts.benchmark_key_stats --sections 200 --repeat 50
+"""
+
+import argparse
+import logging
+import re
+import time
+from typing import Callable, Dict, List
+
+from backend.models.onepager import OnePagerLayout
+from backend.services import pdf_html_generator
+from backend.services.pdf_html_generator import extract_key_stats
+
+
+LEGACY_PATTERNS = [
+    (r'(\d+\+?)\s+(clients?|customers?|users?|businesses?|companies?)', '👥'),
+    (r'(\d+\+?)\s+(years?|decades?)', '⏰'),
+    (r'(\d+\+?)\s+(locations?|stores?|branches?)', '📍'),
+    (r'(\d+\+?)\s+(products?|items?|dishes?|services?)', '📦'),
+    (r'(\d+\+?)\s+(employees?|team members?|staff)', '👔'),
+    (r'(\d+%)\s+(satisfaction|happy|rating|success)', '⭐'),
+    (r'(\d+%)\s+(growth|increase)', '📈'),
+    (r'(\$[\d,]+[KMB]?)\s+(revenue|sales|saved|value)', '💰'),
+]
+
+FILLER = (
+    "Our platform helps teams plan, publish and measure campaigns with "
+    "less effort and fewer handoffs between marketing and sales. "
+)
+
+
+def legacy_extract_key_stats(onepager: OnePagerLayout) -> List[Dict[str, str]]:
+    """The implementation replaced by the single-pass matcher."""
+    stats = []
+    all_text = f"{onepager.title} "
+    for element in onepager.elements:
+        content = element.content
+        if isinstance(content, str):
+            all_text += content + " "
+        elif isinstance(content, dict):
+            for value in content.values():
+                if isinstance(value, str):
+                    all_text += value + " "
+        elif isinstance(content, list):
+            for item in content:
+                if isinstance(item, str):
+                    all_text += item + " "
+        if element.title:
+            all_text += element.title + " "
+
+    for pattern, icon in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, all_text, re.IGNORECASE):
+            stats.append({'number': match.group(1), 'label': match.group(2).capitalize(), 'icon': icon})
+            if len(stats) >= 4:
+                break
+        if len(stats) >= 4:
+            break
+
+    if not stats:
+        features = [i for el in onepager.elements
+                    if el.type == 'list' and 'feature' in str(el.title).lower() and isinstance(el.content, list)
+                    for i in el.content]
+        if features:
+            stats.append({'number': str(len(features)), 'label': 'Features', 'icon': '⚡'})
+        benefits = [i for el in onepager.elements
+                    if el.type == 'list' and 'benefit' in str(el.title).lower() and isinstance(el.content, list)
+                    for i in el.content]
+        if benefits:
+            stats.append({'number': str(len(benefits)), 'label': 'Benefits', 'icon': '🎯'})
+
+    return stats[:4]
+
+
+def build_onepager(sections: int, with_stats: bool) -> OnePagerLayout:
+    """Synthetic one-pager alternating text and list sections."""
+    elements = [{
+        "id": "hero", "type": "hero", "order": 0,
+        "content": {"headline": "Grow faster", "description": FILLER * 3}
+    }]
+    for i in range(1, sections + 1):
+        if i % 2:
+            elements.append({
+                "id": f"text-{i}", "type": "text", "title": f"Section {i}", "order": i,
+                "content": FILLER * 8
+            })
+        else:
+            elements.append({
+                "id": f"list-{i}", "type": "list", "order": i,
+                "title": "Key Features" if i % 4 == 0 else "Benefits",
+                "content": [FILLER for _ in range(6)]
+            })
+    if with_stats:
+        elements[-1]["content"] = ["Trusted by 500+ customers", "15 years of experience", "98% satisfaction"]
+    return OnePagerLayout(title="Synthetic one-pager", elements=elements)
+
+
+def time_per_call(fn: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=100, help="Sections per one-pager")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls timed per variant")
+    args = parser.parse_args()
+
+    # extract_key_stats logs every call
+    logging.getLogger("backend.services.pdf_html_generator").setLevel(logging.WARNING)
+
+    print(f"{'case':<14}{'chars':>10}{'legacy ms':>12}{'cold ms':>10}{'memo ms':>10}{'speedup':>10}")
+    for with_stats in (True, False):
+        onepager = build_onepager(args.sections, with_stats)
+        assert extract_key_stats(onepager) == legacy_extract_key_stats(onepager), "results differ"
+
+        def cold():
+            pdf_html_generator._key_stats_cache.clear()
+            extract_key_stats(onepager)
+
+        legacy_ms = time_per_call(lambda: legacy_extract_key_stats(onepager), args.repeat)
+        cold_ms = time_per_call(cold, args.repeat)
+        memo_ms = time_per_call(lambda: extract_key_stats(onepager), args.repeat)
+        chars = sum(len(str(el.content)) for el in onepager.elements)
+        label = "with stats" if with_stats else "no matches"
+        print(
+            f"{label:<14}{chars:>10}{legacy_ms:>12.3f}{cold_ms:>10.3f}"
+            f"{memo_ms:>10.3f}{legacy_ms / cold_ms:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
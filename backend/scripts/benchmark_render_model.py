@@ -0,0 +1,112 @@
+"""
+Benchmark Render Model Building
+===============================
+
+Measures the Pydantic validation overhead removed by the render model
+builder in backend/services/render_model.py.
+
+**What it does:**
+- Builds a synthetic stored one-pager (content.sections) and brand kit
+- Validated path (previous behaviour): OnePagerLayout(**data) and
+  BrandKitInDB(**doc), then model_dump() both and extract key stats
+- Builder path: build_render_model() on the raw documents
+- Memoized path: render_model_cache.get_or_build() on unchanged documents
+- Checks the validated and builder paths produce the same template data
+
+**How to run:**
+    python -m backend.scripts.benchmark_render_model
+    python -m backend.scripts.benchmark_render_model --sections 60 --repeat 500
+"""
+
+import argparse
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Tuple
+
+from bson import ObjectId
+
+from backend.models.brand_kit import BrandKitInDB
+from backend.models.onepager import OnePagerLayout
+from backend.services.pdf_html_generator import pdf_html_generator
+from backend.services.render_model import RenderModelCache, build_render_model
+
+
+def build_documents(sections: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Synthetic one-pager and brand kit documents as stored in MongoDB."""
+    now = datetime.now(timezone.utc)
+    brand_kit_id = ObjectId()
+    section_docs = [{"id": "hero", "type": "hero", "title": "Hero", "content": "Trusted by 200+ teams"}]
+    for i in range(1, sections):
+        if i % 2:
+            section_docs.append({"id": f"s{i}", "type": "text", "title": f"Section {i}",
+                                 "content": "Plan, publish and measure campaigns. " * 6})
+        else:
+            section_docs.append({"id": f"s{i}", "type": "list", "title": "Features",
+                                 "content": [f"Feature {j}" for j in range(6)]})
+
+    onepager_doc = {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "brand_kit_id": brand_kit_id,
+        "title": "Synthetic one-pager",
+        "content": {"headline": "Grow faster", "subheadline": "With less effort", "sections": section_docs},
+        "updated_at": now,
+    }
+    brand_kit_doc = {
+        "_id": brand_kit_id,
+        "user_id": onepager_doc["user_id"],
+        "company_name": "Acme",
+        "color_palette": {"primary": "#0ea5e9", "secondary": "#64748b", "accent": "#10b981"},
+        "typography": {"heading_font": "Montserrat", "body_font": "Inter"},
+        "products": [{"name": "Acme Analytics", "benefits": ["Faster"], "features": ["Charts"]}],
+        "created_at": now,
+        "updated_at": now,
+    }
+    return onepager_doc, brand_kit_doc
+
+
+def validated_render_model(onepager_doc: Dict[str, Any], brand_kit_doc: Dict[str, Any]) -> Dict[str, Any]:
+    """The previous path: validate through the Pydantic models, then dump them."""
+    onepager_data = build_render_model(onepager_doc, brand_kit_doc)["onepager"]
+    layout = OnePagerLayout(**{"title": onepager_data["title"], "elements": onepager_data["elements"]})
+    return pdf_html_generator._render_model_from(layout, BrandKitInDB(**brand_kit_doc))
+
+
+def time_per_call(fn: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=12, help="Sections per one-pager")
+    parser.add_argument("--repeat", type=int, default=2000, help="Calls timed per variant")
+    args = parser.parse_args()
+
+    # Key stats extraction logs every call
+    logging.getLogger("backend.services.pdf_html_generator").setLevel(logging.WARNING)
+
+    onepager_doc, brand_kit_doc = build_documents(args.sections)
+    validated = validated_render_model(onepager_doc, brand_kit_doc)
+    built = build_render_model(onepager_doc, brand_kit_doc)
+    assert validated["onepager"]["elements"] == built["onepager"]["elements"], "elements differ"
+    assert validated["key_stats"] == built["key_stats"], "key stats differ"
+    for field in ("color_palette", "typography", "company_name", "logo"):
+        assert validated["brand"].get(field) == built["brand"].get(field), f"brand {field} differs"
+
+    cache = RenderModelCache(max_entries=16)
+    validated_ms = time_per_call(lambda: validated_render_model(onepager_doc, brand_kit_doc), args.repeat)
+    built_ms = time_per_call(lambda: build_render_model(onepager_doc, brand_kit_doc), args.repeat)
+    memo_ms = time_per_call(lambda: cache.get_or_build(onepager_doc, brand_kit_doc), args.repeat)
+
+    print(f"{args.sections} sections, {args.repeat} calls per variant")
+    print(f"  validated (Pydantic + model_dump): {validated_ms:8.4f} ms")
+    print(f"  render model builder:              {built_ms:8.4f} ms  ({validated_ms / built_ms:.1f}x)")
+    print(f"  memoized (unchanged document):     {memo_ms:8.4f} ms  ({validated_ms / memo_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark Version Deltas
+========================
+
+Measures history storage with delta-encoded versions (see
+backend/services/onepager_versions.py) against full snapshots.
+
+**What it does:**
+- Simulates a refinement session: each iteration rewrites one section,
+  every few iterations a section is inserted or the layout_params change
+- Encodes every version as a full snapshot and as keyframes + JSON Patch
+  deltas, and compares their BSON size
+- Checks every version rebuilds exactly and times the slowest rebuild
+  (the version just before a keyframe)
+
+**How to run:**
+    python -m backend.scripts.benchmark_version_deltas
+    python -m backend.scripts.benchmark_version_deltas --versions 200 --sections 16
+"""
+
+import argparse
+import copy
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import bson
+from bson import ObjectId
+
+from backend.config import settings
+from backend.services.onepager_versions import _replay, encode_version
+
+
+def build_session(versions: int, sections: int) -> List[Dict[str, Any]]:
+    """Versioned states of a synthetic refinement session."""
+    state = {
+        "content": {
+            "headline": "Grow faster",
+            "subheadline": "With less effort",
+            "sections": [
+                {"id": f"s{i}", "type": "text", "title": f"Section {i}",
+                 "content": "Plan, publish and measure campaigns. " * 12}
+                for i in range(sections)
+            ]
+        },
+        "layout": [],
+        "layout_params": {"spacing": {"section_gap": "24px"}, "typography": {"h1_scale": 2.5}}
+    }
+    states = []
+    for v in range(1, versions + 1):
+        state = copy.deepcopy(state)
+        target = state["content"]["sections"][v % len(state["content"]["sections"])]
+        target["content"] = f"Iteration {v}: " + "Sharper copy for the buyer. " * 12
+        if v % 7 == 0:
+            state["content"]["sections"].insert(1, {"id": f"n{v}", "type": "list", "content": ["A", "B"]})
+        if v % 5 == 0:
+            state["layout_params"]["spacing"]["section_gap"] = f"{16 + v % 20}px"
+        states.append(state)
+    return states
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--versions", type=int, default=60, help="Versions in the session")
+    parser.add_argument("--sections", type=int, default=10, help="Sections per one-pager")
+    parser.add_argument("--interval", type=int, default=settings.version_keyframe_interval,
+                        help="Keyframe interval")
+    args = parser.parse_args()
+
+    onepager_id, user_id = ObjectId(), ObjectId()
+    now = datetime.now(timezone.utc)
+    states = build_session(args.versions, args.sections)
+
+    full_docs, delta_docs = [], []
+    previous = None
+    for v, state in enumerate(states, start=1):
+        full_docs.append(encode_version(onepager_id, user_id, v, state, None, "Edit", now, args.interval))
+        doc = encode_version(onepager_id, user_id, v, state, previous, "Edit", now, args.interval)
+        delta_docs.append(doc)
+        previous = (doc.get("keyframe_version", v), state)
+
+    full_bytes = sum(len(bson.encode(d)) for d in full_docs)
+    delta_bytes = sum(len(bson.encode(d)) for d in delta_docs)
+
+    rebuilt = {doc["version"]: copy.deepcopy(state) for doc, _, state in _replay(delta_docs)}
+    assert all(rebuilt[v] == state for v, state in enumerate(states, start=1)), "rebuild differs"
+
+    # Slowest rebuild: the longest chain (keyframe + interval - 1 deltas)
+    chain = delta_docs[:min(args.interval, len(delta_docs))]
+    repeat = 200
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _ in _replay(chain):
+            pass
+    rebuild_ms = (time.perf_counter() - start) / repeat * 1000
+
+    keyframes = sum(1 for d in delta_docs if "patch" not in d)
+    print(f"{args.versions} versions, {args.sections} sections, keyframe every {args.interval}")
+    print(f"  full snapshots:       {full_bytes / 1024:10.1f} KB")
+    print(f"  keyframes + deltas:   {delta_bytes / 1024:10.1f} KB  "
+          f"({full_bytes / delta_bytes:.1f}x smaller, {keyframes} keyframes)")
+    print(f"  worst-case rebuild:   {rebuild_ms:10.3f} ms ({len(chain)} documents)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Download Google Fonts into the Local Font Store
+================================================
+
+Populates backend/assets/fonts/ so the PDF engine can render fully offline
+(see backend/services/font_store.py). This is a required setup/build step:
+the store ships empty and rendering is offline by default, so fonts that
+are not downloaded render with system fallbacks.
+
+**What it does:**
+- Collects font families from CLI args, the defaults below, and (with
+  --from-db) every brand kit's heading_font/body_font
+- Fetches the Google Fonts css2 stylesheet for each family
+- Downloads the latin-subset woff2 for each weight into
+  backend/assets/fonts/<Family Name>/<weight>.woff2
+
+**How to run:**
+    python -m backend.scripts.download_fonts
+    python -m backend.scripts.download_fonts "Open Sans" Lato
+    python -m backend.scripts.download_fonts --from-db
+    python -m backend.scripts.download_fonts --check   # CI/build gate, no network
+
+**Safety:**
+- Existing files are skipped, so the script can be re-run (idempotent)
+- Families not on Google Fonts (e.g. Arial) are reported and skipped
+- --check exits non-zero when the default brand kit fonts are missing
+"""
+
+import asyncio
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Set
+
+import httpx
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir.parent))
+
+from backend.config import settings
+from backend.services.font_store import DEFAULT_FAMILIES as REQUIRED_FAMILIES, font_store
+
+
+# Fonts used by templates and default brand kits
+DEFAULT_FAMILIES = REQUIRED_FAMILIES + ["Roboto", "Open Sans", "Lato", "Poppins"]
+
+WEIGHTS = [400, 500, 600, 700, 800, 900]
+
+CSS_URL = "https://fonts.googleapis.com/css2"
+
+# Google only serves woff2 to browsers it recognizes
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
+)
+
+FONT_FACE_PATTERN = re.compile(r"/\*\s*([\w-]+)\s*\*/\s*@font-face\s*\{([^}]*)\}")
+
+
+def parse_latin_faces(css: str) -> Dict[int, str]:
+    """Map weight -> woff2 URL for the latin subset of a css2 response."""
+    faces = {}
+    for subset, body in FONT_FACE_PATTERN.findall(css):
+        if subset != "latin" or "font-style: normal" not in body:
+            continue
+        weight = re.search(r"font-weight:\s*(\d+)", body)
+        src = re.search(r"url\((https://[^)]+\.woff2)\)", body)
+        if weight and src:
+            faces[int(weight.group(1))] = src.group(1)
+    return faces
+
+
+async def families_from_db() -> Set[str]:
+    """Collect heading/body fonts from all active brand kits."""
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    families = set()
+    try:
+        cursor = client[settings.mongodb_db_name].brand_kits.find(
+            {"is_active": True},
+            {"typography": 1}
+        )
+        async for brand_kit in cursor:
+            typography = brand_kit.get("typography") or {}
+            for key in ("heading_font", "body_font"):
+                if typography.get(key):
+                    families.add(typography[key])
+    finally:
+        client.close()
+    return families
+
+
+async def download_family(client: httpx.AsyncClient, family: str, root: Path) -> int:
+    """Download all weights of one family. Returns number of new files."""
+    query = f"{family}:wght@{';'.join(str(w) for w in WEIGHTS)}"
+    response = await client.get(CSS_URL, params={"family": query, "display": "swap"})
+    if response.status_code != 200:
+        # Variable-weight request fails for static fonts; retry with defaults
+        response = await client.get(CSS_URL, params={"family": family})
+    if response.status_code != 200:
+        print(f"   ⚠️ {family}: not available on Google Fonts ({response.status_code})")
+        return 0
+
+    faces = parse_latin_faces(response.text)
+    family_dir = root / family
+    family_dir.mkdir(parents=True, exist_ok=True)
+
+    downloaded = 0
+    for weight, url in sorted(faces.items()):
+        path = family_dir / f"{weight}.woff2"
+        if path.exists():
+            continue
+        font = await client.get(url)
+        font.raise_for_status()
+        path.write_bytes(font.content)
+        downloaded += 1
+
+    print(f"   ✅ {family}: {sorted(faces)} ({downloaded} new)")
+    return downloaded
+
+
+async def main(argv: List[str]):
+    """Main entry point."""
+    if "--check" in argv:
+        missing = font_store.missing_defaults()
+        if missing:
+            print(f"❌ Font store {font_store.root} lacks {', '.join(missing)}")
+            print("   Run: python -m backend.scripts.download_fonts")
+            sys.exit(1)
+        print(f"✅ Font store {font_store.root} holds {', '.join(REQUIRED_FAMILIES)}")
+        return
+
+    families = set(DEFAULT_FAMILIES)
+    args = [a for a in argv if a != "--from-db"]
+    families.update(args)
+
+    if "--from-db" in argv:
+        print(f"📡 Reading brand kit fonts from MongoDB: {settings.mongodb_url}")
+        families.update(await families_from_db())
+
+    root = font_store.root
+    print(f"📁 Font store: {root}")
+    print(f"🔤 Families: {', '.join(sorted(families))}")
+
+    total = 0
+    async with httpx.AsyncClient(headers={"User-Agent": USER_AGENT}, timeout=30.0) as client:
+        for family in sorted(families):
+            try:
+                total += await download_family(client, family, root)
+            except httpx.HTTPError as e:
+                print(f"   ❌ {family}: {e}")
+
+    print(f"\n✅ Done: {total} font file(s) downloaded")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,98 @@
+"""
+Database Migration: Move version_history to onepager_versions
+==============================================================
+
+Moves the embedded version_history array of existing OnePagers into the
+onepager_versions collection (one document per version).
+
+**What it does:**
+- Copies every embedded version into onepager_versions
+- Removes version_history from the OnePager and sets version_count
+- Does not touch updated_at (rendered output and caches are unaffected)
+
+**How to run:**
+    python backend/scripts/migrate_version_history.py
+
+**Safety:**
+- Versions already present in onepager_versions are skipped (unique index)
+- The API migrates a OnePager lazily when its versions are first listed,
+  fetched or restored, so running this is optional
+- Can be safely re-run multiple times (idempotent)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir.parent))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from backend.config import settings
+from backend.services.onepager_versions import migrate_embedded_history
+
+
+async def migrate_forward():
+    """
+    Migration: Move embedded version_history into onepager_versions.
+    """
+    print("=" * 70)
+    print("MIGRATION: Move version_history to onepager_versions")
+    print("=" * 70)
+    print()
+
+    # Connect to database
+    print(f"📡 Connecting to MongoDB: {settings.mongodb_url}")
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    db = client[settings.mongodb_db_name]
+
+    try:
+        await client.admin.command('ping')
+        print("✅ Database connection successful")
+        print()
+    except Exception as e:
+        print(f"❌ Database connection failed: {e}")
+        return
+
+    await db.onepager_versions.create_index([("onepager_id", 1), ("version", -1)], unique=True)
+
+    pending = await db.onepagers.count_documents({"version_history": {"$exists": True}})
+    print(f"📊 OnePagers with embedded version_history: {pending}")
+    if pending == 0:
+        print("✅ No migration needed.")
+        client.close()
+        return
+
+    print()
+    print("🚀 Starting migration...")
+    migrated = 0
+    copied = 0
+    cursor = db.onepagers.find(
+        {"version_history": {"$exists": True}},
+        {"user_id": 1, "version_history": 1}
+    )
+    async for onepager in cursor:
+        try:
+            copied += await migrate_embedded_history(db, onepager)
+            migrated += 1
+        except Exception as e:
+            print(f"❌ Failed to migrate OnePager {onepager['_id']}: {e}")
+
+    print(f"✅ Migrated {migrated} OnePagers ({copied} versions copied)")
+
+    remaining = await db.onepagers.count_documents({"version_history": {"$exists": True}})
+    if remaining:
+        print(f"⚠️  Warning: {remaining} OnePagers still have version_history (re-run to retry)")
+    else:
+        print("✅ Verification passed! No embedded version_history left.")
+
+    client.close()
+    print()
+    print("=" * 70)
+    print("MIGRATION COMPLETE")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_forward())
@@ -0,0 +1,150 @@
+"""
+Access Tracker Service
+======================
+
+Write-behind buffer for one-pager last_accessed timestamps.
+
+GET /onepagers/{id} used to follow its find_one with an update_one of
+last_accessed on every read, doubling the round trips of the busiest
+endpoint. Reads now only record the access in memory:
+- Timestamps are collected per one-pager (repeated reads collapse into
+  one pending write)
+- A background task flushes them every last_accessed_flush_seconds with a
+  single unordered bulk_write of UpdateOne operations
+- $max keeps the newest timestamp when several API processes flush the
+  same one-pager
+- The buffer is flushed on shutdown (FastAPI lifespan); a failed flush is
+  merged back and retried on the next one
+
+last_accessed is informational (sorting/summaries), so a crash loses at
+most one flush interval of access times.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class AccessTimeBuffer:
+    """
+    Collects last_accessed timestamps and writes them in batches.
+
+    Usage:
+        await access_tracker.start(db)       # FastAPI lifespan startup
+        access_tracker.record(onepager_id)   # on every read
+        await access_tracker.stop()          # FastAPI lifespan shutdown (flushes)
+    """
+
+    def __init__(self, flush_interval: float = 5.0, max_pending: int = 10000):
+        """
+        Initialize the buffer (the flush task is spawned by start()).
+
+        Args:
+            flush_interval: Seconds between flushes
+            max_pending: Pending one-pagers that trigger an early flush
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._db: Optional[AsyncIOMotorDatabase] = None
+        self._pending: Dict[Any, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self.flushed = 0
+        self.failed_flushes = 0
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Spawn the periodic flush task."""
+        self._db = db
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._flush_loop(), name="last-accessed-flush")
+        logger.info(f"✅ last_accessed write-behind started (every {self.flush_interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the flush task and write everything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        written = await self.flush()
+        if written:
+            logger.info(f"✅ Flushed {written} pending last_accessed update(s) on shutdown")
+
+    def record(self, onepager_id: Any, accessed_at: Optional[datetime] = None) -> None:
+        """
+        Record a read of a one-pager.
+
+        Args:
+            onepager_id: One-pager _id (ObjectId)
+            accessed_at: Access time (defaults to now)
+        """
+        accessed_at = accessed_at or datetime.now(timezone.utc)
+        previous = self._pending.get(onepager_id)
+        if previous is None or accessed_at > previous:
+            self._pending[onepager_id] = accessed_at
+        if len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """
+        Write pending timestamps with one bulk_write.
+
+        Returns:
+            Number of one-pagers written (0 if nothing was pending or the write failed)
+        """
+        if not self._pending or self._db is None:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        operations = [
+            UpdateOne({"_id": onepager_id}, {"$max": {"last_accessed": accessed_at}})
+            for onepager_id, accessed_at in pending.items()
+        ]
+        try:
+            await self._db.onepagers.bulk_write(operations, ordered=False)
+        except Exception as e:
+            self.failed_flushes += 1
+            logger.warning(f"⚠️ Failed to flush {len(operations)} last_accessed update(s): {e}")
+            # Keep them for the next flush, without overwriting newer reads
+            for onepager_id, accessed_at in pending.items():
+                self.record(onepager_id, accessed_at)
+            return 0
+
+        self.flushed += len(operations)
+        return len(operations)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return buffer counters for health checks."""
+        return {
+            "pending": len(self._pending),
+            "flushed": self.flushed,
+            "failed_flushes": self.failed_flushes
+        }
+
+
+# Singleton instance, started in backend/main.py lifespan
+access_tracker = AccessTimeBuffer(
+    flush_interval=settings.last_accessed_flush_seconds,
+    max_pending=settings.last_accessed_max_pending
+)
@@ -0,0 +1,159 @@
+"""
+Batch Export Service
+====================
+
+Renders many PDFs concurrently and streams them back as a ZIP archive.
+
+Used by POST /onepagers/export/batch for one-pager × format × template
+exports. Renders share the warm browser pool (one browser session per
+pooled browser) and the PDF cache, and the number of pages in flight is
+bounded by pdf_batch_max_concurrency. ZIP entries are written as soon as
+each render completes, so the response starts streaming after the first
+PDF instead of after the last.
+
+Features:
+- Bounded concurrency (asyncio.Semaphore), fair-queued with other renders
+  by the render scheduler
+- Completion-order streaming (asyncio.as_completed)
+- ZIP written to a non-seekable buffer (data descriptors, no temp file)
+- Failed renders are listed in an _errors.txt entry instead of aborting
+"""
+
+import asyncio
+import logging
+import zipfile
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from backend.config import settings
+from backend.services.pdf_cache import pdf_cache, make_pdf_cache_key
+from backend.services.pdf_generator import PDFGenerator
+
+
+logger = logging.getLogger(__name__)
+
+
+class _ZipStreamBuffer:
+    """
+    Write-only, non-seekable file object collecting ZIP output.
+
+    zipfile detects the missing tell()/seek() and switches to streaming
+    mode (local headers + data descriptors), so bytes can be drained after
+    every entry.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(entries: AsyncIterator[Tuple[str, bytes]]) -> AsyncIterator[bytes]:
+    """
+    Stream a ZIP archive built from (filename, bytes) entries.
+
+    PDFs are already compressed, so entries are stored without deflate.
+
+    Args:
+        entries: Async iterator of (archive name, file bytes)
+
+    Yields:
+        ZIP archive chunks
+    """
+    buffer = _ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        async for name, data in entries:
+            archive.writestr(name, data)
+            chunk = buffer.drain()
+            if chunk:
+                yield chunk
+    yield buffer.drain()
+
+
+async def render_pdf_batch(
+    jobs: List[Dict[str, Any]],
+    max_concurrency: Optional[int] = None,
+    user_id: Optional[str] = None
+) -> AsyncIterator[Tuple[Dict[str, Any], Optional[bytes], Optional[str]]]:
+    """
+    Render PDF jobs concurrently, yielding results in completion order.
+
+    Args:
+        jobs: Dicts with keys 'filename', 'html' and 'format'
+        max_concurrency: Maximum renders in flight (defaults to settings)
+        user_id: Requesting user (render scheduler fair-share key)
+
+    Yields:
+        Tuples of (job, pdf bytes or None, error message or None)
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or settings.pdf_batch_max_concurrency)
+    generator = PDFGenerator()
+
+    async def render(job: Dict[str, Any]):
+        async with semaphore:
+            try:
+                cache_key = make_pdf_cache_key(job["html"], job["format"])
+                pdf_bytes = await pdf_cache.get(cache_key)
+                if pdf_bytes is None:
+                    # Admission was checked up front; the semaphore bounds the batch
+                    pdf_bytes = await generator.generate_pdf(
+                        job["html"],
+                        page_format=job["format"],
+                        user_id=user_id,
+                        bounded_queue=False
+                    )
+                    await pdf_cache.put(cache_key, pdf_bytes)
+                return job, pdf_bytes, None
+            except Exception as e:
+                logger.error(f"Batch render failed for {job['filename']}: {e}")
+                return job, None, str(e)
+
+    tasks = [asyncio.create_task(render(job)) for job in jobs]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        # Client disconnected or consumer stopped early: drop pending renders
+        for task in tasks:
+            task.cancel()
+
+
+async def stream_pdf_batch_zip(
+    jobs: List[Dict[str, Any]],
+    user_id: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """
+    Render jobs and stream them as a ZIP (see render_pdf_batch/stream_zip).
+
+    Args:
+        jobs: Dicts with keys 'filename', 'html' and 'format'
+        user_id: Requesting user (render scheduler fair-share key)
+
+    Yields:
+        ZIP archive chunks
+    """
+    async def entries():
+        errors = []
+        rendered = 0
+        async for job, pdf_bytes, error in render_pdf_batch(jobs, user_id=user_id):
+            if error:
+                errors.append(f"{job['filename']}: {error}")
+                continue
+            rendered += 1
+            yield job["filename"], pdf_bytes
+
+        if errors:
+            yield "_errors.txt", "\n".join(errors).encode("utf-8")
+        logger.info(f"✅ Batch export finished: {rendered}/{len(jobs)} PDFs")
+
+    async for chunk in stream_zip(entries()):
+        yield chunk
@@ -0,0 +1,343 @@
+"""
+Browser Pool Service
+====================
+
+Keeps warm headless Chromium instances for PDF rendering.
+
+Launching Chromium costs 1-2 seconds and a large memory spike, so instead
+of starting a browser per export the pool keeps N browsers alive for the
+lifetime of the API process and hands out pages per request.
+
+Features:
+- N warm browsers, each owned by a dedicated render thread
+- One reusable browser context + page per browser
+- Recycles a browser after a configurable number of renders
+- Relaunches a browser automatically after it crashes
+- Started/stopped from the FastAPI lifespan in backend/main.py
+
+Playwright's sync API is used (same as PDFGenerator) because the async API
+is not reliable with Python 3.13 on Windows. Sync Playwright objects are
+bound to the thread that created them, so every browser lives on its own
+thread and work is shipped to it as a callable taking a Page.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+# Chromium flags shared by pooled and one-off browsers
+CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--disable-gpu'
+]
+
+# Viewport used for every rendered page
+DEFAULT_VIEWPORT = {'width': 1920, 'height': 1080}
+
+
+T = TypeVar("T")
+
+
+class BrowserPoolError(Exception):
+    """Raised when the browser pool cannot run a render job."""
+    pass
+
+
+class _BrowserWorker(threading.Thread):
+    """
+    Render thread owning a single Chromium browser.
+
+    Pulls jobs from the pool's shared queue, runs them against a reused
+    page and relaunches the browser when it crashes or reaches the render
+    budget.
+    """
+
+    def __init__(self, pool: "BrowserPool", index: int):
+        super().__init__(name=f"browser-pool-{index}", daemon=True)
+        self.pool = pool
+        self.index = index
+        self.ready = threading.Event()
+        self.startup_error: Optional[BaseException] = None
+
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._page = None
+
+        self.renders_since_launch = 0
+        self.total_renders = 0
+        self.launches = 0
+        self.recycles = 0
+        self.crashes = 0
+
+    # ------------------------------------------------------------------
+    # Browser lifecycle (all called on this thread)
+    # ------------------------------------------------------------------
+
+    def _launch(self) -> None:
+        """Launch a fresh browser with one context and one page."""
+        self._browser = self._playwright.chromium.launch(
+            headless=True,
+            args=self.pool.launch_args
+        )
+        self._context = self._browser.new_context(viewport=DEFAULT_VIEWPORT)
+        for hook in self.pool.context_hooks:
+            hook(self._context)
+        self._page = self._context.new_page()
+        self.renders_since_launch = 0
+        self.launches += 1
+        logger.debug(f"{self.name}: launched Chromium (launch #{self.launches})")
+
+    def _close(self) -> None:
+        """Close the current browser, ignoring errors from a dead process."""
+        browser = self._browser
+        self._browser = None
+        self._context = None
+        self._page = None
+        if browser is None:
+            return
+        try:
+            browser.close()
+        except Exception as e:
+            logger.debug(f"{self.name}: error while closing browser: {e}")
+
+    def _recycle(self, reason: str) -> None:
+        """Replace the current browser with a new one."""
+        logger.info(f"♻️ {self.name}: recycling browser ({reason})")
+        self.recycles += 1
+        self._close()
+        self._launch()
+
+    def _is_healthy(self) -> bool:
+        """Check that the browser process is still connected."""
+        try:
+            return self._browser is not None and self._browser.is_connected()
+        except Exception:
+            return False
+
+    def _acquire_page(self):
+        """Return the reusable page, relaunching or reopening it if needed."""
+        if not self._is_healthy():
+            if self._browser is not None:
+                self.crashes += 1
+            self._close()
+            self._launch()
+        elif self._page is None or self._page.is_closed():
+            self._page = self._context.new_page()
+        return self._page
+
+    # ------------------------------------------------------------------
+    # Thread main loop
+    # ------------------------------------------------------------------
+
+    def run(self) -> None:
+        try:
+            self._playwright = self.pool.playwright_factory().start()
+            self._launch()
+        except BaseException as e:
+            self.startup_error = e
+            self.ready.set()
+            logger.error(f"❌ {self.name}: failed to launch Chromium: {e}")
+            if self._playwright is not None:
+                self._playwright.stop()
+            return
+
+        self.ready.set()
+
+        try:
+            while True:
+                job = self.pool._jobs.get()
+                if job is None:
+                    break
+                self._run_job(*job)
+        finally:
+            self._close()
+            try:
+                self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"{self.name}: error while stopping Playwright: {e}")
+
+    def _run_job(self, fn: Callable[[Any], Any], future: Future) -> None:
+        """Run one render job and apply the recycle policy afterwards."""
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            page = self._acquire_page()
+            result = fn(page)
+        except BaseException as e:
+            if not self._is_healthy():
+                self.crashes += 1
+                future.set_exception(e)
+                logger.warning(f"⚠️ {self.name}: browser crashed during render: {e}")
+                self._relaunch_quietly()
+                return
+            outcome = e
+        else:
+            outcome = None
+
+        # Count before resolving, so the caller sees its render in stats()
+        self.renders_since_launch += 1
+        self.total_renders += 1
+        if outcome is None:
+            future.set_result(result)
+        else:
+            future.set_exception(outcome)
+
+        max_renders = self.pool.max_renders_per_browser
+        if max_renders and self.renders_since_launch >= max_renders:
+            self._relaunch_quietly(f"reached {max_renders} renders")
+
+    def _relaunch_quietly(self, reason: str = "crash") -> None:
+        """Recycle the browser without letting launch errors kill the thread."""
+        try:
+            self._recycle(reason)
+        except Exception as e:
+            # Next job retries the launch through _acquire_page()
+            logger.error(f"❌ {self.name}: relaunch failed: {e}")
+            self._close()
+
+
+class BrowserPool:
+    """
+    Pool of warm headless Chromium browsers.
+
+    Usage:
+        pool = BrowserPool(size=2, max_renders_per_browser=200)
+        await pool.start()
+
+        def render(page):
+            page.set_content(html)
+            return page.pdf(format='Letter')
+
+        pdf_bytes = await pool.run(render)
+
+        await pool.stop()
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_renders_per_browser: int = 200,
+        launch_args: Optional[List[str]] = None,
+        playwright_factory: Optional[Callable[[], Any]] = None
+    ):
+        """
+        Initialize the pool (browsers are launched by start()).
+
+        Args:
+            size: Number of warm browsers to keep
+            max_renders_per_browser: Recycle a browser after this many renders (0 = never)
+            launch_args: Chromium command-line flags
+            playwright_factory: Callable returning an unstarted sync Playwright
+                               context manager (defaults to sync_playwright)
+        """
+        self.size = size
+        self.max_renders_per_browser = max_renders_per_browser
+        self.launch_args = launch_args or CHROMIUM_ARGS
+        self.playwright_factory = playwright_factory or _default_playwright_factory
+
+        # Callables applied to every new browser context (e.g. request routing)
+        self.context_hooks: List[Callable[[Any], None]] = []
+
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._workers: List[_BrowserWorker] = []
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the pool has at least one live browser thread."""
+        return self._running
+
+    async def start(self) -> None:
+        """
+        Launch all browsers and wait until they are warm.
+
+        Browsers that fail to launch are logged and dropped. If none start,
+        the pool stays stopped and callers fall back to one-off browsers.
+        """
+        if self._running or self.size <= 0:
+            return
+
+        logger.info(f"Starting browser pool with {self.size} Chromium instance(s)")
+
+        workers = [_BrowserWorker(self, i) for i in range(self.size)]
+        for worker in workers:
+            worker.start()
+
+        await asyncio.to_thread(lambda: [w.ready.wait() for w in workers])
+
+        self._workers = [w for w in workers if w.startup_error is None]
+        self._running = bool(self._workers)
+
+        if self._running:
+            logger.info(f"✅ Browser pool ready ({len(self._workers)}/{self.size} browsers)")
+        else:
+            logger.error("❌ Browser pool failed to start, PDF export will launch browsers per request")
+
+    async def stop(self) -> None:
+        """Close all browsers after in-flight jobs finish."""
+        if not self._running:
+            return
+
+        self._running = False
+        for _ in self._workers:
+            self._jobs.put(None)
+
+        workers = self._workers
+        await asyncio.to_thread(lambda: [w.join(timeout=30) for w in workers])
+        self._workers = []
+        logger.info("✅ Browser pool stopped")
+
+    async def run(self, fn: Callable[[Any], T]) -> T:
+        """
+        Run fn(page) on a pooled browser page and return its result.
+
+        The callable executes on the browser's render thread, so it must use
+        the Playwright sync API and must not touch the event loop.
+
+        Raises:
+            BrowserPoolError: If the pool is not running
+        """
+        if not self._running:
+            raise BrowserPoolError("Browser pool is not running")
+
+        future: Future = Future()
+        self._jobs.put((fn, future))
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool counters for health checks and metrics."""
+        return {
+            "running": self._running,
+            "size": len(self._workers),
+            "queued_jobs": self._jobs.qsize(),
+            "renders": sum(w.total_renders for w in self._workers),
+            "launches": sum(w.launches for w in self._workers),
+            "recycles": sum(w.recycles for w in self._workers),
+            "crashes": sum(w.crashes for w in self._workers),
+        }
+
+
+def _default_playwright_factory():
+    from playwright.sync_api import sync_playwright
+    return sync_playwright()
+
+
+# Singleton instance, started in backend/main.py lifespan
+browser_pool = BrowserPool(
+    size=settings.pdf_browser_pool_size,
+    max_renders_per_browser=settings.pdf_browser_max_renders
+)
@@ -0,0 +1,215 @@
+"""
+CSS Bundle Service
+==================
+
+Precompiled, minified stylesheets for the PDF templates.
+
+Each template's <style> block lives in templates/pdf/styles/<template>.css
+and only reads brand colors/fonts and layout_params. Instead of filling it
+in (and shipping several hundred indented lines to Chromium) on every
+render, it is compiled once per (stylesheet, brand styling, layout_params):
+- Rendered with the PDF Jinja environment, then minified (minify_css)
+- Kept in an in-memory LRU (css_bundle_cache_max_bytes)
+- Stored under backend/output/css_bundles/<key>.css so restarts and other
+  API processes reuse it
+- Built eagerly when a brand kit or layout_params is saved, lazily
+  otherwise
+
+The bundle key includes a hash of the stylesheet source, so editing a
+stylesheet never serves a stale bundle.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from jinja2 import Environment, Template
+
+from backend.config import settings
+from backend.services.html_cache import HTMLRenderCache
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_BUNDLE_DIR = Path(__file__).parent.parent / "output" / "css_bundles"
+
+# Brand data read by the stylesheets; other brand fields don't affect CSS
+STYLESHEET_BRAND_FIELDS = ("color_palette", "typography")
+
+_CSS_STRING = re.compile(r"""('[^']*'|"[^"]*")""")
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+
+def stylesheet_for(template_file: str) -> str:
+    """Return the stylesheet template name for a page template."""
+    return "styles/" + template_file.rsplit(".", 1)[0] + ".css"
+
+
+def minify_css(css: str) -> str:
+    """
+    Minify CSS conservatively.
+
+    Strips comments and collapses whitespace, removes it around { } ; , >
+    and after ':' in declarations, and drops the last ';' of each block.
+    Quoted strings (content: '✓', font names) are left untouched, as are
+    operators inside calc().
+
+    Args:
+        css: Stylesheet text
+
+    Returns:
+        Minified stylesheet
+    """
+    parts = _CSS_STRING.split(_CSS_COMMENT.sub("", css))
+    for i in range(0, len(parts), 2):
+        code = _CSS_WHITESPACE.sub(" ", parts[i])
+        code = _CSS_PUNCTUATION.sub(r"\1", code)
+        # "prop: value" -> "prop:value"; a space before ':' (descendant
+        # pseudo-class selector) is significant and kept
+        code = code.replace(": ", ":").replace(";}", "}")
+        parts[i] = code
+    return "".join(parts).strip()
+
+
+def make_css_bundle_key(
+    stylesheet: str,
+    source_digest: str,
+    brand: Dict[str, Any],
+    layout_params: Dict[str, Any]
+) -> str:
+    """
+    Build the content-addressed key of a compiled stylesheet.
+
+    Args:
+        stylesheet: Stylesheet template name (see stylesheet_for)
+        source_digest: Hash of the stylesheet template source
+        brand: Prepared brand data (only STYLESHEET_BRAND_FIELDS are used)
+        layout_params: Merged layout parameters
+
+    Returns:
+        Hex digest key
+    """
+    brand_styling = {field: brand.get(field) for field in STYLESHEET_BRAND_FIELDS}
+    payload = json.dumps(
+        [stylesheet, source_digest, brand_styling, layout_params],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CSSBundleStore:
+    """
+    Compiles, stores and caches minified per-brand stylesheets.
+
+    Usage:
+        css = css_bundles.get(env, "onepager_bold.html", brand_dict, layout_params)
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = 4 * 1024 * 1024):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory for stored bundles ("" or None = backend/output/css_bundles)
+            max_bytes: In-memory LRU size bound (0 disables the memory layer)
+        """
+        self.root = Path(root) if root else DEFAULT_BUNDLE_DIR
+        self._memory = HTMLRenderCache(max_bytes=max_bytes)
+        self._source_digests: Dict[str, Tuple[Template, str]] = {}
+        self._lock = threading.Lock()
+        self.compiled = 0
+        self.disk_hits = 0
+
+    def _source_digest(self, env: Environment, stylesheet: str, template: Template) -> str:
+        """Hash the stylesheet source once per loaded template object."""
+        with self._lock:
+            entry = self._source_digests.get(stylesheet)
+            if entry is not None and entry[0] is template:
+                return entry[1]
+
+        source, _, _ = env.loader.get_source(env, stylesheet)
+        digest = hashlib.sha256(source.encode()).hexdigest()[:16]
+        with self._lock:
+            self._source_digests[stylesheet] = (template, digest)
+        return digest
+
+    def get(
+        self,
+        env: Environment,
+        template_file: str,
+        brand: Dict[str, Any],
+        layout_params: Dict[str, Any]
+    ) -> str:
+        """
+        Return the minified stylesheet for a page template and brand.
+
+        Args:
+            env: Jinja environment of the PDF templates
+            template_file: Page template (e.g. onepager_bold.html)
+            brand: Prepared brand data
+            layout_params: Merged layout parameters
+
+        Returns:
+            Minified CSS
+        """
+        stylesheet = stylesheet_for(template_file)
+        template = env.get_template(stylesheet)
+        key = make_css_bundle_key(
+            stylesheet, self._source_digest(env, stylesheet, template), brand, layout_params
+        )
+
+        css = self._memory.get(key)
+        if css is not None:
+            return css
+
+        path = self.root / f"{key}.css"
+        try:
+            css = path.read_text(encoding="utf-8")
+            self.disk_hits += 1
+        except FileNotFoundError:
+            css = minify_css(template.render(brand=brand, layout_params=layout_params))
+            self.compiled += 1
+            try:
+                self._write(path, css)
+            except OSError as e:
+                logger.warning(f"⚠️ Failed to store CSS bundle {key[:12]}: {e}")
+
+        self._memory.put(key, css)
+        return css
+
+    def _write(self, path: Path, css: str) -> None:
+        """Write a bundle atomically (concurrent writers produce identical files)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(css)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        """Return bundle counters for health checks."""
+        return {
+            **self._memory.stats(),
+            "compiled": self.compiled,
+            "disk_hits": self.disk_hits
+        }
+
+
+# Singleton instance used by PDFHTMLGenerator
+css_bundles = CSSBundleStore(
+    root=Path(settings.css_bundle_dir) if settings.css_bundle_dir else None,
+    max_bytes=settings.css_bundle_cache_max_bytes
+)
@@ -0,0 +1,78 @@
+"""
+ETag Service
+============
+
+ETags and If-None-Match checks for conditional GETs.
+
+The editor re-fetches one-pagers, brand kits and HTML previews constantly,
+and most of those responses haven't changed. Endpoints derive an ETag from
+what their body depends on (updated_at, render cache key) right after
+the ownership check and answer 304 Not Modified on a match, before any
+Pydantic validation or Jinja rendering:
+
+    etag = make_etag("onepager", doc["_id"], doc["updated_at"])
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+Export endpoints use their content-addressed cache keys as ETags and share
+the same If-None-Match check.
+
+An ETag is strong only when it covers every byte of the body. Bodies with
+fields that change without updated_at (a one-pager's last_accessed,
+written by the access tracker) get a weak ETag: the 304 means "no edits
+since", not "byte-identical".
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response, status
+
+
+# Conditional responses carry user data: browsers may store them but must revalidate
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+    """
+    Build an ETag from the values a response body depends on.
+
+    Args:
+        *parts: Values identifying the body (ids, timestamps, cache keys)
+        weak: Build a weak ETag (W/"..."), for bodies the parts don't fully determine
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'{"W/" if weak else ""}"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    proxies that weaken ETags (W/"...") still get 304s.
+
+    Args:
+        if_none_match: Request header value (None if absent)
+        etag: Current quoted ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in [tag.removeprefix("W/") for tag in tags]
+
+
+def not_modified(etag: str) -> Response:
+    """Return an empty 304 Not Modified response for an ETag."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
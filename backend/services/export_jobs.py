@@ -0,0 +1,361 @@
+"""
+Export Job Worker Service
+=========================
+
+In-process worker pool draining background PDF export jobs.
+
+Job documents live in the export_jobs MongoDB collection, so the queue
+survives restarts and is shared by every API process:
+- Workers claim the oldest queued job with an atomic find_one_and_update
+  and hold a lease (export_job_lease_seconds) while rendering
+- Every claim gets its own lease_id; a worker only writes to a job while
+  it still holds that lease
+- A heartbeat extends the leases of jobs being rendered, so long renders
+  are not claimed a second time
+- Jobs whose lease expired (process crashed or hung mid-render) are
+  reclaimed, or marked failed once they used export_job_max_attempts
+- On graceful shutdown, jobs still running in this process are requeued
+  without consuming an attempt
+- Failed renders are retried up to export_job_max_attempts times
+
+The HTML is rendered when the job is submitted and stored on the job, so
+workers only run the slow HTML -> PDF step (through the browser pool and
+PDF cache). Completed PDFs are stored on the job document and expire with
+it (TTL index on expires_at).
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from bson import Binary
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from backend.config import settings
+from backend.models.export_job import ExportJobStatus
+from backend.services.pdf_cache import pdf_cache
+from backend.services.pdf_generator import PDFGenerator
+
+
+logger = logging.getLogger(__name__)
+
+
+class ExportJobWorkerPool:
+    """
+    Pool of asyncio workers rendering queued export jobs.
+
+    Usage:
+        await export_job_workers.start(db)   # FastAPI lifespan startup
+        export_job_workers.notify()          # after inserting a queued job
+        await export_job_workers.stop()      # FastAPI lifespan shutdown
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 2,
+        poll_interval: float = 2.0,
+        lease_seconds: int = 300,
+        max_attempts: int = 3,
+        retention_hours: int = 24
+    ):
+        """
+        Initialize the worker pool (workers are spawned by start()).
+
+        Args:
+            concurrency: Number of jobs rendered in parallel by this process
+            poll_interval: Seconds between queue polls when idle
+            lease_seconds: How long a claimed job is owned before it can be reclaimed
+            max_attempts: Render attempts before a job is marked failed
+            retention_hours: How long finished jobs (and their PDFs) are kept
+        """
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retention_hours = retention_hours
+
+        # Identifies this process on leased jobs (diagnostics only, ownership is per lease_id)
+        self.worker_id = uuid.uuid4().hex
+
+        self._db: Optional[AsyncIOMotorDatabase] = None
+        self._tasks: List[asyncio.Task] = []
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        # Job _id -> lease_id of the jobs this process is rendering
+        self._active_jobs: Dict[Any, str] = {}
+
+    async def start(self, db: AsyncIOMotorDatabase) -> None:
+        """Spawn worker tasks and pick up jobs left over from a previous run."""
+        if self._tasks or self.concurrency <= 0:
+            return
+
+        self._db = db
+        self._wakeup = asyncio.Event()
+
+        requeued = await self.requeue_expired()
+        if requeued:
+            logger.info(f"♻️ Requeued {requeued} unfinished export job(s)")
+
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(i), name=f"export-job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        self._heartbeat = asyncio.create_task(self._heartbeat_loop(), name="export-job-heartbeat")
+        logger.info(f"✅ Export job workers started ({self.concurrency})")
+
+    async def stop(self) -> None:
+        """Cancel workers and requeue jobs this process was rendering."""
+        if not self._tasks:
+            return
+
+        tasks = self._tasks + [self._heartbeat]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._heartbeat = None
+
+        if self._active_jobs and self._db is not None:
+            # Interrupted by shutdown, not by the job: give the attempt back
+            await self._db.export_jobs.update_many(
+                {"lease_id": {"$in": list(self._active_jobs.values())}, "status": ExportJobStatus.RUNNING.value},
+                {
+                    "$set": {
+                        "status": ExportJobStatus.QUEUED.value,
+                        "stage": "requeued",
+                        "progress": 0,
+                        "updated_at": datetime.now(timezone.utc)
+                    },
+                    "$unset": {"lease_id": "", "lease_expires_at": ""},
+                    "$inc": {"attempts": -1}
+                }
+            )
+            logger.info(f"♻️ Requeued {len(self._active_jobs)} in-flight export job(s) on shutdown")
+            self._active_jobs.clear()
+
+        logger.info("✅ Export job workers stopped")
+
+    def notify(self) -> None:
+        """Wake idle workers after a job was queued."""
+        self._wakeup.set()
+
+    async def requeue_expired(self) -> int:
+        """
+        Return running jobs with an expired lease to the queue.
+
+        Jobs that already used max_attempts (their worker crashed or hung on
+        every attempt) are marked failed instead.
+
+        Returns:
+            Number of requeued jobs
+        """
+        now = datetime.now(timezone.utc)
+        expired = {"status": ExportJobStatus.RUNNING.value, "lease_expires_at": {"$lt": now}}
+
+        failed = await self._db.export_jobs.update_many(
+            {**expired, "attempts": {"$gte": self.max_attempts}},
+            {
+                "$set": {
+                    "status": ExportJobStatus.FAILED.value,
+                    "stage": "failed",
+                    "error": "Render did not finish before its lease expired",
+                    "finished_at": now,
+                    "expires_at": now + timedelta(hours=self.retention_hours),
+                    "updated_at": now
+                },
+                "$unset": {"html": "", "lease_id": "", "lease_expires_at": ""}
+            }
+        )
+        if failed.modified_count:
+            logger.error(f"❌ Failed {failed.modified_count} export job(s) that exhausted their attempts")
+
+        result = await self._db.export_jobs.update_many(
+            {**expired, "attempts": {"$lt": self.max_attempts}},
+            {
+                "$set": {
+                    "status": ExportJobStatus.QUEUED.value,
+                    "stage": "requeued",
+                    "progress": 0,
+                    "updated_at": now
+                },
+                "$unset": {"lease_id": "", "lease_expires_at": ""}
+            }
+        )
+        return result.modified_count
+
+    async def renew_leases(self) -> None:
+        """Extend the leases of jobs this process is rendering."""
+        if not self._active_jobs:
+            return
+        now = datetime.now(timezone.utc)
+        await self._db.export_jobs.update_many(
+            {"lease_id": {"$in": list(self._active_jobs.values())}, "status": ExportJobStatus.RUNNING.value},
+            {"$set": {"lease_expires_at": now + timedelta(seconds=self.lease_seconds)}}
+        )
+
+    # ------------------------------------------------------------------
+    # Worker internals
+    # ------------------------------------------------------------------
+
+    async def _heartbeat_loop(self) -> None:
+        """Renew leases a few times per lease period and sweep expired jobs."""
+        interval = max(self.lease_seconds / 3, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.renew_leases()
+                if await self.requeue_expired():
+                    self.notify()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Export job heartbeat failed: {e}")
+
+    async def _worker_loop(self, index: int) -> None:
+        while True:
+            try:
+                job = await self._claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Export worker {index}: failed to claim job: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self._active_jobs[job["_id"]] = job["lease_id"]
+            try:
+                await self._run(job)
+            finally:
+                self._active_jobs.pop(job["_id"], None)
+
+    async def _claim(self) -> Optional[Dict[str, Any]]:
+        """Atomically lease the oldest queued (or abandoned) job."""
+        now = datetime.now(timezone.utc)
+        return await self._db.export_jobs.find_one_and_update(
+            {"$or": [
+                {"status": ExportJobStatus.QUEUED.value},
+                # Abandoned jobs that exhausted their attempts are failed by requeue_expired()
+                {
+                    "status": ExportJobStatus.RUNNING.value,
+                    "lease_expires_at": {"$lt": now},
+                    "attempts": {"$lt": self.max_attempts}
+                }
+            ]},
+            {
+                "$set": {
+                    "status": ExportJobStatus.RUNNING.value,
+                    "stage": "claimed",
+                    "progress": 10,
+                    "worker_id": self.worker_id,
+                    "lease_id": uuid.uuid4().hex,
+                    "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                    "started_at": now,
+                    "updated_at": now
+                },
+                "$inc": {"attempts": 1}
+            },
+            projection={"result_pdf": 0},
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def _update(self, job: Dict[str, Any], fields: Dict[str, Any], unset: Optional[Dict] = None):
+        """Update a job this worker still holds the lease of."""
+        fields["updated_at"] = datetime.now(timezone.utc)
+        update = {"$set": fields}
+        if unset:
+            update["$unset"] = unset
+        await self._db.export_jobs.update_one(
+            {"_id": job["_id"], "lease_id": job["lease_id"]},
+            update
+        )
+
+    async def _run(self, job: Dict[str, Any]) -> None:
+        """Render one job and persist the outcome."""
+        job_id = str(job["_id"])
+        logger.info(f"📄 Export job {job_id}: rendering ({job['format']}, attempt {job['attempts']})")
+
+        try:
+            await self._update(job, {"stage": "rendering_pdf", "progress": 50})
+
+            pdf_bytes = await pdf_cache.get(job["cache_key"])
+            if pdf_bytes is None:
+                # Jobs are already bounded by the worker count: wait, never reject
+                pdf_bytes = await PDFGenerator().generate_pdf(
+                    job["html"],
+                    page_format=job["format"],
+                    user_id=str(job["user_id"]),
+                    bounded_queue=False
+                )
+                await pdf_cache.put(job["cache_key"], pdf_bytes)
+
+            now = datetime.now(timezone.utc)
+            await self._update(
+                job,
+                {
+                    "status": ExportJobStatus.COMPLETED.value,
+                    "stage": "completed",
+                    "progress": 100,
+                    "result_pdf": Binary(pdf_bytes),
+                    "size_bytes": len(pdf_bytes),
+                    "error": None,
+                    "finished_at": now,
+                    "expires_at": now + timedelta(hours=self.retention_hours)
+                },
+                unset={"html": "", "lease_expires_at": ""}
+            )
+            logger.info(f"✅ Export job {job_id}: completed ({len(pdf_bytes) / 1024:.1f} KB)")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            now = datetime.now(timezone.utc)
+            if job.get("attempts", 1) >= self.max_attempts:
+                logger.error(f"❌ Export job {job_id}: failed permanently: {e}")
+                await self._update(
+                    job,
+                    {
+                        "status": ExportJobStatus.FAILED.value,
+                        "stage": "failed",
+                        "error": str(e),
+                        "finished_at": now,
+                        "expires_at": now + timedelta(hours=self.retention_hours)
+                    },
+                    unset={"html": "", "lease_expires_at": ""}
+                )
+            else:
+                logger.warning(f"⚠️ Export job {job_id}: attempt {job.get('attempts')} failed, requeueing: {e}")
+                await self._update(job, {
+                    "status": ExportJobStatus.QUEUED.value,
+                    "stage": "retrying",
+                    "progress": 0,
+                    "error": str(e)
+                }, unset={"lease_id": "", "lease_expires_at": ""})
+                self.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return worker counters for health checks."""
+        return {
+            "workers": len(self._tasks),
+            "active_jobs": len(self._active_jobs)
+        }
+
+
+# Singleton instance, started in backend/main.py lifespan
+export_job_workers = ExportJobWorkerPool(
+    concurrency=settings.export_job_workers,
+    poll_interval=settings.export_job_poll_seconds,
+    lease_seconds=settings.export_job_lease_seconds,
+    max_attempts=settings.export_job_max_attempts,
+    retention_hours=settings.export_job_retention_hours
+)
@@ -0,0 +1,97 @@
+"""
+Fast JSON Service
+=================
+
+Single-pass JSON responses for the read-heavy endpoints.
+
+Routes used to build their response model from the database document
+(OnePagerResponse(**onepager_helper(doc))) and return it, after which
+FastAPI ran it through response_model validation and serialization again
+(on FastAPI versions without the pydantic-core fast path: a JSON-mode
+dump to Python objects, then json.dumps). Trusted documents now skip the
+framework's pass:
+
+- model_response() validates the helper output once (defaults, aliases,
+  dropping internal fields such as generation_metadata.product_id) and
+  encodes it straight to bytes with pydantic-core; returning a Response
+  bypasses FastAPI's validation and serialization. The body is identical
+  to what the response_model would produce.
+- ORJSONResponse encodes plain data with orjson, for responses whose
+  helper already produces the exact response shape (flat list summaries),
+  so no model is built at all.
+
+ORJSONResponse is deliberately not the app's default_response_class:
+recent FastAPI versions encode response_model routes with pydantic-core
+directly, and any custom response class turns that path off (measured
+slower for nested models).
+
+Usage:
+    return model_response(OnePagerResponse, onepager_helper(doc), headers={"ETag": etag})
+    return ORJSONResponse([onepager_summary_helper(doc) for doc in docs])
+
+Benchmark: backend/scripts/benchmark_json_responses.py
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import orjson
+from bson import ObjectId
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+# OPT_UTC_Z matches Pydantic's "Z" suffix for UTC datetimes
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson doesn't handle natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with orjson."""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (datetimes, enums and ObjectIds included)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def model_response(
+    response_type: Any,
+    data: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Validate trusted data once against a response model and send it as JSON.
+
+    Args:
+        response_type: Response model (or e.g. List[Model]) the route declares
+        data: Helper output for the model (e.g. onepager_helper(doc))
+        status_code: HTTP status code
+        headers: Extra response headers (a returned Response ignores headers set on the injected one)
+
+    Returns:
+        Response with the same body FastAPI would produce for the response_model
+    """
+    adapter = _adapter(response_type)
+    body = adapter.dump_json(adapter.validate_python(data), by_alias=True)
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
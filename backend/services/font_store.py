@@ -0,0 +1,344 @@
+"""
+Font Store Service
+==================
+
+Local, offline copy of Google Fonts served to Chromium through Playwright
+request routing.
+
+PDF templates link fonts.googleapis.com for the brand kit's heading/body
+fonts. Instead of hitting the CDN on every render, the PDF engine routes:
+- https://fonts.googleapis.com/css2?... -> @font-face CSS generated locally
+- https://fonts.gstatic.com/local/...   -> woff2 bytes from the local store
+
+Store layout (populated by backend/scripts/download_fonts.py, a required
+setup/build step):
+    backend/assets/fonts/<Family Name>/<weight>.woff2
+
+Font bytes are kept in an in-memory LRU bounded by font_cache_max_bytes.
+Rendering is offline by default: families missing from the store resolve
+to empty CSS (system fallback), so a render never waits on a CDN. Setting
+font_store_offline=False opts in to letting css2 requests that name a
+missing family fall through to the network.
+
+Family names come from intercepted URLs; only names of directories that
+exist in the store are ever joined into a path.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+GOOGLE_FONTS_CSS_PATTERN = "https://fonts.googleapis.com/**"
+GOOGLE_FONTS_FILE_PATTERN = "https://fonts.gstatic.com/**"
+
+# Synthetic URL prefix for fonts served from the local store
+LOCAL_FONT_URL_PREFIX = "https://fonts.gstatic.com/local/"
+
+DEFAULT_FONT_DIR = Path(__file__).parent.parent / "assets" / "fonts"
+
+# Fonts of the default brand kit, which every template falls back to
+DEFAULT_FAMILIES = ["Montserrat", "Inter"]
+
+
+def parse_css2_query(query: str) -> List[Tuple[str, List[int]]]:
+    """
+    Parse a Google Fonts css2 query string into (family, weights) pairs.
+
+    Supports "Inter", "Inter:wght@400;700" and "Inter:ital,wght@0,400;1,700"
+    (italic variants are ignored, the store only holds upright fonts).
+
+    Example:
+        >>> parse_css2_query("family=Open+Sans:wght@400;600&display=swap")
+        [('Open Sans', [400, 600])]
+    """
+    families = []
+    for spec in parse_qs(query).get("family", []):
+        name, _, axes = spec.partition(":")
+        weights = []
+        if "@" in axes:
+            axis_names, _, values = axes.partition("@")
+            axis_names = axis_names.split(",")
+            for value in values.split(";"):
+                parts = value.split(",")
+                if len(parts) != len(axis_names):
+                    continue
+                tuple_values = dict(zip(axis_names, parts))
+                if tuple_values.get("ital", "0") != "0":
+                    continue
+                weight = tuple_values.get("wght", "400")
+                if weight.isdigit():
+                    weights.append(int(weight))
+        families.append((name.strip(), sorted(set(weights)) or [400]))
+    return families
+
+
+class _ByteLRU:
+    """Thread-safe LRU cache bounded by total value size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._items: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old)
+            self._items[key] = value
+            self.current_bytes += len(value)
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.current_bytes -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class FontStore:
+    """
+    Local Google Fonts store with Playwright request routing.
+
+    Usage:
+        store = FontStore(Path("backend/assets/fonts"))
+        store.install_routes(browser_context)   # or a Page
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_cache_bytes: int = 32 * 1024 * 1024,
+        offline: bool = True
+    ):
+        """
+        Initialize the font store.
+
+        Args:
+            root: Directory containing <Family>/<weight>.woff2 files
+            max_cache_bytes: Size bound of the in-memory font bytes LRU
+            offline: Never fall through to the network for missing fonts
+                (False lets the CDN serve them)
+        """
+        self.root = Path(root) if root else DEFAULT_FONT_DIR
+        self.offline = offline
+        self._cache = _ByteLRU(max_cache_bytes)
+        self._families: Optional[Dict[str, Path]] = None
+        self._weights: Dict[str, List[int]] = {}
+        self._weights_lock = threading.Lock()
+        self._warned_missing = set()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Store lookups
+    # ------------------------------------------------------------------
+
+    def families(self) -> Dict[str, Path]:
+        """Map stored family names to their directories (scanned once)."""
+        with self._weights_lock:
+            if self._families is None:
+                self._families = {}
+                if self.root.is_dir():
+                    self._families = {
+                        path.name: path for path in self.root.iterdir()
+                        if path.is_dir() and not path.name.startswith(".")
+                    }
+            return self._families
+
+    def _family_dir(self, family: str) -> Optional[Path]:
+        """Directory of a stored family; names from URLs never reach the filesystem otherwise."""
+        if not family or "/" in family or "\\" in family or ".." in family:
+            return None
+        return self.families().get(family)
+
+    def available_weights(self, family: str) -> List[int]:
+        """List weights stored for a family (directory scan cached per family)."""
+        family_dir = self._family_dir(family)
+        if family_dir is None:
+            return []
+        with self._weights_lock:
+            if family not in self._weights:
+                self._weights[family] = sorted(
+                    int(path.stem) for path in family_dir.glob("*.woff2")
+                    if path.stem.isdigit()
+                )
+            return self._weights[family]
+
+    def fingerprint(self) -> str:
+        """
+        Identify the store's contents (families and weights).
+
+        Part of the PDF cache key, so PDFs rendered with fallback fonts are
+        re-rendered once the store gains their families.
+        """
+        contents = sorted((family, self.available_weights(family)) for family in self.families())
+        return hashlib.sha256(repr(contents).encode()).hexdigest()[:16]
+
+    def missing_defaults(self) -> List[str]:
+        """Default brand kit families that are not in the store."""
+        return [family for family in DEFAULT_FAMILIES if not self.available_weights(family)]
+
+    def check(self) -> None:
+        """Log the store's state at startup (warns when default fonts are missing)."""
+        families = self.families()
+        missing = self.missing_defaults()
+        if not missing:
+            logger.info(f"✅ Font store: {len(families)} families in {self.root}")
+            return
+        fallback = "system fonts" if self.offline else "the Google Fonts CDN"
+        state = "is empty" if not families else f"lacks {', '.join(missing)}"
+        logger.warning(
+            f"⚠️ Font store {self.root} {state}, those fonts come from {fallback} "
+            f"(run python -m backend.scripts.download_fonts)"
+        )
+
+    def get_font_bytes(self, family: str, weight: int) -> Optional[bytes]:
+        """Return woff2 bytes for a stored family/weight (LRU cached)."""
+        key = f"{family}/{weight}"
+        data = self._cache.get(key)
+        if data is not None:
+            self.hits += 1
+            return data
+
+        family_dir = self._family_dir(family)
+        if family_dir is None:
+            return None
+        path = family_dir / f"{int(weight)}.woff2"
+        if not path.is_file():
+            return None
+
+        self.misses += 1
+        data = path.read_bytes()
+        self._cache.put(key, data)
+        return data
+
+    def build_css(self, query: str) -> Tuple[str, List[str]]:
+        """
+        Build @font-face CSS for a css2 query from the local store.
+
+        Each requested weight maps to the nearest stored weight.
+
+        Returns:
+            Tuple of (css text, families missing from the store)
+        """
+        rules = []
+        missing = []
+        for family, weights in parse_css2_query(query):
+            stored = self.available_weights(family)
+            if not stored:
+                missing.append(family)
+                continue
+            for weight in weights:
+                nearest = min(stored, key=lambda w: (abs(w - weight), w))
+                url = f"{LOCAL_FONT_URL_PREFIX}{quote(family)}/{nearest}.woff2"
+                rules.append(
+                    "@font-face {\n"
+                    f"  font-family: '{family}';\n"
+                    "  font-style: normal;\n"
+                    f"  font-weight: {weight};\n"
+                    "  font-display: block;\n"
+                    f"  src: url({url}) format('woff2');\n"
+                    "}"
+                )
+        return "\n".join(rules), missing
+
+    # ------------------------------------------------------------------
+    # Playwright routing
+    # ------------------------------------------------------------------
+
+    def install_routes(self, target: Any) -> None:
+        """
+        Route Google Fonts requests of a BrowserContext or Page to the store.
+
+        Works with both the sync and async Playwright APIs (handlers return
+        route.fulfill()/continue_() results, which async Playwright awaits).
+        """
+        target.route(GOOGLE_FONTS_CSS_PATTERN, self._handle_css)
+        target.route(GOOGLE_FONTS_FILE_PATTERN, self._handle_font)
+
+    async def async_install_routes(self, target: Any) -> None:
+        """Async Playwright variant of install_routes()."""
+        await target.route(GOOGLE_FONTS_CSS_PATTERN, self._handle_css)
+        await target.route(GOOGLE_FONTS_FILE_PATTERN, self._handle_font)
+
+    def _handle_css(self, route: Any, request: Any = None):
+        url = urlsplit(route.request.url)
+        css, missing = self.build_css(url.query)
+
+        if missing:
+            new_missing = [f for f in missing if f not in self._warned_missing]
+            if new_missing:
+                self._warned_missing.update(new_missing)
+                logger.warning(
+                    f"⚠️ Fonts not in local store: {new_missing} "
+                    f"(run backend/scripts/download_fonts.py)"
+                )
+            # Google's stylesheet covers every requested family
+            if not self.offline:
+                return route.continue_()
+
+        return route.fulfill(
+            status=200,
+            content_type="text/css; charset=utf-8",
+            headers={"Access-Control-Allow-Origin": "*"},
+            body=css
+        )
+
+    def _handle_font(self, route: Any, request: Any = None):
+        url = route.request.url
+        if url.startswith(LOCAL_FONT_URL_PREFIX):
+            family, _, filename = unquote(url[len(LOCAL_FONT_URL_PREFIX):]).rpartition("/")
+            weight = filename.split(".")[0]
+            data = self.get_font_bytes(family, int(weight)) if weight.isdigit() else None
+            if data is not None:
+                return route.fulfill(
+                    status=200,
+                    content_type="font/woff2",
+                    headers={"Access-Control-Allow-Origin": "*"},
+                    body=data
+                )
+            return route.fulfill(status=404, body="")
+
+        if self.offline:
+            return route.abort()
+        return route.continue_()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for health checks and metrics."""
+        return {
+            "root": str(self.root),
+            "offline": self.offline,
+            "families": len(self.families()),
+            "cached_fonts": len(self._cache),
+            "cached_bytes": self._cache.current_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Singleton instance used by the PDF engine
+font_store = FontStore(
+    root=Path(settings.font_store_dir) if settings.font_store_dir else None,
+    max_cache_bytes=settings.font_cache_max_bytes,
+    offline=settings.font_store_offline
+)
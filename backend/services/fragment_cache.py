@@ -0,0 +1,121 @@
+"""
+Template Fragment Cache Service
+===============================
+
+Per-section cache of rendered PDF template markup.
+
+The whole-page HTML cache (html_cache.py) misses on every edit, because
+each write bumps updated_at. While a user types into one section, the
+other sections are unchanged yet were re-rendered every time. Templates
+now wrap each section's markup in a fragment tag:
+
+    {% fragment element %}
+        <div class="section-card">...</div>
+    {% endfragment %}
+
+The rendered markup is cached under a hash of:
+- The fragment scope (template, brand data, key stats, one-pager title:
+  everything a section body may read besides its own element)
+- The fragment's template name and line number
+- The tag arguments (the element dict, plus loop.first where it matters)
+
+The page shell (head CSS, layout columns) is rendered on every request;
+only sections whose content changed are rendered again. Memory is bounded
+by html_fragment_cache_max_bytes with least-recently-used eviction.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from jinja2.runtime import Undefined
+from markupsafe import Markup
+
+from backend.config import settings
+from backend.services.html_cache import HTMLRenderCache
+
+
+# Brand document metadata: the default brand kit gets fresh values per
+# request and no template reads them, so they stay out of the scope hash
+BRAND_METADATA_FIELDS = ("id", "_id", "user_id", "is_active", "created_at", "updated_at")
+
+
+def _digest(value: Any) -> str:
+    """Stable hash of JSON-like template data."""
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def make_fragment_scope(
+    template_file: str,
+    brand: Dict[str, Any],
+    key_stats: List[Dict[str, str]],
+    title: str
+) -> str:
+    """
+    Hash the template data shared by every fragment of one render.
+
+    Args:
+        template_file: Template being rendered
+        brand: Prepared brand data (see PDFHTMLGenerator._prepare_brand_data)
+        key_stats: Extracted key statistics
+        title: One-pager title
+
+    Returns:
+        Scope hash, passed to the template as fragment_scope
+    """
+    brand_styling = {k: v for k, v in brand.items() if k not in BRAND_METADATA_FIELDS}
+    return _digest([template_file, brand_styling, key_stats, title])
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Jinja extension adding {% fragment args... %}...{% endfragment %}.
+
+    Without a fragment_scope in the render context the body is rendered
+    as-is, so templates keep working for callers that skip caching.
+    """
+
+    tags = {"fragment"}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=fragment_cache)
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+
+        parts = [
+            nodes.Name("fragment_scope", "load"),
+            nodes.Const(f"{parser.name}:{lineno}")
+        ]
+        while parser.stream.current.type != "block_end":
+            if len(parts) > 2:
+                parser.stream.expect("comma")
+            parts.append(parser.parse_expression())
+
+        body = parser.parse_statements(("name:endfragment",), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method("_render_fragment", [nodes.List(parts)]), [], [], body
+        ).set_lineno(lineno)
+
+    def _render_fragment(self, parts: List[Any], caller) -> str:
+        scope = parts[0]
+        if isinstance(scope, Undefined) or not scope:
+            return caller()
+
+        cache = self.environment.fragment_cache
+        key = _digest(parts)
+        cached = cache.get(key)
+        if cached is not None:
+            return Markup(cached)
+
+        rendered = caller()
+        cache.put(key, str(rendered))
+        return rendered
+
+
+# Singleton instance shared by every PDFHTMLGenerator environment
+fragment_cache = HTMLRenderCache(max_bytes=settings.html_fragment_cache_max_bytes)
@@ -0,0 +1,168 @@
+"""
+Rendered HTML Cache Service
+===========================
+
+In-memory LRU cache of one-pager print HTML.
+
+The preview iframe reloads on every edit and exports usually follow a
+preview, yet both rebuilt OnePagerLayout, BrandKitInDB and the full
+template render each time. render_onepager_html() now looks here first.
+
+Cache key (see make_html_cache_key):
+- One-pager _id + updated_at (every content/layout write bumps updated_at),
+  or its render_hash when the stored render snapshot is current
+- Brand kit _id + updated_at, or "default" for the fallback styling
+- Template name
+- Hash of layout_params
+- Current year (templates print a copyright year)
+
+HTML does not depend on the page format (format is a print option), so
+one entry serves letter, A4 and tabloid exports alike. Memory is bounded
+by html_cache_max_bytes with least-recently-used eviction.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from backend.config import settings
+from backend.services.render_snapshot import get_render_snapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+def brand_kit_cache_part(onepager_doc: Dict[str, Any], brand_kit_doc: Dict[str, Any]) -> str:
+    """
+    Identify the brand kit version a one-pager renders with.
+
+    The default brand kit gets a fresh ObjectId per request; its styling
+    only depends on the one-pager (title), which the one-pager's updated_at
+    already covers, so it is keyed as "default".
+    """
+    brand_kit_id = onepager_doc.get("brand_kit_id")
+    if brand_kit_id is not None and str(brand_kit_doc.get("_id")) == str(brand_kit_id):
+        return f"{brand_kit_id}@{brand_kit_doc.get('updated_at')}"
+    return "default"
+
+
+def make_html_cache_key(
+    onepager_doc: Dict[str, Any],
+    brand_kit_doc: Dict[str, Any],
+    template_name: str
+) -> Optional[str]:
+    """
+    Build the cache key for a rendered one-pager.
+
+    Args:
+        onepager_doc: Raw MongoDB one-pager document
+        brand_kit_doc: Brand kit document (real or default, see get_brand_kit_doc)
+        template_name: Template style
+
+    Returns:
+        Key string, or None if the document has no updated_at (not cacheable)
+    """
+    onepager_updated = onepager_doc.get("updated_at")
+    if onepager_updated is None:
+        return None
+
+    brand_part = brand_kit_cache_part(onepager_doc, brand_kit_doc)
+
+    # The snapshot hash covers content, key stats and layout_params, so
+    # writes that don't change the rendered result keep the cached HTML
+    snapshot = get_render_snapshot(onepager_doc)
+    if snapshot is not None:
+        return "|".join([snapshot["hash"], brand_part, template_name, str(datetime.now().year)])
+
+    layout_params = json.dumps(onepager_doc.get("layout_params") or {}, sort_keys=True, default=str)
+    layout_hash = hashlib.sha1(layout_params.encode()).hexdigest()[:16]
+
+    return "|".join([
+        f"{onepager_doc['_id']}@{onepager_updated}",
+        brand_part,
+        template_name,
+        layout_hash,
+        str(datetime.now().year)
+    ])
+
+
+class HTMLRenderCache:
+    """
+    Thread-safe LRU of rendered HTML strings, bounded by total size.
+
+    Usage:
+        key = make_html_cache_key(onepager_doc, brand_kit_doc, template)
+        html = html_render_cache.get(key)
+        if html is None:
+            html = render(...)
+            html_render_cache.put(key, html)
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Total size bound before LRU eviction (0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._items: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Return cached HTML and mark it as recently used."""
+        if key is None or self.max_bytes <= 0:
+            return None
+        with self._lock:
+            html = self._items.get(key)
+            if html is None:
+                self._misses += 1
+                return None
+            self._items.move_to_end(key)
+            self._hits += 1
+            return html
+
+    def put(self, key: Optional[str], html: str) -> None:
+        """Store HTML, evicting least recently used entries over the bound."""
+        size = len(html)
+        if key is None or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old)
+            self._items[key] = html
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._items.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for health checks."""
+        return {
+            "entries": len(self._items),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions
+        }
+
+
+# Singleton instance shared by preview, export, batch and background jobs
+html_render_cache = HTMLRenderCache(max_bytes=settings.html_cache_max_bytes)
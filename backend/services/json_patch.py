@@ -0,0 +1,134 @@
+"""
+JSON Patch Service
+==================
+
+Minimal JSON Patch (RFC 6902) diff and apply for version deltas.
+
+Only the operations a diff needs are produced and applied: add, remove
+and replace, addressed by JSON Pointers (RFC 6901). make_patch() recurses
+into dicts and lists; for lists it trims the common prefix and suffix
+first, so inserting or deleting one section in the middle of
+content.sections produces a single add/remove instead of replacing every
+section after it.
+
+Usage:
+    patch = make_patch(previous_state, new_state)
+    state = apply_patch(copy.deepcopy(previous_state), patch)
+"""
+
+from typing import Any, Dict, List
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute the operations turning old into new.
+
+    Args:
+        old: Previous JSON-compatible value
+        new: New JSON-compatible value
+        path: JSON Pointer of old/new within the document (used in recursion)
+
+    Returns:
+        List of RFC 6902 operations (empty if equal)
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        start = 0
+        while start < len(old) and start < len(new) and old[start] == new[start]:
+            start += 1
+        old_end, new_end = len(old), len(new)
+        while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+
+        old_middle, new_middle = old[start:old_end], new[start:new_end]
+        if len(old_middle) == len(new_middle):
+            ops = []
+            for offset, (old_item, new_item) in enumerate(zip(old_middle, new_middle)):
+                ops.extend(make_patch(old_item, new_item, f"{path}/{start + offset}"))
+            return ops
+
+        # Remove from the back so earlier indexes stay valid, then insert in order
+        ops = [{"op": "remove", "path": f"{path}/{start + offset}"}
+               for offset in reversed(range(len(old_middle)))]
+        ops.extend({"op": "add", "path": f"{path}/{start + offset}", "value": item}
+                   for offset, item in enumerate(new_middle))
+        return ops
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(doc: Any, patch: List[Dict[str, Any]]) -> Any:
+    """
+    Apply operations produced by make_patch().
+
+    Modifies doc in place (pass a copy to keep the original) and stores
+    the patch values by reference.
+
+    Args:
+        doc: JSON-compatible document
+        patch: RFC 6902 add/remove/replace operations
+
+    Returns:
+        The patched document (a new object if the root was replaced)
+
+    Raises:
+        ValueError: If an operation is unsupported or doesn't fit the document
+    """
+    for op in patch:
+        if op["path"] == "":
+            if op["op"] != "replace":
+                raise ValueError(f"Unsupported root operation: {op['op']}")
+            doc = op["value"]
+            continue
+
+        *parents, last = [_unescape(token) for token in op["path"].split("/")[1:]]
+        target = doc
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+
+        try:
+            if isinstance(target, list):
+                index = len(target) if last == "-" else int(last)
+                if op["op"] == "add":
+                    target.insert(index, op["value"])
+                elif op["op"] == "remove":
+                    del target[index]
+                elif op["op"] == "replace":
+                    target[index] = op["value"]
+                else:
+                    raise ValueError(f"Unsupported operation: {op['op']}")
+            else:
+                if op["op"] in ("add", "replace"):
+                    target[last] = op["value"]
+                elif op["op"] == "remove":
+                    del target[last]
+                else:
+                    raise ValueError(f"Unsupported operation: {op['op']}")
+        except (IndexError, KeyError) as e:
+            raise ValueError(f"Patch does not apply at {op['path']}: {e}")
+
+    return doc
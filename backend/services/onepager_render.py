@@ -0,0 +1,197 @@
+"""
+One-Pager Render Service
+========================
+
+Turns stored one-pager documents into print HTML.
+
+Shared by HTML preview, PDF export, batch export and background export
+jobs so every path produces identical markup:
+- get_brand_kit_doc(): Brand Kit lookup with default styling fallback
+- render_onepager_html(): full HTML via the shared PDFHTMLGenerator from
+  the memoized render model (backend/services/render_model.py), cached in
+  the rendered-HTML cache (backend/services/html_cache.py)
+- stream_onepager_html(): the same HTML as a chunk stream (head first),
+  for the streaming preview
+- compile_brand_stylesheets(): build CSS bundles after a brand kit or
+  layout_params save (backend/services/css_bundles.py)
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from backend.services.pdf_html_generator import pdf_html_generator, stream_html_chunks
+from backend.services.render_model import build_brand_data, render_model_cache
+from backend.services.html_cache import html_render_cache, make_html_cache_key
+
+
+logger = logging.getLogger(__name__)
+
+
+# Default brand styling used when a one-pager has no (or a deleted) brand kit
+DEFAULT_BRAND_KIT_STYLE = {
+    "brand_voice": "Professional and engaging",
+    "color_palette": {
+        "primary": "#0ea5e9",
+        "secondary": "#64748b",
+        "accent": "#10b981",
+        "text": "#1f2937",
+        "background": "#ffffff"
+    },
+    "typography": {
+        "heading_font": "Montserrat",
+        "body_font": "Inter",
+        "heading_size": "32px",
+        "body_size": "16px"
+    }
+}
+
+
+async def get_brand_kit_doc(
+    db: AsyncIOMotorDatabase,
+    onepager_doc: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Fetch the one-pager's Brand Kit, falling back to default styling.
+
+    Args:
+        db: Database handle
+        onepager_doc: Raw MongoDB one-pager document
+
+    Returns:
+        Brand kit document (real or default)
+    """
+    brand_kit_doc = None
+    if onepager_doc.get("brand_kit_id"):
+        brand_kit_doc = await db.brand_kits.find_one({
+            "_id": onepager_doc["brand_kit_id"]
+        })
+
+        if not brand_kit_doc:
+            logger.warning(f"Brand Kit {onepager_doc['brand_kit_id']} not found, using defaults")
+
+    if brand_kit_doc:
+        return brand_kit_doc
+
+    now = datetime.now(timezone.utc)
+    return {
+        "_id": ObjectId(),  # Temporary ID for default brand kit
+        "user_id": onepager_doc["user_id"],  # Use the onepager's user_id
+        "company_name": onepager_doc.get("title", "Company"),
+        **DEFAULT_BRAND_KIT_STYLE,
+        "is_active": True,
+        "created_at": now,
+        "updated_at": now
+    }
+
+
+def render_onepager_html(
+    onepager_doc: Dict[str, Any],
+    brand_kit_doc: Dict[str, Any],
+    template_name: str
+) -> str:
+    """
+    Render the print HTML for a stored one-pager and brand kit.
+
+    Args:
+        onepager_doc: Raw MongoDB one-pager document
+        brand_kit_doc: Brand kit document (see get_brand_kit_doc)
+        template_name: Template style (minimalist, bold, business, product)
+
+    Returns:
+        Complete HTML string
+    """
+    cache_key = make_html_cache_key(onepager_doc, brand_kit_doc, template_name)
+    html = html_render_cache.get(cache_key)
+    if html is not None:
+        return html
+
+    # Trusted DB documents: mapped to template data without Pydantic validation
+    render_model = render_model_cache.get_or_build(onepager_doc, brand_kit_doc)
+
+    # Extract layout_params from database (if exists)
+    layout_params = onepager_doc.get("layout_params", {})
+    logger.debug(f"Layout params: {layout_params}")
+
+    html = pdf_html_generator.render_html(
+        render_model,
+        template_name=template_name,
+        layout_params=layout_params
+    )
+    html_render_cache.put(cache_key, html)
+    return html
+
+
+def stream_onepager_html(
+    onepager_doc: Dict[str, Any],
+    brand_kit_doc: Dict[str, Any],
+    template_name: str,
+    head_extra: str = ""
+) -> Iterator[str]:
+    """
+    Stream the print HTML for a stored one-pager, <head> first.
+
+    Serves cached HTML when available; otherwise renders with Jinja's
+    generate() and stores the complete document in the HTML cache once
+    the stream has been fully consumed.
+
+    Args:
+        onepager_doc: Raw MongoDB one-pager document
+        brand_kit_doc: Brand kit document (see get_brand_kit_doc)
+        template_name: Template style (minimalist, bold, business, product)
+        head_extra: Markup written into the stream just before </head>
+
+    Returns:
+        Iterator of HTML chunks (context errors raise before it is returned)
+    """
+    cache_key = make_html_cache_key(onepager_doc, brand_kit_doc, template_name)
+    html = html_render_cache.get(cache_key)
+    if html is not None:
+        return stream_html_chunks([html], head_extra)
+
+    render_model = render_model_cache.get_or_build(onepager_doc, brand_kit_doc)
+
+    chunks = pdf_html_generator.render_html_stream(
+        render_model,
+        template_name=template_name,
+        layout_params=onepager_doc.get("layout_params", {})
+    )
+
+    def cache_when_complete() -> Iterator[str]:
+        rendered = []
+        for chunk in chunks:
+            rendered.append(chunk)
+            yield chunk
+        html_render_cache.put(cache_key, "".join(rendered))
+
+    return stream_html_chunks(cache_when_complete(), head_extra)
+
+
+def compile_brand_stylesheets(
+    brand_kit_doc: Dict[str, Any],
+    template_names: Optional[List[str]] = None,
+    layout_params: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Compile the minified stylesheets for a saved brand kit / layout_params.
+
+    Runs as a background task after the save; a failure only means the
+    stylesheet is compiled lazily on the next render.
+
+    Args:
+        brand_kit_doc: Brand kit document (see get_brand_kit_doc)
+        template_names: Templates to compile (default: all)
+        layout_params: The one-pager's layout_params (optional)
+    """
+    try:
+        count = pdf_html_generator.compile_stylesheets(
+            build_brand_data(brand_kit_doc),
+            template_names=template_names,
+            layout_params=layout_params
+        )
+        logger.debug(f"Compiled {count} stylesheet(s) for brand kit {brand_kit_doc.get('_id')}")
+    except Exception as e:
+        logger.warning(f"⚠️ Stylesheet precompilation failed, compiling on next render: {e}")
@@ -0,0 +1,395 @@
+"""
+One-Pager Versions Service
+==========================
+
+Version snapshots stored in the onepager_versions collection.
+
+Snapshots used to be $push'ed into the one-pager's embedded
+version_history array, so every read of a one-pager loaded, validated and
+returned all past versions and heavily iterated documents grew toward the
+16 MB document limit. Each snapshot is now its own document, and most are
+stored as a JSON Patch against the previous version:
+
+    keyframe: {onepager_id, user_id, version, content, layout,
+               layout_params, created_at, change_description}
+    delta:    {onepager_id, user_id, version, keyframe_version, patch,
+               created_at, change_description}
+
+- Unique index on (onepager_id, version); the number comes from the
+  one-pager's version_count, incremented atomically by the edit itself
+  together with a pending_version marker (see onepager_writes.py)
+- Versions are written with an upsert on (onepager_id, version), so
+  writing one again (repairing a crash between the edit and its version
+  write) is a no-op
+- A full keyframe is stored every version_keyframe_interval versions, or
+  whenever the previous version can't be reconstructed (e.g. two edits
+  recording versions concurrently), so rebuilding a version replays at
+  most interval - 1 small patches (see json_patch.py)
+- The latest state per one-pager is kept in memory, so recording the next
+  version usually doesn't read history back
+- Listed newest first with skip/limit, fetched by number
+- One-pagers written before this change still carry version_history;
+  migrate_embedded_history() moves it here the first time their versions
+  are listed, fetched or restored (or run
+  backend/scripts/migrate_version_history.py). Full version documents
+  written before deltas existed are read as keyframes.
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from backend.config import settings
+from backend.services.json_patch import apply_patch, make_patch
+
+
+logger = logging.getLogger(__name__)
+
+
+# One-pager fields captured by a version, with defaults for missing ones
+STATE_DEFAULTS = {"content": {}, "layout": [], "layout_params": None}
+
+# Latest state per one-pager: onepager_id -> (version, keyframe_version, state)
+_LATEST_STATES_MAX = 256
+_latest_states: "OrderedDict[Any, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_latest_states_lock = threading.Lock()
+
+
+def version_state(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the versioned fields (content, layout, layout_params) of a document."""
+    return {
+        field: default if doc.get(field) is None else doc[field]
+        for field, default in STATE_DEFAULTS.items()
+    }
+
+
+def encode_version(
+    onepager_id: Any,
+    user_id: Any,
+    version: int,
+    state: Dict[str, Any],
+    previous: Optional[Tuple[int, Dict[str, Any]]],
+    change_description: Optional[str],
+    created_at: datetime,
+    keyframe_interval: int
+) -> Dict[str, Any]:
+    """
+    Build a version document, as a delta when possible.
+
+    Args:
+        onepager_id: One-pager _id
+        user_id: Owner _id
+        version: Version number
+        state: Versioned fields at this version (see version_state)
+        previous: (keyframe_version, state) of version - 1, or None if unknown
+        change_description: What changed
+        created_at: Version timestamp
+        keyframe_interval: Maximum versions per keyframe chain
+
+    Returns:
+        Document for the onepager_versions collection
+    """
+    version_doc = {
+        "onepager_id": onepager_id,
+        "user_id": user_id,
+        "version": version,
+        "created_at": created_at,
+        "change_description": change_description
+    }
+    if previous is None or version - previous[0] >= keyframe_interval:
+        version_doc.update(state)
+    else:
+        version_doc["keyframe_version"] = previous[0]
+        version_doc["patch"] = make_patch(previous[1], state)
+    return version_doc
+
+
+def _replay(version_docs: Iterable[Dict[str, Any]]) -> Iterable[Tuple[Dict[str, Any], int, Dict[str, Any]]]:
+    """
+    Rebuild states from version documents sorted by version.
+
+    Yields (version_doc, keyframe_version, state) for every version whose
+    chain is complete. The state object is patched in place for the next
+    version, so copy it before keeping it.
+    """
+    state = None
+    keyframe_version = None
+    last_version = None
+    for version_doc in version_docs:
+        if "patch" not in version_doc:
+            state = copy.deepcopy(version_state(version_doc))
+            keyframe_version = version_doc["version"]
+        elif (
+            state is not None
+            and last_version == version_doc["version"] - 1
+            and keyframe_version == version_doc["keyframe_version"]
+        ):
+            state = apply_patch(state, copy.deepcopy(version_doc["patch"]))
+        else:
+            logger.warning(
+                f"⚠️ Version {version_doc['version']} of one-pager {version_doc['onepager_id']} "
+                f"has an incomplete delta chain"
+            )
+            state = None
+        last_version = version_doc["version"]
+        if state is not None:
+            yield version_doc, keyframe_version, state
+
+
+def _to_snapshot(version_doc: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a version for the API (VersionSnapshot)."""
+    return {
+        "version": version_doc["version"],
+        **copy.deepcopy(state),
+        "created_at": version_doc["created_at"],
+        "change_description": version_doc.get("change_description")
+    }
+
+
+def _remember(onepager_id: Any, version: int, keyframe_version: int, state: Dict[str, Any]) -> None:
+    with _latest_states_lock:
+        _latest_states[onepager_id] = (version, keyframe_version, state)
+        _latest_states.move_to_end(onepager_id)
+        while len(_latest_states) > _LATEST_STATES_MAX:
+            _latest_states.popitem(last=False)
+
+
+def _recall(onepager_id: Any, version: int) -> Optional[Tuple[int, Dict[str, Any]]]:
+    with _latest_states_lock:
+        entry = _latest_states.get(onepager_id)
+    if entry is None or entry[0] != version:
+        return None
+    return entry[1], entry[2]
+
+
+async def _load_state(
+    db: AsyncIOMotorDatabase,
+    onepager_id: Any,
+    version: int
+) -> Optional[Tuple[Dict[str, Any], int, Dict[str, Any]]]:
+    """Fetch and rebuild one version: (version_doc, keyframe_version, state), or None."""
+    version_doc = await db.onepager_versions.find_one({"onepager_id": onepager_id, "version": version})
+    if version_doc is None:
+        return None
+    if "patch" not in version_doc:
+        return version_doc, version, version_state(version_doc)
+
+    chain = await db.onepager_versions.find({
+        "onepager_id": onepager_id,
+        "version": {"$gte": version_doc["keyframe_version"], "$lt": version}
+    }).sort("version", 1).to_list(length=None)
+    rebuilt = None
+    for rebuilt in _replay(chain + [version_doc]):
+        pass
+    if rebuilt is None or rebuilt[0]["version"] != version:
+        return None
+    return rebuilt
+
+
+async def record_version(
+    db: AsyncIOMotorDatabase,
+    onepager_doc: Dict[str, Any],
+    change_description: Optional[str],
+    created_at: datetime
+) -> Dict[str, Any]:
+    """
+    Store a snapshot of an edited one-pager under its new version_count.
+
+    Idempotent: if the version already exists it is left as stored.
+
+    Args:
+        db: Database handle
+        onepager_doc: One-pager as returned by the edit (version_count already incremented)
+        change_description: What changed
+        created_at: Version timestamp
+
+    Returns:
+        The stored version document
+    """
+    onepager_id = onepager_doc["_id"]
+    version = onepager_doc["version_count"]
+    state = copy.deepcopy(version_state(onepager_doc))
+
+    previous = _recall(onepager_id, version - 1)
+    if previous is None and version > 1:
+        loaded = await _load_state(db, onepager_id, version - 1)
+        previous = (loaded[1], loaded[2]) if loaded else None
+
+    version_doc = encode_version(
+        onepager_id, onepager_doc["user_id"], version, state, previous,
+        change_description, created_at, settings.version_keyframe_interval
+    )
+    key = {"onepager_id": onepager_id, "version": version}
+    try:
+        await db.onepager_versions.update_one(
+            key,
+            {"$setOnInsert": {k: v for k, v in version_doc.items() if k not in key}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        pass  # Concurrent upsert of the same version
+    _remember(onepager_id, version, version_doc.get("keyframe_version", version), state)
+    return version_doc
+
+
+async def store_pending_version(db: AsyncIOMotorDatabase, onepager_doc: Dict[str, Any]) -> bool:
+    """
+    Write the version an edit marked as pending_version, then clear the marker.
+
+    Called right after a versioned edit, and again by the next edit or
+    version read if the process died before the version was written: the
+    document still holds exactly the state of that version, since every
+    later edit stores pending versions first.
+
+    Args:
+        db: Database handle
+        onepager_doc: One-pager document carrying pending_version
+
+    Returns:
+        True if a pending version was stored
+    """
+    pending = onepager_doc.get("pending_version")
+    if not pending:
+        return False
+
+    if pending["version"] == onepager_doc.get("version_count"):
+        await record_version(db, onepager_doc, pending.get("change_description"), pending["created_at"])
+    else:
+        logger.warning(f"⚠️ Stale pending_version on one-pager {onepager_doc['_id']}, dropping it")
+    await db.onepagers.update_one(
+        {"_id": onepager_doc["_id"], "pending_version.version": pending["version"]},
+        {"$unset": {"pending_version": ""}}
+    )
+    return True
+
+
+async def migrate_embedded_history(db: AsyncIOMotorDatabase, onepager_doc: Dict[str, Any]) -> int:
+    """
+    Move a legacy embedded version_history into the versions collection.
+
+    Safe to run concurrently and repeatedly: already-copied versions are
+    skipped by the unique index.
+
+    Args:
+        db: Database handle
+        onepager_doc: One-pager document read with version_history
+
+    Returns:
+        Number of versions copied
+    """
+    history = onepager_doc.get("version_history")
+    if history is None:
+        return 0
+
+    copied = 0
+    if history:
+        version_docs = []
+        previous = None
+        previous_version = None
+        for snapshot in sorted(history, key=lambda v: v["version"]):
+            if previous_version != snapshot["version"] - 1:
+                previous = None
+            state = version_state(snapshot)
+            version_doc = encode_version(
+                onepager_doc["_id"], onepager_doc["user_id"], snapshot["version"], state, previous,
+                snapshot.get("change_description"), snapshot["created_at"], settings.version_keyframe_interval
+            )
+            version_docs.append(version_doc)
+            previous = (version_doc.get("keyframe_version", snapshot["version"]), state)
+            previous_version = snapshot["version"]
+        try:
+            result = await db.onepager_versions.insert_many(version_docs, ordered=False)
+            copied = len(result.inserted_ids)
+        except BulkWriteError as e:
+            copied = e.details.get("nInserted", 0)
+
+    await db.onepagers.update_one(
+        {"_id": onepager_doc["_id"]},
+        {
+            "$unset": {"version_history": ""},
+            "$max": {"version_count": max((v["version"] for v in history), default=0)}
+        }
+    )
+    logger.info(f"♻️ Moved {copied} embedded version(s) of one-pager {onepager_doc['_id']}")
+    return copied
+
+
+async def list_versions(
+    db: AsyncIOMotorDatabase,
+    onepager_id: Any,
+    skip: int = 0,
+    limit: int = 20
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    List a one-pager's versions, newest first.
+
+    Args:
+        db: Database handle
+        onepager_id: One-pager _id
+        skip: Versions to skip
+        limit: Maximum versions returned
+
+    Returns:
+        Tuple of (version snapshots, total number of versions)
+    """
+    page = await db.onepager_versions.find(
+        {"onepager_id": onepager_id}, {"_id": 0, "version": 1, "keyframe_version": 1}
+    ).sort("version", -1).skip(skip).limit(limit).to_list(length=limit)
+    total = await db.onepager_versions.count_documents({"onepager_id": onepager_id})
+    if not page:
+        return [], total
+
+    wanted = {entry["version"] for entry in page}
+    chain = await db.onepager_versions.find({
+        "onepager_id": onepager_id,
+        "version": {
+            "$gte": min(entry.get("keyframe_version", entry["version"]) for entry in page),
+            "$lte": max(wanted)
+        }
+    }).sort("version", 1).to_list(length=None)
+
+    items = [
+        _to_snapshot(version_doc, state)
+        for version_doc, _, state in _replay(chain)
+        if version_doc["version"] in wanted
+    ]
+    items.reverse()
+    return items, total
+
+
+async def get_version(
+    db: AsyncIOMotorDatabase,
+    onepager_id: Any,
+    version: int
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch and rebuild one version of a one-pager.
+
+    Args:
+        db: Database handle
+        onepager_id: One-pager _id
+        version: Version number
+
+    Returns:
+        Version snapshot (version, content, layout, layout_params, created_at,
+        change_description), or None if it doesn't exist
+    """
+    loaded = await _load_state(db, onepager_id, version)
+    if loaded is None:
+        return None
+    version_doc, _, state = loaded
+    return _to_snapshot(version_doc, state)
+
+
+async def delete_versions(db: AsyncIOMotorDatabase, onepager_id: Any) -> int:
+    """Delete all versions of a one-pager, returning how many were removed."""
+    with _latest_states_lock:
+        _latest_states.pop(onepager_id, None)
+    result = await db.onepager_versions.delete_many({"onepager_id": onepager_id})
+    return result.deleted_count
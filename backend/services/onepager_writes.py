@@ -0,0 +1,145 @@
+"""
+One-Pager Write Service
+=======================
+
+Single round-trip one-pager updates.
+
+The edit endpoints used to update_one the fields, find_one the result,
+update_one again to $push a version snapshot numbered
+len(version_history) + 1 (racy under concurrent edits), and find_one the
+final document. update_onepager_fields() applies the edit in one
+find_one_and_update with an update pipeline and ReturnDocument.AFTER:
+- The filter carries the ownership check (user_id) and the updated_at the
+  caller read, so fields computed from that read (AI output, the render
+  snapshot) can't be stored over a newer concurrent write. A miss is
+  resolved with one lookup: not found, not owned, or a conflict, which is
+  reported instead of replaying the stale fields
+- The pipeline sets the fields (wrapped in $literal, since user content
+  such as "$10M revenue" would otherwise be read as a field path),
+  computed expressions and, when a version is recorded, increments
+  version_count and stores a pending_version marker in the same write
+- The version snapshot is then written to onepager_versions under the new
+  version_count (idempotent on the unique (onepager_id, version) index,
+  see onepager_versions.py) and the marker cleared. If the process dies
+  in between, the next edit or version read finds the marker and writes
+  the missing version from the document, which can't have changed since
+
+Endpoints still read the one-pager first: the ownership error, the AI
+prompt and the render snapshot all need the current document.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from backend.models.onepager import VERSION_COUNT_EXPR
+from backend.services.onepager_versions import store_pending_version
+from backend.services.render_model import with_render_snapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+NEXT_VERSION_EXPR = {"$add": [VERSION_COUNT_EXPR, 1]}
+
+
+class OnePagerWriteConflictError(Exception):
+    """Raised when the one-pager changed between the caller's read and the update."""
+    pass
+
+
+class OnePagerAccessError(Exception):
+    """Raised when the one-pager exists but isn't owned by the updating user."""
+    pass
+
+
+def build_update_pipeline(
+    fields: Dict[str, Any],
+    computed: Optional[Dict[str, Any]] = None,
+    new_version: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Build the update pipeline for a one-pager write.
+
+    Args:
+        fields: Values to set (dotted paths allowed), stored as-is
+        computed: Aggregation expressions to set, evaluated against the current document
+        new_version: Increment version_count and mark the new version pending,
+            with its change_description and created_at
+
+    Returns:
+        Update pipeline for find_one_and_update
+    """
+    stage = {path: {"$literal": value} for path, value in fields.items()}
+    stage.update(computed or {})
+    if new_version is None:
+        # Legacy documents get their count stored, the response is read without version_history
+        stage["version_count"] = VERSION_COUNT_EXPR
+    else:
+        stage["version_count"] = NEXT_VERSION_EXPR
+        stage["pending_version"] = {
+            "version": NEXT_VERSION_EXPR,
+            "change_description": {"$literal": new_version["change_description"]},
+            "created_at": {"$literal": new_version["created_at"]}
+        }
+    return [{"$set": stage}]
+
+
+async def update_onepager_fields(
+    db: AsyncIOMotorDatabase,
+    onepager: Dict[str, Any],
+    user_id: ObjectId,
+    fields: Dict[str, Any],
+    computed: Optional[Dict[str, Any]] = None,
+    change_description: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Update a one-pager in one round trip and return the updated document.
+
+    Recording a version adds its write to onepager_versions.
+
+    Args:
+        db: Database handle
+        onepager: One-pager document as read by the caller
+        user_id: Owner the update is restricted to
+        fields: Values to set (must include updated_at), computed from onepager
+        computed: Aggregation expressions to set (e.g. counters)
+        change_description: Record a version snapshot with this description
+
+    Returns:
+        Updated document, or None if the one-pager was deleted
+
+    Raises:
+        OnePagerAccessError: If the one-pager isn't owned by user_id
+        OnePagerWriteConflictError: If the one-pager changed since it was read
+    """
+    # A previous edit died between its update and its version write
+    if onepager.get("pending_version"):
+        await store_pending_version(db, onepager)
+
+    new_version = None
+    if change_description is not None:
+        new_version = {"change_description": change_description, "created_at": fields["updated_at"]}
+
+    updated = await db.onepagers.find_one_and_update(
+        {"_id": onepager["_id"], "user_id": user_id, "updated_at": onepager.get("updated_at")},
+        build_update_pipeline(with_render_snapshot(onepager, fields), computed=computed, new_version=new_version),
+        projection={"version_history": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if updated is None:
+        # Deleted, not owned, or modified since it was read: one lookup tells which
+        current = await db.onepagers.find_one({"_id": onepager["_id"]}, {"user_id": 1})
+        if current is None:
+            return None
+        if current["user_id"] != user_id:
+            raise OnePagerAccessError(f"One-pager {onepager['_id']} is not owned by {user_id}")
+        logger.info(f"♻️ One-pager {onepager['_id']} changed since it was read, update rejected")
+        raise OnePagerWriteConflictError(f"One-pager {onepager['_id']} was modified concurrently")
+
+    if new_version is not None:
+        await store_pending_version(db, updated)
+    return updated
@@ -0,0 +1,198 @@
+"""
+Page Readiness Service
+======================
+
+Deterministic "page is ready to print" detection for Playwright pages.
+
+Replaces the fixed 1-second wait after set_content(). A page counts as
+ready when:
+1. Every network request it started has finished (network idle)
+2. document.fonts.ready has resolved (web fonts applied)
+3. Every <img> has been decoded
+
+All three are bounded by a hard deadline, so a slow CDN delays a render
+by at most pdf_readiness_timeout_ms instead of stalling it. The time
+actually spent waiting is logged and accumulated in readiness_stats.
+
+Modes (settings.pdf_readiness_mode):
+- "ready": wait for network idle + fonts + images (default)
+- "fixed": legacy fixed 1-second wait
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+READINESS_MODES = ("ready", "fixed")
+
+# Legacy wait used by the "fixed" mode
+FIXED_WAIT_MS = 1000
+
+# How often in-flight requests are re-checked while waiting for network idle
+NETWORK_POLL_MS = 10
+
+# Resolves true once fonts are loaded and all images decoded, false on deadline
+WAIT_FOR_ASSETS_JS = """
+async (timeoutMs) => {
+    const deadline = new Promise(resolve => setTimeout(() => resolve(false), timeoutMs));
+    const images = Array.from(document.images, img =>
+        img.decode ? img.decode().catch(() => null) : null
+    );
+    const assets = Promise.all([document.fonts.ready, ...images]).then(() => true);
+    return Promise.race([assets, deadline]);
+}
+"""
+
+
+class _NetworkTracker:
+    """Track in-flight requests of a page through Playwright events."""
+
+    def __init__(self, page: Any):
+        self.page = page
+        self.inflight = set()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    def _on_request(self, request: Any) -> None:
+        self.inflight.add(request)
+
+    def _on_done(self, request: Any) -> None:
+        self.inflight.discard(request)
+
+    def detach(self) -> None:
+        """Remove listeners so a reused (pooled) page does not accumulate them."""
+        self.page.remove_listener("request", self._on_request)
+        self.page.remove_listener("requestfinished", self._on_done)
+        self.page.remove_listener("requestfailed", self._on_done)
+
+
+# Process-wide readiness metrics (exposed by the /health endpoint)
+_stats_lock = threading.Lock()
+readiness_stats: Dict[str, Any] = {
+    "mode": settings.pdf_readiness_mode,
+    "waits": 0,
+    "timeouts": 0,
+    "total_wait_ms": 0.0,
+    "last_wait_ms": 0.0,
+    "max_wait_ms": 0.0,
+}
+
+
+def _record_wait(wait_ms: float, timed_out: bool, mode: str) -> None:
+    """Accumulate wait metrics and log the time spent."""
+    with _stats_lock:
+        readiness_stats["waits"] += 1
+        readiness_stats["total_wait_ms"] += wait_ms
+        readiness_stats["last_wait_ms"] = wait_ms
+        readiness_stats["max_wait_ms"] = max(readiness_stats["max_wait_ms"], wait_ms)
+        if timed_out:
+            readiness_stats["timeouts"] += 1
+
+    if timed_out:
+        logger.warning(f"⚠️ Page readiness deadline hit after {wait_ms:.0f}ms, rendering anyway")
+    else:
+        logger.info(f"Page resources ready in {wait_ms:.0f}ms (mode={mode})")
+
+
+def _resolve(mode: Optional[str], timeout_ms: Optional[int]):
+    mode = mode or settings.pdf_readiness_mode
+    if mode not in READINESS_MODES:
+        raise ValueError(f"Invalid readiness mode: {mode}. Must be one of: {list(READINESS_MODES)}")
+    return mode, timeout_ms or settings.pdf_readiness_timeout_ms
+
+
+def load_html_and_wait(
+    page: Any,
+    html_content: str,
+    mode: Optional[str] = None,
+    timeout_ms: Optional[int] = None
+) -> float:
+    """
+    Set page HTML and wait until it is ready to print (sync Playwright API).
+
+    Args:
+        page: Playwright sync Page
+        html_content: HTML string to load
+        mode: Readiness mode ("ready" or "fixed"), defaults to settings
+        timeout_ms: Hard deadline for the readiness wait, defaults to settings
+
+    Returns:
+        Milliseconds spent waiting after the HTML was set
+    """
+    mode, timeout_ms = _resolve(mode, timeout_ms)
+
+    if mode == "fixed":
+        page.set_content(html_content)
+        start = time.monotonic()
+        page.wait_for_timeout(FIXED_WAIT_MS)
+        wait_ms = (time.monotonic() - start) * 1000
+        _record_wait(wait_ms, False, mode)
+        return wait_ms
+
+    tracker = _NetworkTracker(page)
+    try:
+        page.set_content(html_content, wait_until="domcontentloaded")
+        start = time.monotonic()
+        deadline = start + timeout_ms / 1000
+
+        while tracker.inflight and time.monotonic() < deadline:
+            page.wait_for_timeout(NETWORK_POLL_MS)
+        network_idle = not tracker.inflight
+
+        remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+        assets_ready = page.evaluate(WAIT_FOR_ASSETS_JS, remaining_ms)
+    finally:
+        tracker.detach()
+
+    wait_ms = (time.monotonic() - start) * 1000
+    _record_wait(wait_ms, not (network_idle and assets_ready), mode)
+    return wait_ms
+
+
+async def async_load_html_and_wait(
+    page: Any,
+    html_content: str,
+    mode: Optional[str] = None,
+    timeout_ms: Optional[int] = None
+) -> float:
+    """
+    Set page HTML and wait until it is ready to print (async Playwright API).
+
+    Same semantics as load_html_and_wait().
+    """
+    mode, timeout_ms = _resolve(mode, timeout_ms)
+
+    if mode == "fixed":
+        await page.set_content(html_content)
+        start = time.monotonic()
+        await page.wait_for_timeout(FIXED_WAIT_MS)
+        wait_ms = (time.monotonic() - start) * 1000
+        _record_wait(wait_ms, False, mode)
+        return wait_ms
+
+    tracker = _NetworkTracker(page)
+    try:
+        await page.set_content(html_content, wait_until="domcontentloaded")
+        start = time.monotonic()
+        deadline = start + timeout_ms / 1000
+
+        while tracker.inflight and time.monotonic() < deadline:
+            await page.wait_for_timeout(NETWORK_POLL_MS)
+        network_idle = not tracker.inflight
+
+        remaining_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+        assets_ready = await page.evaluate(WAIT_FOR_ASSETS_JS, remaining_ms)
+    finally:
+        tracker.detach()
+
+    wait_ms = (time.monotonic() - start) * 1000
+    _record_wait(wait_ms, not (network_idle and assets_ready), mode)
+    return wait_ms
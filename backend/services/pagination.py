@@ -0,0 +1,72 @@
+"""
+Pagination Service
+==================
+
+Keyset (cursor) pagination helpers for newest-first listings.
+
+skip/limit makes MongoDB walk and discard every skipped document, so deep
+pages get slower the further a user scrolls. A keyset cursor remembers the
+(created_at, _id) of the last document returned and the next page starts
+right after it, using the (user_id, created_at, _id) index:
+
+    cursor = encode_cursor(last_doc)
+    query.update(keyset_filter(*decode_cursor(cursor)))
+    find(query).sort(KEYSET_SORT)
+
+Cursors are opaque, URL-safe strings; clients pass them back unchanged.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+
+# Newest first; _id breaks ties between documents created in the same millisecond
+KEYSET_SORT: List[Tuple[str, int]] = [("created_at", -1), ("_id", -1)]
+
+
+def encode_cursor(doc: Dict[str, Any]) -> str:
+    """
+    Build the cursor pointing after a document.
+
+    Args:
+        doc: Last document of the page (needs created_at and _id)
+
+    Returns:
+        Opaque cursor string
+    """
+    payload = json.dumps([doc["created_at"].isoformat(), str(doc["_id"])], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """
+    Parse a cursor built by encode_cursor().
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (created_at, _id) of the last document of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, object_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), ObjectId(object_id)
+    except (ValueError, TypeError, InvalidId) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def keyset_filter(created_at: datetime, object_id: ObjectId) -> Dict[str, Any]:
+    """Return the query clause selecting documents after (created_at, _id) in KEYSET_SORT order."""
+    return {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "_id": {"$lt": object_id}}
+    ]}
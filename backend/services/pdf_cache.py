@@ -0,0 +1,304 @@
+"""
+PDF Cache Service
+=================
+
+Content-addressed cache of rendered PDF files.
+
+The cache key is a SHA-256 of the final HTML plus the page format and
+print options, so a PDF is only regenerated when something that affects
+its bytes changes (one-pager content, brand kit, template, layout params,
+format). Inputs the HTML does not capture are part of the key as well:
+the renderer (Playwright pins the Chromium build) and the font store's
+contents, so PDFs rendered with fallback fonts are not served once the
+real fonts are installed. The key doubles as a strong ETag for export
+responses.
+
+Features:
+- Local disk storage (backend/output/pdf_cache by default)
+- Size-bounded LRU eviction (file mtime is bumped on every hit)
+- The size bound applies to the shared directory, not per process: each
+  worker keeps a running total of the directory size and rescans it when
+  the total goes over the bound or the last scan is older than
+  RESCAN_SECONDS (which picks up other workers' writes)
+- Images share the cache under their real extension (.png/.jpeg/.webp)
+- Atomic writes (temp file + rename), safe across API workers
+- Blocking file I/O runs in a worker thread
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.config import settings
+from backend.services.font_store import font_store
+
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when PDF rendering changes in a way that HTML does not capture
+PDF_CACHE_VERSION = 1
+
+
+def _renderer_version() -> str:
+    """Installed Playwright release (each release pins one Chromium build)."""
+    try:
+        return metadata.version("playwright")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+RENDERER_VERSION = _renderer_version()
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "output" / "pdf_cache"
+
+# File extensions of cache entries (PDF keys carry none, image keys carry theirs)
+CACHE_SUFFIXES = (".pdf", ".png", ".jpeg", ".webp")
+
+# Other workers' writes are only seen by a scan; rescan at least this often
+RESCAN_SECONDS = 60.0
+
+
+def make_pdf_cache_key(html: str, page_format: str, **print_options: Any) -> str:
+    """
+    Build the content-addressed cache key for a PDF render.
+
+    Args:
+        html: Final HTML passed to the PDF engine
+        page_format: Page format ('letter', 'a4', 'tabloid')
+        **print_options: Options passed to PDFGenerator.generate_pdf()
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    fonts = font_store.fingerprint() + ("|offline" if font_store.offline else "")
+    digest = hashlib.sha256()
+    digest.update(f"v{PDF_CACHE_VERSION}|{RENDERER_VERSION}|{fonts}|{page_format}|".encode())
+    digest.update(json.dumps(print_options, sort_keys=True, default=str).encode())
+    digest.update(b"|")
+    digest.update(html.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def make_image_cache_key(html: str, raster_options: Dict[str, Any]) -> str:
+    """
+    Build the cache key for a raster export (images share the PDF cache).
+
+    Args:
+        html: Final HTML passed to the renderer
+        raster_options: Options from pdf_generator.build_raster_options()
+
+    Returns:
+        Hex SHA-256 digest plus the image extension (e.g. "<digest>.webp"),
+        which names the cache file
+    """
+    return f"{make_pdf_cache_key(html, 'image', **raster_options)}.{raster_options['format']}"
+
+
+def combine_pdf_cache_keys(keys: Iterable[str]) -> str:
+    """
+    Build one ETag-able key for a bundle of PDFs (e.g. a multi-format ZIP).
+
+    Args:
+        keys: Cache keys of the bundled PDFs, in bundle order
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256("|".join(keys).encode()).hexdigest()
+
+
+class PDFCache:
+    """
+    Disk-backed, size-bounded LRU cache of PDF bytes.
+
+    There is no in-memory index: every API worker reads the directory
+    itself. Writes add to a running size total; once it exceeds max_bytes
+    (or RESCAN_SECONDS passed) the directory is scanned and the least
+    recently used files (oldest mtime) are removed until the whole
+    directory fits max_bytes.
+
+    Usage:
+        key = make_pdf_cache_key(html, 'letter')
+        pdf_bytes = await pdf_cache.get(key)
+        if pdf_bytes is None:
+            pdf_bytes = await generator.generate_pdf(html, 'letter')
+            await pdf_cache.put(key, pdf_bytes)
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize the cache and apply the size bound to existing entries.
+
+        Args:
+            root: Directory for cached PDFs
+            max_bytes: Total size bound before LRU eviction (0 disables caching)
+        """
+        self.root = Path(root) if root else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = 0
+        self._total_bytes = 0
+        self._scanned_at = 0.0
+        if self.enabled:
+            self._evict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def contains(self, key: str) -> bool:
+        """Check for an entry without reading it or touching its LRU position."""
+        return self.enabled and self._path(key).is_file()
+
+    def _path(self, key: str) -> Path:
+        # Image keys end with their extension, PDF keys are bare digests
+        return self.root / (key if "." in key else f"{key}.pdf")
+
+    def _scan(self) -> List[Tuple[float, str, int]]:
+        """List cache files as (mtime, name, size), oldest first."""
+        entries = []
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    if not entry.name.endswith(CACHE_SUFFIXES):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+        except FileNotFoundError:
+            return []
+        return sorted(entries)
+
+    def _evict(self) -> None:
+        """Delete least recently used files until the directory fits max_bytes."""
+        with self._lock:
+            entries = self._scan()
+            total = sum(size for _, _, size in entries)
+
+            evicted = 0
+            for _, name, size in entries:
+                if total <= self.max_bytes:
+                    break
+                # Another worker may have evicted it already
+                (self.root / name).unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+
+            self._entries = len(entries) - evicted
+            self._total_bytes = total
+            self._scanned_at = time.monotonic()
+
+        if evicted:
+            logger.info(f"🧹 PDF cache evicted {evicted} file(s)")
+
+    # ------------------------------------------------------------------
+    # Sync implementation (runs in a worker thread)
+    # ------------------------------------------------------------------
+
+    def get_sync(self, key: str) -> Optional[bytes]:
+        """Return cached PDF bytes and mark the entry as recently used."""
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put_sync(self, key: str, data: bytes) -> None:
+        """Store PDF bytes atomically and evict least recently used entries."""
+        if not self.enabled or len(data) > self.max_bytes:
+            return
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        path = self._path(key)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # Same clock as get_sync(), so writes and hits order consistently
+            now = time.time()
+            os.utime(tmp_path, (now, now))
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = None
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if replaced is None:
+                self._entries += 1
+                self._total_bytes += len(data)
+            else:
+                self._total_bytes += len(data) - replaced
+            needs_scan = (
+                self._total_bytes > self.max_bytes
+                or time.monotonic() - self._scanned_at > RESCAN_SECONDS
+            )
+        if needs_scan:
+            self._evict()
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Async wrapper around get_sync()."""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get_sync, key)
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Async wrapper around put_sync(). Cache write failures are logged, not raised."""
+        if not self.enabled:
+            return
+        try:
+            await asyncio.to_thread(self.put_sync, key, data)
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to write PDF cache entry {key[:12]}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for health checks and metrics (size as tracked by this process)."""
+        return {
+            "entries": self._entries,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Singleton instance used by export routes
+pdf_cache = PDFCache(
+    root=Path(settings.pdf_cache_dir) if settings.pdf_cache_dir else None,
+    max_bytes=settings.pdf_cache_max_bytes
+)
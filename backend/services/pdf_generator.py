@@ -7,21 +7,32 @@ Provides async PDF generation with format support and error handling.
 
 Features:
 - Async/await support for non-blocking generation
-- Multiple page formats (Letter, A4, Tabloid)
+- Multiple page formats (Letter, A4, Tabloid), several from one page load
+- PNG/JPEG/WebP raster export and thumbnails captured from the same page
 - Custom margins and print settings
 - Background color/image support
-- Browser instance management
+- Warm browser pool (backend/services/browser_pool.py) with one-off fallback
+- Optional multi-process render workers (backend/services/render_processes.py)
+- Admission control with per-user fair queueing (backend/services/render_scheduler.py)
+- Offline Google Fonts from the local font store (backend/services/font_store.py)
 - Comprehensive error handling
 - Actively maintained (Microsoft-backed)
 """
 
 import asyncio
-from playwright.async_api import async_playwright
-from typing import Optional, Literal, Dict
+import base64
+from typing import Optional, Literal, Dict, Callable, List, Sequence
 from pathlib import Path
 import logging
 from datetime import datetime
 
+from backend.config import settings
+from backend.services.browser_pool import browser_pool, CHROMIUM_ARGS, DEFAULT_VIEWPORT
+from backend.services.page_readiness import load_html_and_wait
+from backend.services.font_store import font_store
+from backend.services.render_scheduler import render_scheduler
+from backend.services.render_processes import render_process_pool
+
 
 logger = logging.getLogger(__name__)
 
@@ -48,12 +59,182 @@ PAGE_FORMATS = {
 
 PageFormat = Literal['letter', 'a4', 'tabloid']
 
+# Raster image formats (captured with CDP Page.captureScreenshot)
+RASTER_FORMATS = ('png', 'jpeg', 'webp')
+RasterFormat = Literal['png', 'jpeg', 'webp']
+
+# CSS pixels per inch (page formats are laid out at 96 DPI)
+CSS_DPI = 96
+
 
 class PDFGeneratorError(Exception):
     """Raised when PDF generation fails."""
     pass
 
 
+def pdf_variant_name(page_format: str, landscape: bool = False) -> str:
+    """Name of a format/orientation variant, e.g. 'a4' or 'a4_landscape'."""
+    return f"{page_format}_landscape" if landscape else page_format
+
+
+def build_raster_options(
+    image_format: RasterFormat = 'png',
+    page_format: PageFormat = 'letter',
+    dpi: Optional[int] = None,
+    thumbnail_width: Optional[int] = None,
+    quality: Optional[int] = None
+) -> Dict:
+    """
+    Validate raster settings and build options for capture_raster().
+
+    Args:
+        image_format: 'png', 'jpeg' or 'webp'
+        page_format: Page size the image covers ('letter', 'a4', 'tabloid')
+        dpi: Output resolution (defaults to settings.raster_default_dpi)
+        thumbnail_width: Output width in pixels; overrides dpi
+        quality: JPEG/WebP quality 1-100 (ignored for PNG)
+
+    Returns:
+        Options dict (picklable, so it can travel to render processes)
+
+    Raises:
+        PDFGeneratorError: If a setting is invalid
+    """
+    if image_format not in RASTER_FORMATS:
+        raise PDFGeneratorError(
+            f"Invalid image format: {image_format}. Must be one of: {list(RASTER_FORMATS)}"
+        )
+    if page_format not in PAGE_FORMATS:
+        raise PDFGeneratorError(
+            f"Invalid page format: {page_format}. "
+            f"Must be one of: {list(PAGE_FORMATS.keys())}"
+        )
+
+    format_config = PAGE_FORMATS[page_format]
+    width_px = round(float(format_config['width'].rstrip('in')) * CSS_DPI)
+    height_px = round(float(format_config['height'].rstrip('in')) * CSS_DPI)
+
+    if thumbnail_width:
+        scale = thumbnail_width / width_px
+    else:
+        dpi = dpi or settings.raster_default_dpi
+        if not 24 <= dpi <= settings.raster_max_dpi:
+            raise PDFGeneratorError(f"DPI must be between 24 and {settings.raster_max_dpi}")
+        scale = dpi / CSS_DPI
+
+    options = {
+        'format': image_format,
+        'width': width_px,
+        'height': height_px,
+        'scale': round(scale, 4)
+    }
+    if image_format != 'png':
+        options['quality'] = quality or 85
+    return options
+
+
+def capture_raster(page, raster_options: Dict) -> bytes:
+    """
+    Capture the loaded page as an image, laid out like the printed PDF.
+
+    The viewport is resized to the page size and print media is emulated
+    so the image matches the PDF; CDP's clip scale sets the resolution.
+
+    Args:
+        page: Playwright sync Page with the HTML already loaded
+        raster_options: Options from build_raster_options()
+
+    Returns:
+        Image bytes
+    """
+    width, height = raster_options['width'], raster_options['height']
+    page.set_viewport_size({'width': width, 'height': height})
+    page.emulate_media(media="print")
+
+    params = {
+        'format': raster_options['format'],
+        'clip': {'x': 0, 'y': 0, 'width': width, 'height': height, 'scale': raster_options['scale']},
+        'captureBeyondViewport': True
+    }
+    if 'quality' in raster_options:
+        params['quality'] = raster_options['quality']
+
+    cdp = page.context.new_cdp_session(page)
+    try:
+        result = cdp.send("Page.captureScreenshot", params)
+    finally:
+        cdp.detach()
+        page.emulate_media(media="null")
+
+    return base64.b64decode(result['data'])
+
+
+def render_pdfs_on_page(
+    page,
+    html_content: str,
+    pdf_options_list: List[Dict],
+    raster_options_list: Optional[List[Dict]] = None
+) -> List[bytes]:
+    """
+    Load HTML on a prepared page once and print it once per options set.
+
+    Page load and the font/image wait dominate render time, so extra
+    formats (and images) produced from the same load are nearly free.
+    Module-level (not a closure) so render worker processes can run it.
+
+    Args:
+        page: Playwright sync Page (font routes already installed)
+        html_content: HTML string with inline CSS
+        pdf_options_list: Keyword arguments for each page.pdf() call
+        raster_options_list: Options for each image (see build_raster_options)
+
+    Returns:
+        PDF bytes in the order of pdf_options_list, followed by image
+        bytes in the order of raster_options_list
+    """
+    # Set viewport for consistent rendering
+    page.set_viewport_size(DEFAULT_VIEWPORT)
+
+    # Set HTML content and wait for fonts, images and network idle
+    logger.debug("Setting HTML content...")
+    load_html_and_wait(page, html_content)
+
+    # Generate one PDF per requested format/orientation
+    pdfs = []
+    for pdf_options in pdf_options_list:
+        logger.debug(f"Rendering PDF ({pdf_options.get('format')})...")
+        pdfs.append(page.pdf(**pdf_options))
+
+    # Images last: capturing resizes the viewport
+    for raster_options in raster_options_list or []:
+        logger.debug(f"Capturing {raster_options['format']} image...")
+        pdfs.append(capture_raster(page, raster_options))
+    return pdfs
+
+
+def _launch_and_render(render: Callable[..., bytes]) -> bytes:
+    """
+    Launch a one-off browser, run render(page) and close it.
+
+    Used when the browser pool is not running (scripts, tests, or a pool
+    that failed to start).
+    """
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        logger.debug("Launching headless Chromium with Playwright (sync mode)...")
+        browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+
+        try:
+            logger.debug("Creating new page...")
+            page = browser.new_page()
+            font_store.install_routes(page)
+            return render(page)
+        finally:
+            logger.debug("Closing browser...")
+            browser.close()
+
+
 class PDFGenerator:
     """
     Generate PDFs from HTML using headless Chromium (Playwright).
@@ -81,7 +262,9 @@ class PDFGenerator:
         margin: Optional[Dict[str, str]] = None,
         print_background: bool = True,
         prefer_css_page_size: bool = False,
-        landscape: bool = False
+        landscape: bool = False,
+        user_id: Optional[str] = None,
+        bounded_queue: bool = True
     ) -> bytes:
         """
         Generate PDF from HTML string.
@@ -93,12 +276,15 @@ class PDFGenerator:
             print_background: Include background colors/images
             prefer_css_page_size: Use CSS @page size instead of format parameter
             landscape: Render in landscape orientation
+            user_id: Requesting user, used for fair queueing of renders
+            bounded_queue: Reject instead of waiting when the render queue is full
         
         Returns:
             PDF file as bytes
         
         Raises:
             PDFGeneratorError: If PDF generation fails
+            RenderQueueFullError: If bounded_queue and the render queue is full
         
         Example:
             ```python
@@ -110,7 +296,144 @@ class PDFGenerator:
             ```
         """
         start_time = datetime.now()
+        pdf_options = self._build_pdf_options(
+            page_format, margin, print_background, prefer_css_page_size, landscape
+        )
         
+        logger.info(
+            f"Generating PDF: format={page_format}, "
+            f"landscape={landscape}, "
+            f"printBackground={print_background}"
+        )
+
+        # Wait for a render slot (raises RenderQueueFullError when saturated)
+        async with render_scheduler.slot(user_id, bounded=bounded_queue):
+            pdfs = await self._render_with_browser(html_content, [pdf_options], start_time)
+        return pdfs[0]
+
+    async def generate_pdfs(
+        self,
+        html_content: str,
+        page_formats: Sequence[PageFormat],
+        orientations: Sequence[bool] = (False,),
+        margin: Optional[Dict[str, str]] = None,
+        print_background: bool = True,
+        prefer_css_page_size: bool = False,
+        images: Optional[Dict[str, Dict]] = None,
+        user_id: Optional[str] = None,
+        bounded_queue: bool = True
+    ) -> Dict[str, bytes]:
+        """
+        Generate several PDFs (and optionally images) from a single page load.
+
+        The HTML is loaded (and fonts/images awaited) once, then printed
+        for every format × orientation combination. Uses one render slot.
+
+        Args:
+            html_content: HTML string with inline CSS
+            page_formats: Page formats to print ('letter', 'a4', 'tabloid')
+            orientations: Landscape flags to print for each format
+            margin: Page margins dict with 'top', 'right', 'bottom', 'left' keys
+            print_background: Include background colors/images
+            prefer_css_page_size: Use CSS @page size instead of format parameter
+            images: Extra images captured from the same page, as
+                name -> build_raster_options() result
+            user_id: Requesting user, used for fair queueing of renders
+            bounded_queue: Reject instead of waiting when the render queue is full
+
+        Returns:
+            Dict of variant name (see pdf_variant_name) -> PDF bytes, plus
+            image name -> image bytes for every requested image
+
+        Raises:
+            PDFGeneratorError: If PDF generation fails
+            RenderQueueFullError: If bounded_queue and the render queue is full
+
+        Example:
+            ```python
+            pdfs = await generator.generate_pdfs(html, ['letter', 'a4', 'tabloid'])
+            letter_pdf = pdfs['letter']
+            ```
+        """
+        start_time = datetime.now()
+
+        variants = list(dict.fromkeys(
+            (page_format, landscape)
+            for page_format in page_formats
+            for landscape in orientations
+        ))
+        if not variants:
+            raise PDFGeneratorError("At least one page format is required")
+
+        pdf_options_list = [
+            self._build_pdf_options(page_format, margin, print_background, prefer_css_page_size, landscape)
+            for page_format, landscape in variants
+        ]
+        names = [pdf_variant_name(page_format, landscape) for page_format, landscape in variants]
+
+        logger.info(f"Generating {len(variants)} PDFs from one page load: {', '.join(names)}")
+
+        images = images or {}
+        names.extend(images)
+
+        async with render_scheduler.slot(user_id, bounded=bounded_queue):
+            results = await self._render_with_browser(
+                html_content, pdf_options_list, start_time, list(images.values())
+            )
+        return dict(zip(names, results))
+
+    async def generate_image(
+        self,
+        html_content: str,
+        image_format: RasterFormat = 'png',
+        page_format: PageFormat = 'letter',
+        dpi: Optional[int] = None,
+        thumbnail_width: Optional[int] = None,
+        quality: Optional[int] = None,
+        user_id: Optional[str] = None,
+        bounded_queue: bool = True
+    ) -> bytes:
+        """
+        Generate a raster image of the page, matching the PDF layout.
+
+        Args:
+            html_content: HTML string with inline CSS
+            image_format: 'png', 'jpeg' or 'webp'
+            page_format: Page size the image covers ('letter', 'a4', 'tabloid')
+            dpi: Output resolution (defaults to settings.raster_default_dpi)
+            thumbnail_width: Output width in pixels; overrides dpi
+            quality: JPEG/WebP quality 1-100
+            user_id: Requesting user, used for fair queueing of renders
+            bounded_queue: Reject instead of waiting when the render queue is full
+
+        Returns:
+            Image file as bytes
+
+        Raises:
+            PDFGeneratorError: If rendering fails
+            RenderQueueFullError: If bounded_queue and the render queue is full
+        """
+        start_time = datetime.now()
+        raster_options = build_raster_options(image_format, page_format, dpi, thumbnail_width, quality)
+
+        logger.info(
+            f"Generating image: format={image_format}, page={page_format}, "
+            f"scale={raster_options['scale']}"
+        )
+
+        async with render_scheduler.slot(user_id, bounded=bounded_queue):
+            results = await self._render_with_browser(html_content, [], start_time, [raster_options])
+        return results[0]
+
+    def _build_pdf_options(
+        self,
+        page_format: PageFormat,
+        margin: Optional[Dict[str, str]],
+        print_background: bool,
+        prefer_css_page_size: bool,
+        landscape: bool
+    ) -> Dict:
+        """Validate a page format and build keyword arguments for page.pdf()."""
         # Validate page format
         if page_format not in PAGE_FORMATS:
             raise PDFGeneratorError(
@@ -127,82 +450,48 @@ class PDFGenerator:
                 'left': '0in'
             }
         
-        format_config = PAGE_FORMATS[page_format]
-        
-        logger.info(
-            f"Generating PDF: format={page_format}, "
-            f"landscape={landscape}, "
-            f"printBackground={print_background}"
-        )
-        
+        return {
+            'format': PAGE_FORMATS[page_format]['format'],
+            'margin': margin,
+            'print_background': print_background,
+            'prefer_css_page_size': prefer_css_page_size,
+            'landscape': landscape
+        }
+
+    async def _render_with_browser(
+        self,
+        html_content: str,
+        pdf_options_list: List[Dict],
+        start_time: datetime,
+        raster_options_list: Optional[List[Dict]] = None
+    ) -> List[bytes]:
+        """Run a page render on a render process, a pooled browser or a one-off browser."""
+        def _render_pdfs(page) -> List[bytes]:
+            return render_pdfs_on_page(page, html_content, pdf_options_list, raster_options_list)
+
         try:
-            # Workaround for Python 3.13 + Playwright compatibility issue on Windows
-            # Use sync API with asyncio.to_thread() to avoid NotImplementedError
-            import asyncio
-            from playwright.sync_api import sync_playwright
-            
-            def _generate_pdf_sync():
-                """Synchronous PDF generation using Playwright sync API."""
-                with sync_playwright() as p:
-                    logger.debug("Launching headless Chromium with Playwright (sync mode)...")
-                    
-                    # Launch browser
-                    browser = p.chromium.launch(
-                        headless=True,
-                        args=[
-                            '--no-sandbox',
-                            '--disable-setuid-sandbox',
-                            '--disable-dev-shm-usage',
-                            '--disable-accelerated-2d-canvas',
-                            '--disable-gpu'
-                        ]
-                    )
-                    
-                    try:
-                        # Create new page
-                        logger.debug("Creating new page...")
-                        page = browser.new_page()
-                        
-                        # Set viewport for consistent rendering
-                        page.set_viewport_size({'width': 1920, 'height': 1080})
-                        
-                        # Set HTML content
-                        logger.debug("Setting HTML content...")
-                        page.set_content(html_content)
-                        
-                        # Wait for fonts and resources to load
-                        logger.debug("Waiting for resources to load...")
-                        page.wait_for_timeout(1000)  # 1 second for Google Fonts
-                        
-                        # Generate PDF
-                        logger.debug(f"Rendering PDF ({page_format})...")
-                        pdf_bytes = page.pdf(
-                            format=format_config['format'],
-                            margin=margin,
-                            print_background=print_background,
-                            prefer_css_page_size=prefer_css_page_size,
-                            landscape=landscape
-                        )
-                        
-                        return pdf_bytes
-                        
-                    finally:
-                        # Close browser
-                        logger.debug("Closing browser...")
-                        browser.close()
-            
-            # Run sync Playwright in thread pool to avoid blocking
-            pdf_bytes = await asyncio.to_thread(_generate_pdf_sync)
+            if render_process_pool.is_running:
+                # Render in a worker process (own browser, own core)
+                pdfs = await render_process_pool.render_many(
+                    html_content, pdf_options_list, raster_options_list
+                )
+            elif browser_pool.is_running:
+                # Reuse a warm browser from the pool
+                pdfs = await browser_pool.run(_render_pdfs)
+            else:
+                # Workaround for Python 3.13 + Playwright compatibility issue on Windows
+                # Use sync API with asyncio.to_thread() to avoid NotImplementedError
+                pdfs = await asyncio.to_thread(_launch_and_render, _render_pdfs)
             
             elapsed = (datetime.now() - start_time).total_seconds()
-            file_size_kb = len(pdf_bytes) / 1024
+            file_size_kb = sum(len(pdf) for pdf in pdfs) / 1024
             
             logger.info(
-                f"✅ PDF generated successfully: "
-                f"{file_size_kb:.1f} KB in {elapsed:.2f}s"
+                f"✅ Page rendered successfully: "
+                f"{len(pdfs)} file(s), {file_size_kb:.1f} KB in {elapsed:.2f}s"
             )
             
-            return pdf_bytes
+            return pdfs
             
         except Exception as e:
             elapsed = (datetime.now() - start_time).total_seconds()
@@ -210,7 +499,7 @@ class PDFGenerator:
                 f"❌ PDF generation failed after {elapsed:.2f}s: {e}",
                 exc_info=True
             )
-            raise PDFGeneratorError(f"Failed to generate PDF: {e}")
+            raise PDFGeneratorError(f"Failed to render page: {e}")
     
     async def generate_pdf_to_file(
         self,
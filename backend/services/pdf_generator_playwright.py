@@ -22,6 +22,9 @@ from pathlib import Path
 import logging
 from datetime import datetime
 
+from backend.services.page_readiness import async_load_html_and_wait
+from backend.services.font_store import font_store
+
 
 logger = logging.getLogger(__name__)
 
@@ -156,6 +159,7 @@ class PDFGenerator:
                     # Create new page
                     logger.debug("Creating new page...")
                     page = await browser.new_page()
+                    await font_store.async_install_routes(page)
                     
                     # Set viewport for consistent rendering
                     await page.set_viewport_size({
@@ -163,13 +167,9 @@ class PDFGenerator:
                         'height': 1080
                     })
                     
-                    # Set HTML content
+                    # Set HTML content and wait for fonts, images and network idle
                     logger.debug("Setting HTML content...")
-                    await page.set_content(html_content)
-                    
-                    # Wait for fonts and resources to load
-                    logger.debug("Waiting for resources to load...")
-                    await page.wait_for_timeout(1000)  # 1 second for Google Fonts
+                    await async_load_html_and_wait(page, html_content)
                     
                     # Generate PDF
                     logger.debug(f"Rendering PDF ({page_format})...")
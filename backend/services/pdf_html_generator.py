@@ -9,24 +9,99 @@ Features:
 - Brand Kit color/typography integration
 - Google Fonts embedding
 - Responsive section rendering
-- Print-optimized CSS
+- Print-optimized CSS, compiled and minified per brand (see css_bundles.py)
 - Support for all element types
+- Process-wide singleton: templates are compiled once (bytecode cache on
+  disk, precompiled at startup) and only rendered per request
+- Streaming output (generate_html_stream) for progressive preview loading
+- Section fragments are cached ({% fragment %}, see fragment_cache.py),
+  so an edit only re-renders the sections it touched
 """
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template, select_autoescape
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
 
+from backend.config import settings
 from backend.models.onepager import OnePagerLayout
 from backend.models.brand_kit import BrandKitInDB
+from backend.services.css_bundles import css_bundles, stylesheet_for
+from backend.services.fragment_cache import FragmentCacheExtension, make_fragment_scope
 
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_TEMPLATE_DIR = Path(__file__).parent.parent / "templates" / "pdf"
+DEFAULT_BYTECODE_CACHE_DIR = Path(__file__).parent.parent / "output" / "jinja_cache"
+
+# Map template names to template files
+TEMPLATE_MAP = {
+    "minimalist": "onepager_minimalist.html",
+    "bold": "onepager_bold.html",
+    "business": "onepager_business.html",
+    "product": "onepager_product.html"
+}
+
+# Target size of streamed HTML chunks (see stream_html_chunks)
+STREAM_CHUNK_CHARS = 16 * 1024
+
+
+# (number pattern, unit pattern, icon) in priority order: stats are taken
+# pattern by pattern, in text order within a pattern
+KEY_STAT_PATTERNS = [
+    # Number + unit patterns (50+, 100+, 1000+)
+    (r'\d+\+?', r'clients?|customers?|users?|businesses?|companies?', '👥'),
+    (r'\d+\+?', r'years?|decades?', '⏰'),
+    (r'\d+\+?', r'locations?|stores?|branches?', '📍'),
+    (r'\d+\+?', r'products?|items?|dishes?|services?', '📦'),
+    (r'\d+\+?', r'employees?|team members?|staff', '👔'),
+    # Percentage patterns
+    (r'\d+%', r'satisfaction|happy|rating|success', '⭐'),
+    (r'\d+%', r'growth|increase', '📈'),
+    # Money patterns
+    (r'\$[\d,]+[KMB]?', r'revenue|sales|saved|value', '💰'),
+]
+
+
+def _compile_key_stat_matcher() -> "re.Pattern":
+    """
+    Combine KEY_STAT_PATTERNS into one regex, one branch per number format.
+
+    Branch k captures the number in group n<k> and the unit in u<k>; the
+    leading lookahead lets the regex engine skip ahead to candidate
+    characters instead of trying every branch at every position.
+    """
+    units_by_number: Dict[str, List[str]] = {}
+    for number, unit, _ in KEY_STAT_PATTERNS:
+        units_by_number.setdefault(number, []).append(unit)
+    branches = [
+        f"(?P<n{k}>{number})\\s+(?P<u{k}>{'|'.join(units)})"
+        for k, (number, units) in enumerate(units_by_number.items())
+    ]
+    return re.compile(r"(?=[\d$])(?:" + "|".join(branches) + ")", re.IGNORECASE)
+
+
+# Scans the text once instead of once per pattern (see _match_key_stats)
+KEY_STAT_MATCHER = _compile_key_stat_matcher()
+KEY_STAT_UNITS = [re.compile(unit, re.IGNORECASE) for _, unit, _ in KEY_STAT_PATTERNS]
+
+MAX_KEY_STATS = 4
+
+# Memoized results keyed by a hash of the extracted text (previews and
+# exports of unchanged content skip the regex scan)
+_key_stats_cache: "OrderedDict[str, List[Dict[str, str]]]" = OrderedDict()
+_key_stats_lock = threading.Lock()
+KEY_STATS_CACHE_SIZE = 512
+
+
 def extract_key_stats(onepager: OnePagerLayout) -> List[Dict[str, str]]:
     """
     Extract key statistics from one-pager content for visual highlights.
@@ -37,6 +112,10 @@ def extract_key_stats(onepager: OnePagerLayout) -> List[Dict[str, str]]:
     - "$1M revenue", "$500K sales"
     - "10 years", "15+ years experience"
 
+    Text and feature/benefit counts are gathered in one walk over the
+    elements, matched with the precompiled KEY_STAT_MATCHER and memoized
+    by content hash.
+
     Args:
         onepager: OnePager layout data
 
@@ -44,95 +123,167 @@ def extract_key_stats(onepager: OnePagerLayout) -> List[Dict[str, str]]:
         List of stat dicts with keys: number, label, icon
         Maximum 4 stats returned
     """
-    stats = []
+    return _extract_key_stats(
+        onepager.title,
+        ((element.type, getattr(element, 'title', None), getattr(element, 'content', None))
+         for element in onepager.elements)
+    )
+
 
+def extract_key_stats_from_data(onepager_data: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    Same as extract_key_stats() for template-ready one-pager data.
+
+    Args:
+        onepager_data: One-pager dict with title and elements (see render_model.py)
+
+    Returns:
+        List of stat dicts with keys: number, label, icon
+    """
+    return _extract_key_stats(
+        onepager_data.get("title"),
+        ((element.get("type"), element.get("title"), element.get("content"))
+         for element in onepager_data.get("elements") or [])
+    )
+
+
+def _extract_key_stats(title: str, elements: Iterable[Tuple[Any, Any, Any]]) -> List[Dict[str, str]]:
+    """Key stats from the one-pager title and (type, title, content) of each element."""
     # Combine all text content from elements
-    all_text = f"{onepager.title} "
-    for element in onepager.elements:
-        if hasattr(element, 'content'):
-            content = element.content
-            if isinstance(content, str):
-                all_text += content + " "
-            elif isinstance(content, dict):
-                for value in content.values():
-                    if isinstance(value, str):
-                        all_text += value + " "
-            elif isinstance(content, list):
-                for item in content:
-                    if isinstance(item, str):
-                        all_text += item + " "
-        # Safely get title attribute
-        element_title = getattr(element, 'title', None)
+    text_parts = [title or ""]
+    feature_count = 0
+    benefit_count = 0
+    for element_type, element_title, content in elements:
+        if isinstance(content, str):
+            text_parts.append(content)
+        elif isinstance(content, dict):
+            text_parts.extend(value for value in content.values() if isinstance(value, str))
+        elif isinstance(content, list):
+            text_parts.extend(item for item in content if isinstance(item, str))
         if element_title:
-            all_text += element_title + " "
-
-    # Pattern matching for common stat formats
-    patterns = [
-        # Number + unit patterns (50+, 100+, 1000+)
-        (r'(\d+\+?)\s+(clients?|customers?|users?|businesses?|companies?)', '👥', 'clients'),
-        (r'(\d+\+?)\s+(years?|decades?)', '⏰', 'years'),
-        (r'(\d+\+?)\s+(locations?|stores?|branches?)', '📍', 'locations'),
-        (r'(\d+\+?)\s+(products?|items?|dishes?|services?)', '📦', 'products'),
-        (r'(\d+\+?)\s+(employees?|team members?|staff)', '👔', 'team'),
-        # Percentage patterns
-        (r'(\d+%)\s+(satisfaction|happy|rating|success)', '⭐', 'satisfaction'),
-        (r'(\d+%)\s+(growth|increase)', '📈', 'growth'),
-        # Money patterns
-        (r'(\$[\d,]+[KMB]?)\s+(revenue|sales|saved|value)', '💰', 'value'),
-    ]
+            text_parts.append(element_title)
 
-    for pattern, icon, label_fallback in patterns:
-        matches = re.finditer(pattern, all_text, re.IGNORECASE)
-        for match in matches:
-            number = match.group(1)
-            label = match.group(2).capitalize()
+        # Count feature/benefit list items for the no-match fallback
+        if element_type == 'list' and isinstance(content, list):
+            title_lower = str(element_title).lower()
+            if 'feature' in title_lower:
+                feature_count += len(content)
+            if 'benefit' in title_lower:
+                benefit_count += len(content)
 
-            stats.append({
-                'number': number,
-                'label': label,
-                'icon': icon
-            })
+    all_text = " ".join(text_parts)
+    cache_key = hashlib.sha1(f"{feature_count}|{benefit_count}|{all_text}".encode()).hexdigest()
 
-            if len(stats) >= 4:
-                break
+    with _key_stats_lock:
+        cached = _key_stats_cache.get(cache_key)
+        if cached is not None:
+            _key_stats_cache.move_to_end(cache_key)
+    if cached is not None:
+        return [dict(stat) for stat in cached]
 
-        if len(stats) >= 4:
-            break
+    stats = _match_key_stats(all_text)
 
     # If no stats found, generate defaults from content analysis
-    if len(stats) == 0:
-        # Precisely count features from list elements
-        feature_items = []
-        for el in onepager.elements:
-            element_title = str(getattr(el, 'title', '')).lower()
-            if el.type == 'list' and 'feature' in element_title:
-                if hasattr(el, 'content') and isinstance(el.content, list):
-                    feature_items.extend(el.content)
-
-        if len(feature_items) > 0:
+    if not stats:
+        if feature_count > 0:
             stats.append({
-                'number': str(len(feature_items)),  # Exact count
+                'number': str(feature_count),  # Exact count
                 'label': 'Features',
                 'icon': '⚡'
             })
-
-        # Precisely count benefits from list elements
-        benefit_items = []
-        for el in onepager.elements:
-            element_title = str(getattr(el, 'title', '')).lower()
-            if el.type == 'list' and 'benefit' in element_title:
-                if hasattr(el, 'content') and isinstance(el.content, list):
-                    benefit_items.extend(el.content)
-
-        if len(benefit_items) > 0:
+        if benefit_count > 0:
             stats.append({
-                'number': str(len(benefit_items)),
+                'number': str(benefit_count),
                 'label': 'Benefits',
                 'icon': '🎯'
             })
 
+    with _key_stats_lock:
+        _key_stats_cache[cache_key] = stats
+        if len(_key_stats_cache) > KEY_STATS_CACHE_SIZE:
+            _key_stats_cache.popitem(last=False)
+
     logger.info(f"Extracted {len(stats)} key stats from onepager")
-    return stats[:4]  # Max 4 stats
+    return [dict(stat) for stat in stats]
+
+
+def _match_key_stats(text: str) -> List[Dict[str, str]]:
+    """Scan text once and return up to MAX_KEY_STATS stats in pattern priority order."""
+    buckets: List[List[Dict[str, str]]] = [[] for _ in KEY_STAT_PATTERNS]
+    for match in KEY_STAT_MATCHER.finditer(text):
+        branch = match.lastgroup[1:]
+        number = match.group(f'n{branch}')
+        unit = match.group(f'u{branch}')
+        # Units are distinct across patterns, so the unit identifies the pattern
+        for index, unit_matcher in enumerate(KEY_STAT_UNITS):
+            if unit_matcher.fullmatch(unit):
+                if len(buckets[index]) < MAX_KEY_STATS:
+                    buckets[index].append({
+                        'number': number,
+                        'label': unit.capitalize(),
+                        'icon': KEY_STAT_PATTERNS[index][2]
+                    })
+                break
+
+    stats = []
+    for bucket in buckets:
+        stats.extend(bucket)
+    return stats[:MAX_KEY_STATS]
+
+
+def stream_html_chunks(
+    pieces: Iterable[str],
+    head_extra: str = "",
+    chunk_size: int = STREAM_CHUNK_CHARS
+) -> Iterator[str]:
+    """
+    Regroup rendered HTML pieces into chunks, writing head_extra before </head>.
+
+    Jinja's generate() yields many tiny strings; they are batched into
+    chunk_size pieces, except that everything up to and including </head>
+    is flushed as soon as it is complete so the client can start loading
+    fonts and styles.
+
+    Args:
+        pieces: Rendered HTML pieces (template.generate() or a cached string)
+        head_extra: Markup inserted just before </head>
+        chunk_size: Target chunk length in characters
+
+    Returns:
+        Iterator of HTML chunks
+    """
+    head = ""
+    buffer = []
+    buffered = 0
+    in_head = True
+
+    for piece in pieces:
+        # Fragment output is Markup; concatenating it would escape the rest
+        piece = str(piece)
+        if in_head:
+            # Only the new piece (plus a tag-length overlap) needs searching
+            start = max(0, len(head) - len("</head>"))
+            head += piece
+            marker = head.find("</head>", start)
+            if marker == -1:
+                continue
+            in_head = False
+            yield head[:marker] + head_extra + "</head>"
+            piece = head[marker + len("</head>"):]
+            if not piece:
+                continue
+
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield "".join(buffer)
+            buffer, buffered = [], 0
+
+    if in_head and head:
+        # No </head> in the document: emit it unchanged
+        yield head
+    if buffer:
+        yield "".join(buffer)
 
 
 class PDFHTMLGeneratorError(Exception):
@@ -144,39 +295,83 @@ class PDFHTMLGenerator:
     """
     Generate styled HTML for PDF conversion from OnePagerLayout + Brand Kit.
     
+    Use the shared pdf_html_generator instance: a Jinja Environment is
+    thread-safe for rendering, and sharing it means each template is
+    parsed and compiled once per process instead of once per request.
+
     Usage:
-        generator = PDFHTMLGenerator()
-        html = generator.generate_html(onepager_layout, brand_kit)
+        from backend.services.pdf_html_generator import pdf_html_generator
+        html = pdf_html_generator.generate_html(onepager_layout, brand_kit)
     """
     
-    def __init__(self, template_dir: str = None):
+    def __init__(
+        self,
+        template_dir: str = None,
+        auto_reload: Optional[bool] = None,
+        bytecode_cache_dir: Optional[str] = None
+    ):
         """
         Initialize the HTML generator.
         
         Args:
             template_dir: Path to Jinja2 templates directory.
                          Defaults to backend/templates/pdf/
+            auto_reload: Re-check template files for changes on every render.
+                         Defaults to on, except in production
+            bytecode_cache_dir: Directory for compiled template bytecode.
+                         Defaults to backend/output/jinja_cache/ ("" disables)
         """
         if template_dir is None:
             # Default to backend/templates/pdf/
-            backend_dir = Path(__file__).parent.parent
-            template_dir = str(backend_dir / "templates" / "pdf")
+            template_dir = str(DEFAULT_TEMPLATE_DIR)
+
+        if auto_reload is None:
+            auto_reload = settings.api_env != "production"
+
+        if bytecode_cache_dir is None:
+            bytecode_cache_dir = settings.jinja_bytecode_cache_dir or str(DEFAULT_BYTECODE_CACHE_DIR)
+
+        bytecode_cache = None
+        if bytecode_cache_dir:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
         
-        logger.info(f"Initializing PDFHTMLGenerator with template_dir: {template_dir}")
+        logger.info(
+            f"Initializing PDFHTMLGenerator with template_dir: {template_dir} "
+            f"(auto_reload={auto_reload}, bytecode_cache={bytecode_cache_dir or 'off'})"
+        )
         
         # Initialize Jinja2 environment with 'do' extension for list manipulation
+        # and the section fragment cache
         self.env = Environment(
             loader=FileSystemLoader(template_dir),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
             lstrip_blocks=True,
-            extensions=['jinja2.ext.do']
+            extensions=['jinja2.ext.do', FragmentCacheExtension],
+            auto_reload=auto_reload,
+            bytecode_cache=bytecode_cache
         )
         
         # Add custom filters
         self.env.filters['replace'] = lambda s, old, new: s.replace(old, new)
         
         logger.info("✅ PDFHTMLGenerator initialized successfully")
+
+    def precompile(self) -> int:
+        """
+        Load and compile every template in TEMPLATE_MAP.
+
+        Called at startup so the first request only pays for rendering.
+
+        Returns:
+            Number of templates compiled
+        """
+        for template_file in TEMPLATE_MAP.values():
+            self.env.get_template(template_file)
+            self.env.get_template(stylesheet_for(template_file))
+        logger.info(f"✅ Precompiled {len(TEMPLATE_MAP)} PDF templates")
+        return len(TEMPLATE_MAP)
     
     def generate_html(
         self,
@@ -201,62 +396,77 @@ class PDFHTMLGenerator:
             PDFHTMLGeneratorError: If HTML generation fails
         """
         try:
-            logger.info(f"Generating HTML for onepager: {onepager.title} with template: {template_name}")
-
-            # Map template names to template files
-            template_map = {
-                "minimalist": "onepager_minimalist.html",
-                "bold": "onepager_bold.html",
-                "business": "onepager_business.html",
-                "product": "onepager_product.html"
-            }
+            render_model = self._render_model_from(onepager, brand_kit)
+        except Exception as e:
+            logger.error(f"Failed to prepare onepager data: {e}", exc_info=True)
+            raise PDFHTMLGeneratorError(f"HTML generation failed: {e}")
 
-            # Fallback to minimalist if template not found
-            template_file = template_map.get(template_name, "onepager_minimalist.html")
+        return self.render_html(render_model, template_name, layout_params)
 
-            # Load selected template
-            template = self.env.get_template(template_file)
+    def generate_html_stream(
+        self,
+        onepager: OnePagerLayout,
+        brand_kit: BrandKitInDB,
+        template_name: str = "minimalist",
+        layout_params: dict = None,
+        head_extra: str = ""
+    ) -> Iterator[str]:
+        """
+        Generate the same HTML as generate_html() as a stream of chunks.
 
-            # Convert Pydantic models to dicts for Jinja2
-            onepager_dict = self._prepare_onepager_data(onepager)
-            brand_dict = self._prepare_brand_data(brand_kit)
+        The template is rendered with Jinja's generate(), so the <head>
+        (fonts, CSS) is available before the body has been rendered.
+        Context preparation runs before this returns; only template
+        rendering is deferred to iteration.
 
-            # Extract key statistics for visual highlights
-            key_stats = extract_key_stats(onepager)
-
-            # Provide default layout_params if not provided
-            if layout_params is None:
-                layout_params = {}
-
-            # Ensure layout_params has default values for all parameters
-            default_layout_params = {
-                "typography": {
-                    "h1_scale": 1.0,
-                    "h2_scale": 1.0,
-                    "body_scale": 1.0,
-                    "line_height": 1.0
-                },
-                "spacing": {
-                    "section_gap": "default",
-                    "padding_scale": 1.0
-                }
-            }
+        Args:
+            onepager: OnePager layout data structure
+            brand_kit: Brand Kit with colors, fonts, logo
+            template_name: Template style to use (minimalist, bold, business, product)
+            layout_params: Layout parameters for typography and spacing (optional)
+            head_extra: Markup written into the stream just before </head>
+
+        Returns:
+            Iterator of HTML chunks
+
+        Raises:
+            PDFHTMLGeneratorError: If the render context cannot be prepared
+        """
+        try:
+            render_model = self._render_model_from(onepager, brand_kit)
+        except Exception as e:
+            logger.error(f"Failed to prepare onepager data: {e}", exc_info=True)
+            raise PDFHTMLGeneratorError(f"HTML generation failed: {e}")
+
+        return self.render_html_stream(render_model, template_name, layout_params, head_extra)
 
-            # Merge provided layout_params with defaults
-            merged_params = {**default_layout_params}
-            if "typography" in layout_params:
-                merged_params["typography"].update(layout_params["typography"])
-            if "spacing" in layout_params:
-                merged_params["spacing"].update(layout_params["spacing"])
-
-            # Render template
-            html = template.render(
-                onepager=onepager_dict,
-                brand=brand_dict,
-                key_stats=key_stats,
-                layout_params=merged_params,
-                now=datetime.now()
-            )
+    def render_html(
+        self,
+        render_model: Dict[str, Any],
+        template_name: str = "minimalist",
+        layout_params: dict = None
+    ) -> str:
+        """
+        Render HTML from a prepared render model.
+
+        Args:
+            render_model: Dict with onepager, brand and key_stats
+                          (see backend/services/render_model.py)
+            template_name: Template style to use (minimalist, bold, business, product)
+            layout_params: Layout parameters for typography and spacing (optional)
+
+        Returns:
+            Complete HTML string ready for PDF conversion
+
+        Raises:
+            PDFHTMLGeneratorError: If HTML generation fails
+        """
+        try:
+            title = render_model["onepager"].get("title")
+            logger.info(f"Generating HTML for onepager: {title} with template: {template_name}")
+
+            template, context = self._prepare_render(render_model, template_name, layout_params)
+            html = template.render(**context)
             
             logger.info(f"✅ HTML generated successfully ({len(html)} characters)")
             return html
@@ -264,6 +474,145 @@ class PDFHTMLGenerator:
         except Exception as e:
             logger.error(f"Failed to generate HTML: {e}", exc_info=True)
             raise PDFHTMLGeneratorError(f"HTML generation failed: {e}")
+
+    def render_html_stream(
+        self,
+        render_model: Dict[str, Any],
+        template_name: str = "minimalist",
+        layout_params: dict = None,
+        head_extra: str = ""
+    ) -> Iterator[str]:
+        """
+        Stream HTML from a prepared render model (see generate_html_stream).
+
+        Args:
+            render_model: Dict with onepager, brand and key_stats
+            template_name: Template style to use (minimalist, bold, business, product)
+            layout_params: Layout parameters for typography and spacing (optional)
+            head_extra: Markup written into the stream just before </head>
+
+        Returns:
+            Iterator of HTML chunks
+
+        Raises:
+            PDFHTMLGeneratorError: If the render context cannot be prepared
+        """
+        try:
+            template, context = self._prepare_render(render_model, template_name, layout_params)
+        except Exception as e:
+            logger.error(f"Failed to prepare HTML stream: {e}", exc_info=True)
+            raise PDFHTMLGeneratorError(f"HTML generation failed: {e}")
+
+        return stream_html_chunks(template.generate(**context), head_extra)
+
+    def _render_model_from(self, onepager: OnePagerLayout, brand_kit: BrandKitInDB) -> Dict[str, Any]:
+        """Build a render model from validated Pydantic models."""
+        # Convert Pydantic models to dicts for Jinja2
+        return {
+            "onepager": self._prepare_onepager_data(onepager),
+            "brand": self._prepare_brand_data(brand_kit),
+            # Extract key statistics for visual highlights
+            "key_stats": extract_key_stats(onepager)
+        }
+
+    def _prepare_render(
+        self,
+        render_model: Dict[str, Any],
+        template_name: str,
+        layout_params: Optional[dict]
+    ) -> Tuple[Template, Dict[str, Any]]:
+        """
+        Load the template and build its render context.
+
+        Returns:
+            (template, context) tuple
+        """
+        # Fallback to minimalist if template not found
+        template_file = TEMPLATE_MAP.get(template_name, TEMPLATE_MAP["minimalist"])
+
+        # Load selected template
+        template = self.env.get_template(template_file)
+
+        onepager_dict = render_model["onepager"]
+        brand_dict = render_model["brand"]
+        key_stats = render_model["key_stats"]
+
+        merged_params = self._merge_layout_params(layout_params)
+
+        # Minified stylesheet compiled once per brand styling + layout_params
+        stylesheet = css_bundles.get(self.env, template_file, brand_dict, merged_params)
+
+        # Unchanged sections are served from the fragment cache
+        fragment_scope = make_fragment_scope(
+            template_file, brand_dict, key_stats, onepager_dict.get("title")
+        )
+
+        return template, {
+            "onepager": onepager_dict,
+            "brand": brand_dict,
+            "key_stats": key_stats,
+            "layout_params": merged_params,
+            "now": datetime.now(),
+            "stylesheet": Markup(stylesheet),
+            "fragment_scope": fragment_scope
+        }
+
+    def _merge_layout_params(self, layout_params: Optional[dict]) -> Dict[str, Any]:
+        """Fill in defaults for every typography and spacing parameter."""
+        # Provide default layout_params if not provided
+        if layout_params is None:
+            layout_params = {}
+
+        # Ensure layout_params has default values for all parameters
+        default_layout_params = {
+            "typography": {
+                "h1_scale": 1.0,
+                "h2_scale": 1.0,
+                "body_scale": 1.0,
+                "line_height": 1.0
+            },
+            "spacing": {
+                "section_gap": "default",
+                "padding_scale": 1.0
+            }
+        }
+
+        # Merge provided layout_params with defaults
+        merged_params = {**default_layout_params}
+        if "typography" in layout_params:
+            merged_params["typography"].update(layout_params["typography"])
+        if "spacing" in layout_params:
+            merged_params["spacing"].update(layout_params["spacing"])
+        return merged_params
+
+    def compile_stylesheets(
+        self,
+        brand: Dict[str, Any],
+        template_names: Optional[List[str]] = None,
+        layout_params: dict = None
+    ) -> int:
+        """
+        Build (or confirm) the CSS bundles for a brand kit ahead of rendering.
+
+        Called after a brand kit or layout_params is saved so the next
+        preview/export finds its stylesheet compiled.
+
+        Args:
+            brand: Prepared brand data (see render_model.build_brand_data)
+            template_names: Templates to compile (default: all of TEMPLATE_MAP)
+            layout_params: Layout parameters (optional)
+
+        Returns:
+            Number of stylesheets compiled or confirmed
+        """
+        merged_params = self._merge_layout_params(layout_params)
+        template_files = {
+            TEMPLATE_MAP.get(name, TEMPLATE_MAP["minimalist"])
+            for name in (template_names or TEMPLATE_MAP)
+        }
+        for template_file in template_files:
+            css_bundles.get(self.env, template_file, brand, merged_params)
+        return len(template_files)
     
     def _prepare_onepager_data(self, onepager: OnePagerLayout) -> Dict[str, Any]:
         """
@@ -396,5 +745,9 @@ def generate_pdf_html(
     Returns:
         HTML string ready for PDF conversion
     """
-    generator = PDFHTMLGenerator()
-    return generator.generate_html(onepager, brand_kit)
+    return pdf_html_generator.generate_html(onepager, brand_kit)
+
+
+# Singleton instance shared by every request (templates precompiled in
+# backend/main.py lifespan)
+pdf_html_generator = PDFHTMLGenerator()
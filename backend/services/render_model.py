@@ -0,0 +1,280 @@
+"""
+Render Model Service
+====================
+
+Turns a stored one-pager + brand kit into the template-ready dicts the PDF
+templates consume (the "render model"), in one pass and without Pydantic.
+
+Previously every render mapped content.sections into OnePagerLayout data,
+validated it through OnePagerLayout and BrandKitInDB (including the v1
+style validators in models/onepager.py), then model_dump()'ed both back
+into dicts. Documents read from MongoDB were validated on write, so:
+- build_onepager_data(): sections -> element dicts (hero synthesis, order
+  renumbering, the defaults model_dump() would add) in a single loop
+- build_brand_data(): brand kit document -> brand dict with palette and
+  typography defaults filled in
+- build_render_model(): both plus key stats, memoized per one-pager
+  (_id, updated_at) and brand kit version
+- with_render_snapshot(): the write-side counterpart, storing elements
+  and key stats on the document (see render_snapshot.py) so reads skip
+  rebuilding them
+
+Render models are shared between requests and must be treated as
+read-only. See backend/scripts/benchmark_render_model.py for the
+validation overhead this removes.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from backend.config import settings
+from backend.models.brand_kit import ColorPalette, Typography
+from backend.services.html_cache import brand_kit_cache_part
+from backend.services.pdf_html_generator import extract_key_stats_from_data
+from backend.services.render_snapshot import apply_set, get_render_snapshot, make_render_snapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+# Optional fields model_dump() adds to every element
+ELEMENT_DEFAULTS = {"title": None, "styling": None, "position": None, "visible": True}
+
+# Layout-level fields model_dump() adds next to title and elements
+ONEPAGER_DEFAULTS = {
+    "description": None,
+    "dimensions": {"width": 1080, "height": 1920},
+    "version": 1,
+    "created_at": None,
+    "updated_at": None,
+    "brand_colors": None,
+    "brand_fonts": None,
+    "brand_logo_url": None
+}
+
+# Defaults the brand kit models fill in for missing palette/typography keys
+COLOR_PALETTE_DEFAULTS = {
+    name: field.default for name, field in ColorPalette.model_fields.items() if not field.is_required()
+}
+TYPOGRAPHY_DEFAULTS = {
+    name: field.default for name, field in Typography.model_fields.items() if not field.is_required()
+}
+
+
+def build_onepager_data(onepager_doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a stored one-pager (content.sections) to template-ready data.
+
+    Converts string hero content to the structured hero dict, synthesizes a
+    hero element from the headline when no hero section exists, and
+    renumbers element order sequentially.
+
+    Args:
+        onepager_doc: Raw MongoDB one-pager document
+
+    Returns:
+        Dictionary with the same shape as OnePagerLayout.model_dump()
+    """
+    content = onepager_doc.get("content") or {}
+    elements = []
+    has_hero_section = False
+
+    for idx, section in enumerate(content.get("sections") or []):
+        section_type = section.get("type", "text_block")
+        section_content = section.get("content", {})
+
+        if section_type == "hero":
+            has_hero_section = True
+            # Handle hero type: convert string content to proper dict format
+            if isinstance(section_content, str):
+                # Use OnePager's headline as the hero headline
+                section_content = {
+                    "headline": content.get("headline", section.get("title", "")),
+                    "subheadline": content.get("subheadline", ""),
+                    "description": section_content
+                }
+
+        elements.append({
+            **ELEMENT_DEFAULTS,
+            "id": section.get("id", f"section-{idx}"),
+            "type": section_type,
+            "title": section.get("title"),
+            "content": section_content,
+            "styling": section.get("styling"),
+            "order": len(elements)
+        })
+
+    # Add headline as hero element if exists and no hero section already present
+    if not has_hero_section and "headline" in content:
+        elements.insert(0, {
+            **ELEMENT_DEFAULTS,
+            "id": "hero-main",
+            "type": "hero",
+            "content": {
+                "headline": content["headline"],
+                "subheadline": content.get("subheadline"),
+                "description": content.get("description", "")
+            },
+            "order": 0
+        })
+        for idx, element in enumerate(elements):
+            element["order"] = idx
+
+    return {
+        **ONEPAGER_DEFAULTS,
+        "title": onepager_doc.get("title", "Untitled"),
+        "elements": elements
+    }
+
+
+def build_brand_data(brand_kit_doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a brand kit document to template-ready brand data.
+
+    Args:
+        brand_kit_doc: Brand kit document (see get_brand_kit_doc)
+
+    Returns:
+        Dictionary with the same shape PDFHTMLGenerator._prepare_brand_data() returns
+    """
+    data = {key: value for key, value in brand_kit_doc.items() if key != "_id"}
+    data["id"] = str(brand_kit_doc["_id"]) if brand_kit_doc.get("_id") is not None else None
+    if data.get("user_id") is not None:
+        data["user_id"] = str(data["user_id"])
+
+    data["color_palette"] = {**COLOR_PALETTE_DEFAULTS, **(brand_kit_doc.get("color_palette") or {})}
+    data["typography"] = {**TYPOGRAPHY_DEFAULTS, **(brand_kit_doc.get("typography") or {})}
+
+    # Map logo_url to logo for template compatibility
+    if data.get("logo_url"):
+        data["logo"] = data["logo_url"]
+
+    return data
+
+
+class RenderModelCache:
+    """
+    Thread-safe LRU of render models keyed by one-pager and brand kit version.
+
+    Usage:
+        model = render_model_cache.get_or_build(onepager_doc, brand_kit_doc)
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Render models kept before LRU eviction (0 disables)
+        """
+        self.max_entries = max_entries
+        self._items: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(onepager_doc: Dict[str, Any], brand_kit_doc: Dict[str, Any]) -> Optional[str]:
+        """Return the memo key, or None for documents without updated_at."""
+        snapshot = get_render_snapshot(onepager_doc)
+        if snapshot is not None:
+            return f"{snapshot['hash']}|{brand_kit_cache_part(onepager_doc, brand_kit_doc)}"
+        updated_at = onepager_doc.get("updated_at")
+        if updated_at is None or onepager_doc.get("_id") is None:
+            return None
+        return f"{onepager_doc['_id']}@{updated_at}|{brand_kit_cache_part(onepager_doc, brand_kit_doc)}"
+
+    def get_or_build(self, onepager_doc: Dict[str, Any], brand_kit_doc: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the memoized render model, building it on a miss.
+
+        Args:
+            onepager_doc: Raw MongoDB one-pager document
+            brand_kit_doc: Brand kit document (see get_brand_kit_doc)
+
+        Returns:
+            Read-only render model (onepager, brand, key_stats)
+        """
+        key = self.make_key(onepager_doc, brand_kit_doc) if self.max_entries > 0 else None
+        if key is not None:
+            with self._lock:
+                model = self._items.get(key)
+                if model is not None:
+                    self._items.move_to_end(key)
+                    self._hits += 1
+                    return model
+                self._misses += 1
+
+        model = build_render_model(onepager_doc, brand_kit_doc)
+
+        if key is not None:
+            with self._lock:
+                self._items[key] = model
+                while len(self._items) > self.max_entries:
+                    self._items.popitem(last=False)
+        return model
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for health checks."""
+        return {
+            "entries": len(self._items),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses
+        }
+
+
+def build_render_model(onepager_doc: Dict[str, Any], brand_kit_doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the template-ready render model for a stored one-pager.
+
+    Args:
+        onepager_doc: Raw MongoDB one-pager document
+        brand_kit_doc: Brand kit document (see get_brand_kit_doc)
+
+    Returns:
+        Dict with onepager, brand and key_stats (see PDFHTMLGenerator.render_html)
+    """
+    snapshot = get_render_snapshot(onepager_doc)
+    if snapshot is not None:
+        return {
+            "onepager": {**ONEPAGER_DEFAULTS, **snapshot["onepager"]},
+            "brand": build_brand_data(brand_kit_doc),
+            "key_stats": snapshot["key_stats"]
+        }
+
+    onepager_data = build_onepager_data(onepager_doc)
+    return {
+        "onepager": onepager_data,
+        "brand": build_brand_data(brand_kit_doc),
+        "key_stats": extract_key_stats_from_data(onepager_data)
+    }
+
+
+def with_render_snapshot(onepager_doc: Dict[str, Any], update_fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add a fresh render snapshot to a one-pager $set.
+
+    Args:
+        onepager_doc: One-pager document before the update
+        update_fields: $set fields of the update (must include updated_at)
+
+    Returns:
+        update_fields plus render_snapshot and render_hash
+    """
+    updated_doc = apply_set(onepager_doc, update_fields)
+    onepager_data = build_onepager_data(updated_doc)
+    snapshot = make_render_snapshot(
+        onepager_data,
+        extract_key_stats_from_data(onepager_data),
+        updated_doc.get("layout_params"),
+        updated_doc.get("pdf_template"),
+        updated_doc.get("updated_at")
+    )
+    return {**update_fields, "render_snapshot": snapshot, "render_hash": snapshot["hash"]}
+
+
+# Singleton instance shared by preview, export, batch and background jobs
+render_model_cache = RenderModelCache(max_entries=settings.render_model_cache_size)
@@ -0,0 +1,300 @@
+"""
+Render Process Pool Service
+===========================
+
+Multi-process PDF render backend.
+
+The thread-based browser pool drives every Chromium instance from the API
+process, so Playwright's control traffic and PDF byte handling compete
+with request handling for one interpreter. With
+pdf_render_backend="processes" renders are shipped to worker processes
+instead:
+- Each worker process owns one headless Chromium (launched lazily,
+  recycled after pdf_browser_max_renders renders, relaunched on crash)
+- Jobs travel over the ProcessPoolExecutor pipe as (html, pdf/image
+  options); output bytes come back through temp files, not the pipe
+- A worker that dies (Chromium segfault, OOM kill) breaks only the
+  executor: it is recreated and the API process keeps serving
+- Worker count is pdf_render_processes (0 = one per CPU core)
+
+Started/stopped from the FastAPI lifespan in backend/main.py instead of
+the thread browser pool. The render scheduler admits one render per
+worker process (see render_capacity()), so every process gets work.
+"""
+
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class RenderProcessError(Exception):
+    """Raised when a render worker process dies while rendering."""
+    pass
+
+
+# ----------------------------------------------------------------------
+# Worker process side (module-level so it can be pickled by reference)
+# ----------------------------------------------------------------------
+
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(max_renders_per_browser: int) -> None:
+    """Executor initializer: set up per-process state (browser starts lazily)."""
+    _worker.update(
+        max_renders=max_renders_per_browser,
+        playwright=None,
+        browser=None,
+        page=None,
+        renders_since_launch=0
+    )
+    atexit.register(_close_worker_browser)
+
+
+def _close_worker_browser() -> None:
+    browser = _worker.get("browser")
+    _worker["browser"] = None
+    _worker["page"] = None
+    if browser is not None:
+        try:
+            browser.close()
+        except Exception:
+            pass
+
+
+def _worker_page():
+    """Return this process's reusable page, (re)launching Chromium if needed."""
+    from backend.services.browser_pool import CHROMIUM_ARGS, DEFAULT_VIEWPORT
+    from backend.services.font_store import font_store
+
+    browser = _worker.get("browser")
+    max_renders = _worker.get("max_renders", 0)
+    needs_recycle = max_renders and _worker["renders_since_launch"] >= max_renders
+
+    if browser is None or not browser.is_connected() or needs_recycle:
+        _close_worker_browser()
+        if _worker.get("playwright") is None:
+            from playwright.sync_api import sync_playwright
+            _worker["playwright"] = sync_playwright().start()
+
+        browser = _worker["playwright"].chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        context = browser.new_context(viewport=DEFAULT_VIEWPORT)
+        font_store.install_routes(context)
+        _worker.update(browser=browser, page=context.new_page(), renders_since_launch=0)
+
+    elif _worker["page"].is_closed():
+        _worker["page"] = browser.contexts[0].new_page()
+
+    return _worker["page"]
+
+
+def _render_to_files(
+    html_content: str,
+    pdf_options_list: List[Dict],
+    raster_options_list: List[Dict],
+    output_paths: List[str]
+) -> int:
+    """Render PDFs/images from one page load in the worker process and write them to output_paths."""
+    from backend.services.pdf_generator import render_pdfs_on_page
+
+    page = _worker_page()
+    try:
+        pdfs = render_pdfs_on_page(page, html_content, pdf_options_list, raster_options_list)
+    except Exception:
+        # Start the next job on a fresh page in case this one is wedged
+        try:
+            page.close()
+        except Exception:
+            pass
+        raise
+
+    _worker["renders_since_launch"] += 1
+    for pdf_bytes, output_path in zip(pdfs, output_paths):
+        Path(output_path).write_bytes(pdf_bytes)
+    return sum(len(pdf_bytes) for pdf_bytes in pdfs)
+
+
+def _warm_up() -> int:
+    """Launch the worker's browser ahead of the first render."""
+    _worker_page()
+    return os.getpid()
+
+
+# ----------------------------------------------------------------------
+# API process side
+# ----------------------------------------------------------------------
+
+class RenderProcessPool:
+    """
+    Pool of render worker processes, each owning its own Chromium.
+
+    Usage:
+        await render_process_pool.start()
+        pdf_bytes = await render_process_pool.render(html, pdf_options)
+        pdfs = await render_process_pool.render_many(html, [letter_options, a4_options])
+        await render_process_pool.stop()
+    """
+
+    def __init__(
+        self,
+        processes: int = 0,
+        max_renders_per_browser: int = 200,
+        tmp_dir: Optional[Path] = None
+    ):
+        """
+        Initialize the pool (processes are spawned by start()).
+
+        Args:
+            processes: Worker processes (0 = os.cpu_count())
+            max_renders_per_browser: Recycle a worker's browser after this many renders
+            tmp_dir: Directory for PDF hand-off files (defaults to the system temp dir)
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.max_renders_per_browser = max_renders_per_browser
+        self.tmp_dir = tmp_dir
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._renders = 0
+        self._failures = 0
+        self._restarts = 0
+
+    @property
+    def is_running(self) -> bool:
+        """True when worker processes accept render jobs."""
+        return self._executor is not None
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn: workers must not inherit the API process's event loop/threads
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.max_renders_per_browser,)
+        )
+
+    async def start(self, warm: bool = True) -> None:
+        """
+        Spawn worker processes and (optionally) launch their browsers.
+
+        Args:
+            warm: Launch Chromium in the workers now instead of on first render
+        """
+        if self._executor is not None:
+            return
+
+        self._executor = self._create_executor()
+        logger.info(f"🚀 Starting {self.processes} PDF render process(es)")
+
+        if warm:
+            results = await asyncio.gather(
+                *(self._call(_warm_up) for _ in range(self.processes)),
+                return_exceptions=True
+            )
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                logger.warning(f"⚠️ {len(errors)} render process(es) failed to launch Chromium: {errors[0]}")
+
+        logger.info(f"✅ PDF render processes ready ({self.processes})")
+
+    async def stop(self) -> None:
+        """Shut down worker processes (their browsers close on exit)."""
+        executor = self._executor
+        if executor is None:
+            return
+        self._executor = None
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+        logger.info("✅ PDF render processes stopped")
+
+    async def _call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn(*args) in a worker process, recreating the executor if a worker died."""
+        executor = self._executor
+        if executor is None:
+            raise RenderProcessError("Render process pool is not running")
+
+        try:
+            return await asyncio.wrap_future(executor.submit(fn, *args))
+        except BrokenProcessPool as e:
+            self._failures += 1
+            # Only the first caller to notice replaces the broken executor
+            if self._executor is executor:
+                self._restarts += 1
+                logger.error("❌ A PDF render process died; restarting render processes")
+                self._executor = self._create_executor()
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise RenderProcessError(f"Render process crashed: {e}") from e
+
+    async def render(self, html_content: str, pdf_options: Dict) -> bytes:
+        """Render a single PDF in a worker process (see render_many)."""
+        return (await self.render_many(html_content, [pdf_options]))[0]
+
+    async def render_many(
+        self,
+        html_content: str,
+        pdf_options_list: List[Dict],
+        raster_options_list: Optional[List[Dict]] = None
+    ) -> List[bytes]:
+        """
+        Render PDFs (and images) from one page load in a worker process.
+
+        Args:
+            html_content: HTML string with inline CSS
+            pdf_options_list: Keyword arguments for each page.pdf() call
+            raster_options_list: Image options (see build_raster_options)
+
+        Returns:
+            PDF bytes in the order of pdf_options_list, then image bytes
+
+        Raises:
+            RenderProcessError: If the worker process died
+        """
+        raster_options_list = raster_options_list or []
+        output_paths = []
+        for _ in range(len(pdf_options_list) + len(raster_options_list)):
+            fd, output_path = tempfile.mkstemp(prefix="render-", dir=self.tmp_dir)
+            os.close(fd)
+            output_paths.append(output_path)
+
+        try:
+            await self._call(
+                _render_to_files, html_content, pdf_options_list, raster_options_list, output_paths
+            )
+            pdfs = [Path(output_path).read_bytes() for output_path in output_paths]
+        finally:
+            for output_path in output_paths:
+                try:
+                    os.unlink(output_path)
+                except OSError:
+                    pass
+
+        self._renders += 1
+        return pdfs
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool counters for health checks."""
+        return {
+            "running": self.is_running,
+            "processes": self.processes,
+            "renders": self._renders,
+            "crashed_renders": self._failures,
+            "restarts": self._restarts
+        }
+
+
+# Singleton instance, started in backend/main.py lifespan when
+# pdf_render_backend == "processes"
+render_process_pool = RenderProcessPool(
+    processes=settings.pdf_render_processes,
+    max_renders_per_browser=settings.pdf_browser_max_renders
+)
@@ -0,0 +1,256 @@
+"""
+Render Scheduler Service
+========================
+
+Admission control in front of the PDF engine.
+
+Every Playwright render holds a Chromium page (or, without the browser
+pool, a whole Chromium process), so an unbounded burst of exports can
+exhaust memory. The scheduler caps renders in flight and queues the rest:
+- At most pdf_render_max_concurrency renders run at once; by default
+  (0) that is what the render backend can run in parallel: one render per
+  worker process with pdf_render_backend="processes", one per pooled
+  browser otherwise (see render_capacity())
+- Waiting renders are served round-robin per user, so one user exporting
+  in a loop cannot starve everyone else
+- The wait queue is bounded (pdf_render_max_queue in total and
+  pdf_render_max_queued_per_user per user); beyond that requests are
+  rejected with RenderQueueFullError, turned into 429 + Retry-After by
+  backend/main.py
+- Queue depth, wait and render times are exposed through stats() on /health
+
+Background export jobs and batch exports already bound their own
+concurrency, so they use unbounded admission: they wait in the fair queue
+but are never rejected.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+ANONYMOUS_USER = "_anonymous"
+
+
+def render_capacity(config: Any = settings) -> int:
+    """
+    Renders the configured backend can run in parallel.
+
+    Args:
+        config: Settings providing the pdf_render_* and pool size fields
+
+    Returns:
+        pdf_render_max_concurrency if set, else the render process count
+        (backend=processes) or the browser pool size
+    """
+    if config.pdf_render_max_concurrency > 0:
+        return config.pdf_render_max_concurrency
+    if config.pdf_render_backend == "processes":
+        # Same default as RenderProcessPool
+        return config.pdf_render_processes or os.cpu_count() or 1
+    return max(1, config.pdf_browser_pool_size)
+
+
+class RenderQueueFullError(Exception):
+    """Raised when a render cannot be admitted because the queue is full."""
+
+    def __init__(self, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class RenderScheduler:
+    """
+    Concurrency limiter with a bounded, per-user fair wait queue.
+
+    Usage:
+        async with render_scheduler.slot(user_id):
+            pdf_bytes = await render()
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 2,
+        max_queue: int = 20,
+        max_queued_per_user: int = 4,
+        initial_render_seconds: float = 2.0
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Renders allowed in flight
+            max_queue: Waiting renders allowed in total (bounded admission)
+            max_queued_per_user: Waiting renders allowed per user (bounded admission)
+            initial_render_seconds: Render time estimate used for Retry-After
+                until real renders have been measured
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max_queue
+        self.max_queued_per_user = max_queued_per_user
+
+        self._active = 0
+        # user -> FIFO of waiters; order of keys is the round-robin order
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._queued = 0
+
+        # Exponentially weighted moving average of render duration
+        self._avg_render_seconds = initial_render_seconds
+
+        self._admitted = 0
+        self._rejected = 0
+        self._peak_queue_depth = 0
+        self._total_wait_seconds = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of renders waiting for a slot."""
+        return self._queued
+
+    @property
+    def active(self) -> int:
+        """Number of renders holding a slot."""
+        return self._active
+
+    def retry_after_seconds(self) -> int:
+        """Estimate how long until a newly queued render would start."""
+        waves = self._queued / self.max_concurrency + 1
+        return max(1, math.ceil(waves * self._avg_render_seconds))
+
+    def check_capacity(self, user_id: Optional[str] = None) -> None:
+        """
+        Raise RenderQueueFullError if a bounded render for user_id would be rejected.
+
+        Used by endpoints that start many renders (batch export) to reject
+        up front instead of failing halfway through a streamed response.
+        """
+        if self._active < self.max_concurrency and self._queued == 0:
+            return
+
+        user_key = user_id or ANONYMOUS_USER
+        if self._queued >= self.max_queue:
+            self._reject("render queue is full")
+        if len(self._waiters.get(user_key, ())) >= self.max_queued_per_user:
+            self._reject("too many renders queued for this user")
+
+    @asynccontextmanager
+    async def slot(self, user_id: Optional[str] = None, bounded: bool = True) -> AsyncIterator[None]:
+        """
+        Hold a render slot for the duration of the block.
+
+        Args:
+            user_id: Owner of the render (fair-share key)
+            bounded: Reject with RenderQueueFullError when the queue is full;
+                when False the caller always waits for a slot
+
+        Raises:
+            RenderQueueFullError: Bounded admission and the queue is full
+        """
+        await self._acquire(user_id or ANONYMOUS_USER, bounded)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            self._avg_render_seconds = 0.8 * self._avg_render_seconds + 0.2 * elapsed
+            self._release()
+
+    async def _acquire(self, user_key: str, bounded: bool) -> None:
+        if self._active < self.max_concurrency and self._queued == 0:
+            self._active += 1
+            self._admitted += 1
+            return
+
+        if bounded:
+            self.check_capacity(user_key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(user_key, deque()).append(future)
+        self._queued += 1
+        self._peak_queue_depth = max(self._peak_queue_depth, self._queued)
+        queued_at = time.monotonic()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over just before cancellation: pass it on
+                self._release()
+            else:
+                self._remove_waiter(user_key, future)
+            raise
+
+        self._admitted += 1
+        self._total_wait_seconds += time.monotonic() - queued_at
+
+    def _remove_waiter(self, user_key: str, future: asyncio.Future) -> None:
+        waiters = self._waiters.get(user_key)
+        if waiters is None or future not in waiters:
+            return
+        waiters.remove(future)
+        self._queued -= 1
+        if not waiters:
+            del self._waiters[user_key]
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiters, one user at a time (round-robin)."""
+        while self._active < self.max_concurrency and self._waiters:
+            user_key, waiters = next(iter(self._waiters.items()))
+            future = waiters.popleft()
+            self._queued -= 1
+            if waiters:
+                self._waiters.move_to_end(user_key)
+            else:
+                del self._waiters[user_key]
+
+            if future.done():
+                continue
+            self._active += 1
+            future.set_result(None)
+
+    def _reject(self, reason: str) -> None:
+        self._rejected += 1
+        retry_after = self.retry_after_seconds()
+        logger.warning(
+            f"⚠️ Render rejected ({reason}): {self._active} active, "
+            f"{self._queued} queued, retry after {retry_after}s"
+        )
+        raise RenderQueueFullError(retry_after, reason)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue-depth and latency counters for health checks."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queue_depth": self._queued,
+            "queued_users": len(self._waiters),
+            "peak_queue_depth": self._peak_queue_depth,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "avg_wait_ms": round(1000 * self._total_wait_seconds / self._admitted, 1) if self._admitted else 0.0,
+            "avg_render_ms": round(1000 * self._avg_render_seconds, 1)
+        }
+
+
+# Singleton instance shared by every PDF render in this process
+render_scheduler = RenderScheduler(
+    max_concurrency=render_capacity(),
+    max_queue=settings.pdf_render_max_queue,
+    max_queued_per_user=settings.pdf_render_max_queued_per_user
+)
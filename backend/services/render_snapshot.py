@@ -0,0 +1,118 @@
+"""
+Render Snapshot Service
+=======================
+
+Materialized render data stored on the one-pager document.
+
+The write endpoints that change what a one-pager looks like (content,
+layout_params, pdf_template, version restore) store a compact snapshot of
+the template-ready data next to the source fields:
+
+    render_snapshot: {
+        "v": 1,
+        "onepager": {"title": ..., "elements": [...]},
+        "key_stats": [...],
+        "layout_params": {...},
+        "pdf_template": "bold",
+        "hash": "<sha256 of the above>",
+        "source_updated_at": <updated_at of the write>
+    }
+    render_hash: "<same hash>"
+
+Preview and export read the snapshot instead of re-deriving elements and
+key stats (see render_model.build_render_model), and caches key rendered
+output by render_hash, which is stable across writes that don't change
+the rendered result.
+
+A snapshot is only trusted when its source_updated_at matches the
+document's updated_at: any write path that doesn't refresh the snapshot
+bumps updated_at and the readers fall back to building from content.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+
+RENDER_SNAPSHOT_VERSION = 1
+
+
+def apply_set(doc: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of doc with a MongoDB $set applied (dotted paths supported).
+
+    Only the dicts along each dotted path are copied; doc is not modified.
+
+    Args:
+        doc: Document as read from MongoDB
+        fields: $set fields, e.g. {"content.sections": [...], "updated_at": now}
+
+    Returns:
+        The document as it will look after the update
+    """
+    result = dict(doc)
+    for path, value in fields.items():
+        parts = path.split(".")
+        target = result
+        for part in parts[:-1]:
+            child = target.get(part)
+            child = dict(child) if isinstance(child, dict) else {}
+            target[part] = child
+            target = child
+        target[parts[-1]] = value
+    return result
+
+
+def make_render_snapshot(
+    onepager_data: Dict[str, Any],
+    key_stats: List[Dict[str, str]],
+    layout_params: Optional[Dict[str, Any]],
+    pdf_template: Optional[str],
+    source_updated_at: Any
+) -> Dict[str, Any]:
+    """
+    Assemble a render snapshot and its content hash.
+
+    Args:
+        onepager_data: Template-ready one-pager data (see render_model.build_onepager_data)
+        key_stats: Extracted key statistics
+        layout_params: The one-pager's layout_params
+        pdf_template: The one-pager's pdf_template
+        source_updated_at: updated_at written together with the snapshot
+
+    Returns:
+        Snapshot dict (store as render_snapshot, its hash as render_hash)
+    """
+    payload = {
+        "onepager": {"title": onepager_data["title"], "elements": onepager_data["elements"]},
+        "key_stats": key_stats,
+        "layout_params": layout_params or {},
+        "pdf_template": pdf_template or "minimalist"
+    }
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return {
+        "v": RENDER_SNAPSHOT_VERSION,
+        **payload,
+        "hash": digest,
+        "source_updated_at": source_updated_at
+    }
+
+
+def get_render_snapshot(onepager_doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Return the document's render snapshot if it is current.
+
+    Args:
+        onepager_doc: Raw MongoDB one-pager document
+
+    Returns:
+        Snapshot dict, or None if missing, from another format version, or stale
+    """
+    snapshot = onepager_doc.get("render_snapshot")
+    if not snapshot or snapshot.get("v") != RENDER_SNAPSHOT_VERSION:
+        return None
+    if snapshot.get("source_updated_at") != onepager_doc.get("updated_at"):
+        return None
+    return snapshot
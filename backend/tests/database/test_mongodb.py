@@ -0,0 +1,56 @@
+"""
+Tests for MongoDB Index Creation
+================================
+
+Unit tests checking _create_indexes() requests every collection's
+indexes. MongoDB is replaced by an in-memory fake that records
+create_index calls.
+
+Run tests:
+    pytest backend/tests/database/test_mongodb.py -v
+"""
+
+import asyncio
+
+from backend.database.mongodb import MongoDB
+
+
+class FakeCollection:
+    def __init__(self):
+        self.indexes = []
+
+    async def create_index(self, keys, **options):
+        self.indexes.append((keys, options))
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.collections = {}
+
+    def __getattr__(self, name):
+        return self.collections.setdefault(name, FakeCollection())
+
+
+def test_create_indexes_requests_export_job_indexes(monkeypatch):
+    db = FakeDatabase()
+    monkeypatch.setattr(MongoDB, "database", db)
+
+    asyncio.run(MongoDB._create_indexes())
+
+    export_jobs = db.collections["export_jobs"].indexes
+    assert ([("status", 1), ("created_at", 1)], {}) in export_jobs
+    assert ("user_id", {}) in export_jobs
+    assert ("lease_id", {"sparse": True}) in export_jobs
+    assert ("expires_at", {"expireAfterSeconds": 0}) in export_jobs
+
+
+def test_create_indexes_covers_all_collections(monkeypatch):
+    db = FakeDatabase()
+    monkeypatch.setattr(MongoDB, "database", db)
+
+    asyncio.run(MongoDB._create_indexes())
+
+    assert set(db.collections) == {"users", "brand_kits", "onepagers", "onepager_versions", "export_jobs"}
+    assert (
+        [("onepager_id", 1), ("version", -1)], {"unique": True}
+    ) in db.collections["onepager_versions"].indexes
@@ -0,0 +1,87 @@
+"""
+Tests for Access Tracker Service
+================================
+
+Unit tests for buffering last_accessed timestamps and flushing them with
+one bulk_write. MongoDB is replaced by an in-memory fake.
+
+Run tests:
+    pytest backend/tests/services/test_access_tracker.py -v
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from backend.services.access_tracker import AccessTimeBuffer
+
+
+T1 = datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+T2 = datetime(2024, 1, 1, 11, tzinfo=timezone.utc)
+
+
+class FakeOnepagers:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def bulk_write(self, operations, ordered=True):
+        if self.fail:
+            raise RuntimeError("primary stepped down")
+        self.calls.append((operations, ordered))
+
+
+def _db(collection):
+    return SimpleNamespace(onepagers=collection)
+
+
+def test_reads_collapse_into_one_unordered_bulk_write():
+    a, b = ObjectId(), ObjectId()
+    collection = FakeOnepagers()
+    buffer = AccessTimeBuffer(flush_interval=60)
+    buffer._db = _db(collection)
+
+    buffer.record(a, T2)
+    buffer.record(a, T1)  # Older read arriving late doesn't win
+    buffer.record(b, T1)
+    assert asyncio.run(buffer.flush()) == 2
+
+    operations, ordered = collection.calls[0]
+    assert ordered is False
+    assert operations == [
+        UpdateOne({"_id": a}, {"$max": {"last_accessed": T2}}),
+        UpdateOne({"_id": b}, {"$max": {"last_accessed": T1}}),
+    ]
+    assert asyncio.run(buffer.flush()) == 0
+    assert len(collection.calls) == 1
+
+
+def test_failed_flush_is_retried():
+    onepager_id = ObjectId()
+    collection = FakeOnepagers(fail=True)
+    buffer = AccessTimeBuffer(flush_interval=60)
+    buffer._db = _db(collection)
+
+    buffer.record(onepager_id, T1)
+    assert asyncio.run(buffer.flush()) == 0
+    assert buffer.stats()["pending"] == 1 and buffer.stats()["failed_flushes"] == 1
+
+    collection.fail = False
+    assert asyncio.run(buffer.flush()) == 1
+
+
+def test_stop_flushes_pending_updates():
+    collection = FakeOnepagers()
+    buffer = AccessTimeBuffer(flush_interval=60)
+
+    async def scenario():
+        await buffer.start(_db(collection))
+        buffer.record(ObjectId(), T1)
+        await buffer.stop()
+
+    asyncio.run(scenario())
+    assert len(collection.calls) == 1
+    assert buffer.stats() == {"pending": 0, "flushed": 1, "failed_flushes": 0}
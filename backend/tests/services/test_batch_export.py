@@ -0,0 +1,90 @@
+"""
+Tests for Batch Export Service
+==============================
+
+Unit tests for streamed ZIP output and bounded, completion-order batch
+rendering. The PDF engine is replaced by a fake generator.
+
+Run tests:
+    pytest backend/tests/services/test_batch_export.py -v
+"""
+
+import asyncio
+import io
+import zipfile
+
+import pytest
+
+from backend.services import batch_export
+from backend.services.pdf_cache import PDFCache
+
+
+class FakePDFGenerator:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def generate_pdf(self, html, page_format="letter", **kwargs):
+        FakePDFGenerator.in_flight += 1
+        FakePDFGenerator.max_in_flight = max(FakePDFGenerator.max_in_flight, FakePDFGenerator.in_flight)
+        await asyncio.sleep(0.01)
+        FakePDFGenerator.in_flight -= 1
+        if "broken" in html:
+            raise RuntimeError("render failed")
+        return f"%PDF {html} {page_format}".encode()
+
+
+@pytest.fixture(autouse=True)
+def fake_engine(monkeypatch, tmp_path):
+    FakePDFGenerator.in_flight = 0
+    FakePDFGenerator.max_in_flight = 0
+    monkeypatch.setattr(batch_export, "PDFGenerator", FakePDFGenerator)
+    monkeypatch.setattr(batch_export, "pdf_cache", PDFCache(root=tmp_path, max_bytes=0))
+
+
+async def _collect(stream):
+    return b"".join([chunk async for chunk in stream])
+
+
+def test_stream_zip_produces_valid_archive():
+    async def entries():
+        yield "a/letter.pdf", b"one"
+        yield "a/a4.pdf", b"two"
+
+    data = asyncio.run(_collect(batch_export.stream_zip(entries())))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.namelist() == ["a/letter.pdf", "a/a4.pdf"]
+        assert archive.read("a/a4.pdf") == b"two"
+
+
+def test_batch_zip_respects_concurrency_and_reports_errors():
+    jobs = [
+        {"filename": f"doc{i}.pdf", "html": f"<html>{i}</html>", "format": "letter"}
+        for i in range(6)
+    ]
+    jobs.append({"filename": "bad.pdf", "html": "broken", "format": "a4"})
+
+    async def scenario():
+        results = []
+        async for job, pdf_bytes, error in batch_export.render_pdf_batch(jobs, max_concurrency=2):
+            results.append((job["filename"], error))
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert FakePDFGenerator.max_in_flight <= 2
+    assert len(results) == 7
+    assert dict(results)["bad.pdf"] == "render failed"
+
+
+def test_stream_pdf_batch_zip_includes_error_manifest():
+    jobs = [
+        {"filename": "ok.pdf", "html": "<html></html>", "format": "letter"},
+        {"filename": "bad.pdf", "html": "broken", "format": "letter"},
+    ]
+
+    data = asyncio.run(_collect(batch_export.stream_pdf_batch_zip(jobs)))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert sorted(archive.namelist()) == ["_errors.txt", "ok.pdf"]
+        assert b"bad.pdf" in archive.read("_errors.txt")
@@ -0,0 +1,172 @@
+"""
+Tests for Browser Pool Service
+==============================
+
+Unit tests for warm browser reuse, render-count recycling and crash recovery.
+Playwright is replaced by in-memory fakes so no Chromium install is needed.
+
+Run tests:
+    pytest backend/tests/services/test_browser_pool.py -v
+"""
+
+import asyncio
+import pytest
+
+from backend.services.browser_pool import BrowserPool, BrowserPoolError
+
+
+# ============================================================================
+# Fake Playwright
+# ============================================================================
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+
+    def new_context(self, **kwargs):
+        return FakeContext()
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.closed = True
+        self.connected = False
+
+
+class FakeChromium:
+    def __init__(self):
+        self.browsers = []
+
+    def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+        self.stopped = False
+
+    def start(self):
+        return self
+
+    def stop(self):
+        self.stopped = True
+
+
+def make_pool(**kwargs):
+    instances = []
+
+    def factory():
+        playwright = FakePlaywright()
+        instances.append(playwright)
+        return playwright
+
+    pool = BrowserPool(playwright_factory=factory, **kwargs)
+    return pool, instances
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_run_requires_started_pool():
+    pool, _ = make_pool(size=1)
+
+    with pytest.raises(BrowserPoolError):
+        asyncio.run(pool.run(lambda page: None))
+
+
+def test_pages_are_reused_between_renders():
+    pool, instances = make_pool(size=1, max_renders_per_browser=0)
+
+    async def scenario():
+        await pool.start()
+        first = await pool.run(lambda page: page)
+        second = await pool.run(lambda page: page)
+        await pool.stop()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first is second
+    assert len(instances[0].chromium.browsers) == 1
+    assert instances[0].stopped
+
+
+def test_browser_recycled_after_max_renders():
+    pool, instances = make_pool(size=1, max_renders_per_browser=2)
+
+    async def scenario():
+        await pool.start()
+        for _ in range(5):
+            await pool.run(lambda page: b"%PDF")
+        stats = pool.stats()
+        await pool.stop()
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats["renders"] == 5
+    assert stats["recycles"] == 2
+    assert instances[0].chromium.browsers[0].closed
+
+
+def test_browser_relaunched_after_crash():
+    pool, instances = make_pool(size=1, max_renders_per_browser=0)
+
+    def crash(page):
+        instances[0].chromium.browsers[-1].connected = False
+        raise RuntimeError("Target closed")
+
+    async def scenario():
+        await pool.start()
+        with pytest.raises(RuntimeError):
+            await pool.run(crash)
+        result = await pool.run(lambda page: "ok")
+        stats = pool.stats()
+        await pool.stop()
+        return result, stats
+
+    result, stats = asyncio.run(scenario())
+
+    assert result == "ok"
+    assert stats["crashes"] == 1
+    assert len(instances[0].chromium.browsers) == 2
+
+
+def test_failed_launch_leaves_pool_stopped():
+    class BrokenPlaywright(FakePlaywright):
+        def __init__(self):
+            super().__init__()
+            self.chromium.launch = self._fail
+
+        def _fail(self, **kwargs):
+            raise RuntimeError("Executable doesn't exist")
+
+    pool = BrowserPool(size=2, playwright_factory=BrokenPlaywright)
+
+    asyncio.run(pool.start())
+
+    assert not pool.is_running
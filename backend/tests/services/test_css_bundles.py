@@ -0,0 +1,61 @@
+"""
+Tests for CSS Bundle Service
+============================
+
+Unit tests for CSS minification and compiled stylesheet storage.
+
+Run tests:
+    pytest backend/tests/services/test_css_bundles.py -v
+"""
+
+from backend.services.css_bundles import CSSBundleStore, minify_css
+from backend.services.pdf_html_generator import PDFHTMLGenerator
+
+
+def test_minify_css_keeps_strings_selectors_and_calc():
+    css = """
+    /* Brand variables */
+    :root {
+        --font-heading: 'Open Sans', sans-serif;
+    }
+    .list li::before {
+        content: '✓  ';
+    }
+    .card :first-child > h3,
+    .card p {
+        font-size: calc(10pt * var(--body-scale));
+        margin: 0 auto;
+    }
+    """
+
+    assert minify_css(css) == (
+        ":root{--font-heading:'Open Sans',sans-serif}"
+        ".list li::before{content:'✓  '}"
+        ".card :first-child>h3,.card p{font-size:calc(10pt * var(--body-scale));margin:0 auto}"
+    )
+
+
+def test_bundles_compile_once_and_are_reused_from_disk(tmp_path):
+    env = PDFHTMLGenerator(bytecode_cache_dir="").env
+    brand = {
+        "color_palette": {"primary": "#112233", "secondary": "#445566", "accent": "#778899",
+                          "text": "#000000", "background": "#ffffff"},
+        "typography": {"heading_font": "Montserrat", "body_font": "Inter"},
+        "company_name": "Acme",
+    }
+    layout_params = {"typography": {"h1_scale": 1.2}, "spacing": {"section_gap": "tight"}}
+
+    store = CSSBundleStore(root=tmp_path)
+    css = store.get(env, "onepager_minimalist.html", brand, layout_params)
+    assert "--color-primary:#112233" in css and "\n" not in css
+    assert store.get(env, "onepager_minimalist.html", {**brand, "company_name": "Other"}, layout_params) == css
+    assert store.stats()["compiled"] == 1 and store.stats()["hits"] == 1
+
+    # A new process finds the stored bundle
+    restarted = CSSBundleStore(root=tmp_path)
+    assert restarted.get(env, "onepager_minimalist.html", brand, layout_params) == css
+    assert restarted.stats()["disk_hits"] == 1 and restarted.stats()["compiled"] == 0
+
+    recolored = {**brand, "color_palette": {**brand["color_palette"], "primary": "#abcdef"}}
+    assert "#abcdef" in store.get(env, "onepager_minimalist.html", recolored, layout_params)
+    assert len(list(tmp_path.glob("*.css"))) == 2
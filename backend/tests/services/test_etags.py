@@ -0,0 +1,58 @@
+"""
+Tests for ETag Service
+======================
+
+Unit tests for building ETags and matching If-None-Match headers.
+
+Run tests:
+    pytest backend/tests/services/test_etags.py -v
+"""
+
+from datetime import datetime
+
+from bson import ObjectId
+
+from backend.services.etags import etag_matches, make_etag, not_modified
+
+
+def test_etag_changes_with_updated_at():
+    onepager_id = ObjectId()
+
+    etag = make_etag("onepager", onepager_id, datetime(2025, 3, 1, 12, 0))
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("onepager", onepager_id, datetime(2025, 3, 1, 12, 0))
+    assert etag != make_etag("onepager", onepager_id, datetime(2025, 3, 1, 12, 1))
+    assert etag != make_etag("brand_kit", onepager_id, datetime(2025, 3, 1, 12, 0))
+
+
+def test_weak_etag_matches_its_strong_form():
+    weak = make_etag("onepager", "abc", weak=True)
+
+    assert weak.startswith('W/"')
+    assert weak.removeprefix("W/") == make_etag("onepager", "abc")
+    assert etag_matches(weak, weak)
+    assert etag_matches(weak.removeprefix("W/"), weak)
+
+
+def test_if_none_match_comparison():
+    etag = make_etag("onepager", "abc")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(etag.strip('"'), etag)
+
+
+def test_not_modified_response():
+    etag = make_etag("preview", "key")
+
+    response = not_modified(etag)
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "private, no-cache"
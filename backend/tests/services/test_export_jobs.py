@@ -0,0 +1,145 @@
+"""
+Tests for Export Job Worker Service
+===================================
+
+Unit tests for job completion, retry and permanent failure handling,
+per-claim leases and lease renewal. MongoDB and the PDF engine are
+replaced by in-memory fakes.
+
+Run tests:
+    pytest backend/tests/services/test_export_jobs.py -v
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services import export_jobs
+from backend.services.export_jobs import ExportJobWorkerPool
+from backend.services.pdf_cache import PDFCache
+
+
+class FakeCollection:
+    def __init__(self, doc):
+        self.doc = doc
+        self.claims = []
+        self.many = []
+
+    async def update_one(self, query, update):
+        if query["_id"] == self.doc["_id"] and query.get("lease_id") == self.doc.get("lease_id"):
+            self.doc.update(update.get("$set", {}))
+            for field in update.get("$unset", {}):
+                self.doc.pop(field, None)
+        return SimpleNamespace(modified_count=1)
+
+    async def update_many(self, query, update):
+        self.many.append((query, update))
+        return SimpleNamespace(modified_count=0)
+
+    async def find_one_and_update(self, query, update, **kwargs):
+        self.claims.append(query)
+        return {**self.doc, **update["$set"]}
+
+
+class FakePDFGenerator:
+    fail = False
+
+    async def generate_pdf(self, html, page_format="letter", **kwargs):
+        if FakePDFGenerator.fail:
+            raise RuntimeError("browser crashed")
+        return b"%PDF " + html.encode()
+
+
+@pytest.fixture
+def pool(monkeypatch, tmp_path):
+    FakePDFGenerator.fail = False
+    monkeypatch.setattr(export_jobs, "PDFGenerator", FakePDFGenerator)
+    monkeypatch.setattr(export_jobs, "pdf_cache", PDFCache(root=tmp_path, max_bytes=0))
+    return ExportJobWorkerPool(concurrency=1, max_attempts=2)
+
+
+def _claimed_job(pool, attempts=1):
+    doc = {
+        "_id": "job1",
+        "user_id": "user1",
+        "status": "running",
+        "lease_id": "lease1",
+        "format": "letter",
+        "html": "<html></html>",
+        "cache_key": "abc",
+        "attempts": attempts,
+    }
+    pool._db = SimpleNamespace(export_jobs=FakeCollection(doc))
+    return doc
+
+
+def test_run_stores_pdf_and_completes(pool):
+    doc = _claimed_job(pool)
+
+    asyncio.run(pool._run(dict(doc)))
+
+    assert doc["status"] == "completed"
+    assert doc["progress"] == 100
+    assert bytes(doc["result_pdf"]) == b"%PDF <html></html>"
+    assert "html" not in doc and "expires_at" in doc
+
+
+def test_run_requeues_then_fails_after_max_attempts(pool):
+    FakePDFGenerator.fail = True
+    doc = _claimed_job(pool, attempts=1)
+
+    asyncio.run(pool._run(dict(doc)))
+    assert doc["status"] == "queued"
+    assert doc["error"] == "browser crashed"
+    assert "lease_id" not in doc
+
+    doc.update(status="running", attempts=2, lease_id="lease2")
+    asyncio.run(pool._run(dict(doc)))
+    assert doc["status"] == "failed"
+    assert "finished_at" in doc
+
+
+def test_stale_lease_cannot_overwrite_a_reclaimed_job(pool):
+    doc = _claimed_job(pool)
+    doc["lease_id"] = "lease2"
+
+    asyncio.run(pool._run({**doc, "lease_id": "lease1"}))
+
+    assert doc["status"] == "running"
+    assert "result_pdf" not in doc
+
+
+def test_every_claim_gets_its_own_lease(pool):
+    _claimed_job(pool)
+
+    first = asyncio.run(pool._claim())
+    second = asyncio.run(pool._claim())
+
+    assert first["lease_id"] != second["lease_id"]
+    abandoned = pool._db.export_jobs.claims[0]["$or"][1]
+    assert abandoned["attempts"] == {"$lt": pool.max_attempts}
+
+
+def test_expired_jobs_fail_once_attempts_are_exhausted(pool):
+    _claimed_job(pool)
+
+    asyncio.run(pool.requeue_expired())
+
+    (failed_query, failed_update), (requeue_query, requeue_update) = pool._db.export_jobs.many
+    assert failed_query["attempts"] == {"$gte": pool.max_attempts}
+    assert failed_update["$set"]["status"] == "failed"
+    assert requeue_query["attempts"] == {"$lt": pool.max_attempts}
+    assert requeue_update["$set"]["status"] == "queued"
+
+
+def test_heartbeat_extends_leases_of_active_jobs(pool):
+    _claimed_job(pool)
+    pool._active_jobs = {"job1": "lease1"}
+
+    asyncio.run(pool.renew_leases())
+
+    (query, update), = pool._db.export_jobs.many
+    assert query["lease_id"] == {"$in": ["lease1"]}
+    assert update["$set"]["lease_expires_at"] > datetime.now(timezone.utc) + timedelta(seconds=pool.lease_seconds - 5)
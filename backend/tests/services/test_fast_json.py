@@ -0,0 +1,104 @@
+"""
+Tests for Fast JSON Service
+===========================
+
+Unit tests checking the single-pass JSON responses produce the same body
+as FastAPI's response_model serialization.
+
+Run tests:
+    pytest backend/tests/services/test_fast_json.py -v
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import List
+
+from bson import ObjectId
+from pydantic import TypeAdapter
+
+from backend.brand_kits.schemas import BrandKitResponse
+from backend.models.brand_kit import brand_kit_helper
+from backend.models.onepager import onepager_helper, onepager_summary_helper
+from backend.onepagers.schemas import OnePagerResponse, OnePagerSummary
+from backend.services.fast_json import ORJSONResponse, model_response
+
+
+NOW = datetime(2025, 3, 1, 12, 30, 0, 123000)
+
+
+def make_onepager_doc():
+    return {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "brand_kit_id": None,
+        "title": "Launch plan",
+        "status": "draft",
+        "content": {"headline": "Grow faster", "sections": [{"id": "s1", "type": "text", "content": "Hi", "order": 0}]},
+        "layout": [],
+        "generation_metadata": {"prompts": [], "ai_model": "gpt-4", "last_generated_at": NOW, "product_id": "p1"},
+        "created_at": NOW,
+        "updated_at": NOW
+    }
+
+
+def framework_body(response_type, value):
+    """What FastAPI sends for a route returning value with response_model=response_type."""
+    adapter = TypeAdapter(response_type)
+    return json.loads(adapter.dump_json(adapter.validate_python(value), by_alias=True))
+
+
+def test_model_response_matches_response_model_body():
+    data = onepager_helper(make_onepager_doc())
+
+    response = model_response(OnePagerResponse, data, headers={"ETag": '"abc"'})
+
+    body = json.loads(response.body)
+    assert body == framework_body(OnePagerResponse, OnePagerResponse(**data))
+    assert "product_id" not in body["generation_metadata"]
+    assert body["content"]["features"] == []
+    assert response.media_type == "application/json"
+    assert response.headers["ETag"] == '"abc"'
+
+
+def test_model_response_uses_aliases_for_lists():
+    brand_kit = {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "company_name": "Acme",
+        "color_palette": {"primary": "#000000", "secondary": "#111111", "accent": "#222222"},
+        "created_at": NOW,
+        "updated_at": NOW
+    }
+
+    body = json.loads(model_response(List[BrandKitResponse], [brand_kit_helper(brand_kit)]).body)
+
+    assert body[0]["_id"] == str(brand_kit["_id"])
+    assert body == framework_body(List[BrandKitResponse], [BrandKitResponse(**brand_kit_helper(brand_kit))])
+
+
+def test_orjson_summaries_match_response_model_body():
+    docs = [make_onepager_doc() for _ in range(3)]
+    summaries = [onepager_summary_helper(doc) for doc in docs]
+
+    body = json.loads(ORJSONResponse(summaries).body)
+
+    assert body == framework_body(List[OnePagerSummary], summaries)
+
+
+def test_orjson_encodes_object_ids_and_utc_datetimes():
+    object_id = ObjectId()
+
+    body = ORJSONResponse({"id": object_id, "at": datetime(2025, 1, 1, tzinfo=timezone.utc)}).body
+
+    assert json.loads(body) == {"id": str(object_id), "at": "2025-01-01T00:00:00Z"}
+
+
+def test_detail_projection_covers_onepager_helper():
+    from backend.models.onepager import ONEPAGER_DETAIL_PROJECTION
+
+    doc = {**make_onepager_doc(), "version_count": 3, "last_accessed": NOW, "pdf_template": "bold"}
+    projected = {k: v for k, v in doc.items() if k == "_id" or k in ONEPAGER_DETAIL_PROJECTION}
+
+    assert onepager_helper(projected) == onepager_helper(doc)
+    # Unmigrated documents count their embedded history server-side
+    assert "$version_history" in str(ONEPAGER_DETAIL_PROJECTION["version_count"])
@@ -0,0 +1,163 @@
+"""
+Tests for Font Store Service
+============================
+
+Unit tests for Google Fonts query parsing, local CSS generation, the font
+bytes LRU and offline request routing.
+
+Run tests:
+    pytest backend/tests/services/test_font_store.py -v
+"""
+
+import pytest
+
+from backend.services.font_store import (
+    FontStore,
+    LOCAL_FONT_URL_PREFIX,
+    _ByteLRU,
+    parse_css2_query
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    inter = tmp_path / "Inter"
+    inter.mkdir()
+    (inter / "400.woff2").write_bytes(b"inter-400")
+    (inter / "700.woff2").write_bytes(b"inter-700")
+    return FontStore(root=tmp_path, max_cache_bytes=1024, offline=True)
+
+
+class FakeRequest:
+    def __init__(self, url):
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, url):
+        self.request = FakeRequest(url)
+        self.result = None
+
+    def fulfill(self, **kwargs):
+        self.result = ("fulfill", kwargs)
+
+    def abort(self):
+        self.result = ("abort", None)
+
+    def continue_(self):
+        self.result = ("continue", None)
+
+
+def test_parse_css2_query():
+    query = (
+        "family=Open+Sans:wght@600;400&family=Inter"
+        "&family=Lato:ital,wght@0,300;1,700&display=swap"
+    )
+
+    assert parse_css2_query(query) == [
+        ("Open Sans", [400, 600]),
+        ("Inter", [400]),
+        ("Lato", [300]),
+    ]
+
+
+def test_build_css_uses_nearest_stored_weight(store):
+    css, missing = store.build_css("family=Inter:wght@500;900&family=Lato")
+
+    assert missing == ["Lato"]
+    assert "font-weight: 500" in css
+    assert f"{LOCAL_FONT_URL_PREFIX}Inter/400.woff2" in css
+    assert f"{LOCAL_FONT_URL_PREFIX}Inter/700.woff2" in css
+
+
+def test_font_route_served_from_store_and_cached(store):
+    route = FakeRoute(f"{LOCAL_FONT_URL_PREFIX}Inter/700.woff2")
+
+    store._handle_font(route)
+    store._handle_font(route)
+
+    action, kwargs = route.result
+    assert action == "fulfill"
+    assert kwargs["body"] == b"inter-700"
+    assert store.misses == 1
+    assert store.hits == 1
+
+
+def test_cdn_requests_aborted_when_offline(store):
+    route = FakeRoute("https://fonts.gstatic.com/s/inter/v13/abc.woff2")
+
+    store._handle_font(route)
+
+    assert route.result == ("abort", None)
+
+
+def test_missing_family_falls_through_when_online(tmp_path):
+    store = FontStore(root=tmp_path, offline=False)
+    route = FakeRoute("https://fonts.googleapis.com/css2?family=Lato&display=swap")
+
+    store._handle_css(route)
+
+    assert route.result == ("continue", None)
+
+
+def test_byte_lru_evicts_least_recently_used():
+    cache = _ByteLRU(max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    cache.get("a")
+    cache.put("c", b"1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.current_bytes == 8
+
+
+def test_partially_stored_query_falls_through_when_online(tmp_path):
+    (tmp_path / "Inter").mkdir()
+    (tmp_path / "Inter" / "400.woff2").write_bytes(b"inter-400")
+    store = FontStore(root=tmp_path, offline=False)
+    route = FakeRoute("https://fonts.googleapis.com/css2?family=Inter&family=Montserrat")
+
+    store._handle_css(route)
+
+    assert route.result == ("continue", None)
+
+
+def test_family_names_cannot_leave_the_store(tmp_path):
+    root = tmp_path / "fonts"
+    (root / "Inter").mkdir(parents=True)
+    (root / "Inter" / "400.woff2").write_bytes(b"inter-400")
+    (tmp_path / "secret").mkdir()
+    (tmp_path / "secret" / "400.woff2").write_bytes(b"secret")
+    store = FontStore(root=root, offline=True)
+
+    for family in ("../secret", "..", "Inter/../../secret", "/etc", "..\\secret"):
+        assert store.available_weights(family) == []
+        assert store.get_font_bytes(family, 400) is None
+
+    route = FakeRoute(f"{LOCAL_FONT_URL_PREFIX}..%2Fsecret/400.woff2")
+    store._handle_font(route)
+    assert route.result == ("fulfill", {"status": 404, "body": ""})
+
+
+def test_fingerprint_changes_when_fonts_are_added(tmp_path):
+    before = FontStore(root=tmp_path).fingerprint()
+    (tmp_path / "Inter").mkdir()
+    (tmp_path / "Inter" / "400.woff2").write_bytes(b"inter-400")
+
+    assert FontStore(root=tmp_path).fingerprint() != before
+
+
+def test_empty_store_warns(tmp_path, caplog):
+    FontStore(root=tmp_path / "missing").check()
+
+    assert "is empty" in caplog.text
+
+
+def test_offline_by_default_and_reports_missing_defaults(store, tmp_path, caplog):
+    assert FontStore(root=tmp_path).offline is True
+    assert store.missing_defaults() == ["Montserrat"]
+
+    store.check()
+
+    assert "lacks Montserrat" in caplog.text
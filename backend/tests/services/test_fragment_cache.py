@@ -0,0 +1,80 @@
+"""
+Tests for Template Fragment Cache Service
+=========================================
+
+Unit tests for per-section fragment caching: cached renders match
+uncached ones and an edit only re-renders the section it touched.
+
+Run tests:
+    pytest backend/tests/services/test_fragment_cache.py -v
+"""
+
+import pytest
+from bson import ObjectId
+
+from backend.models.brand_kit import BrandKitInDB
+from backend.models.onepager import OnePagerLayout
+from backend.services import fragment_cache as fragment_cache_module
+from backend.services.html_cache import HTMLRenderCache
+from backend.services.pdf_html_generator import PDFHTMLGenerator, TEMPLATE_MAP
+
+
+def _onepager(benefits_title="Benefits"):
+    return OnePagerLayout(
+        title="Acme Analytics",
+        elements=[
+            {"id": "hero", "type": "hero", "order": 0,
+             "content": {"headline": "Know your numbers", "description": "Dashboards for 50+ clients"}},
+            {"id": "features", "type": "list", "title": "Features", "order": 1,
+             "content": ["Live charts", "Exports"]},
+            {"id": "benefits", "type": "list", "title": benefits_title, "order": 2,
+             "content": ["Save time", "Decide faster"]},
+            {"id": "about", "type": "text", "title": "About", "order": 3,
+             "content": "We build reporting tools."},
+            {"id": "cta", "type": "button", "order": 4,
+             "content": {"text": "Book a demo", "url": "https://example.com"}},
+        ],
+    )
+
+
+def _brand_kit():
+    return BrandKitInDB(
+        _id=ObjectId(),
+        user_id=ObjectId(),
+        company_name="Acme",
+        color_palette={"primary": "#0ea5e9", "secondary": "#64748b", "accent": "#10b981"},
+    )
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = HTMLRenderCache(max_bytes=1024 * 1024)
+    monkeypatch.setattr(fragment_cache_module, "fragment_cache", cache)
+    return cache
+
+
+@pytest.mark.parametrize("template_name", sorted(TEMPLATE_MAP))
+def test_cached_render_matches_uncached(cache, template_name):
+    generator = PDFHTMLGenerator(bytecode_cache_dir="")
+    onepager, brand_kit = _onepager(), _brand_kit()
+
+    first = generator.generate_html(onepager, brand_kit, template_name=template_name)
+    second = generator.generate_html(onepager, brand_kit, template_name=template_name)
+
+    assert second == first
+    assert cache.stats()["hits"] == cache.stats()["misses"] > 0
+
+
+def test_edit_rerenders_only_changed_section(cache):
+    generator = PDFHTMLGenerator(bytecode_cache_dir="")
+    brand_kit = _brand_kit()
+
+    generator.generate_html(_onepager(), brand_kit, template_name="bold")
+    fragments = cache.stats()["entries"]
+
+    html = generator.generate_html(_onepager("Why teams switch"), brand_kit, template_name="bold")
+
+    assert "Why teams switch" in html
+    # Only the edited section produced a new fragment
+    assert cache.stats()["entries"] == fragments + 1
+    assert cache.stats()["hits"] == fragments - 1
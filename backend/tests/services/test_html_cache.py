@@ -0,0 +1,62 @@
+"""
+Tests for Rendered HTML Cache Service
+=====================================
+
+Unit tests for HTML cache keys (invalidation on updated_at) and the
+size-bounded LRU.
+
+Run tests:
+    pytest backend/tests/services/test_html_cache.py -v
+"""
+
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+from backend.services.html_cache import HTMLRenderCache, make_html_cache_key
+
+
+def _docs():
+    brand_kit_id = ObjectId()
+    onepager = {
+        "_id": ObjectId(),
+        "brand_kit_id": brand_kit_id,
+        "updated_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "layout_params": {"spacing": {"section_gap": "tight"}},
+    }
+    brand_kit = {"_id": brand_kit_id, "updated_at": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+    return onepager, brand_kit
+
+
+def test_key_changes_when_onepager_or_brand_kit_is_updated():
+    onepager, brand_kit = _docs()
+    key = make_html_cache_key(onepager, brand_kit, "bold")
+
+    assert make_html_cache_key(onepager, brand_kit, "bold") == key
+    assert make_html_cache_key(onepager, brand_kit, "minimalist") != key
+    assert make_html_cache_key({**onepager, "updated_at": datetime.now(timezone.utc)}, brand_kit, "bold") != key
+    assert make_html_cache_key(onepager, {**brand_kit, "updated_at": datetime.now(timezone.utc)}, "bold") != key
+
+
+def test_default_brand_kit_key_is_stable():
+    onepager, _ = _docs()
+    onepager["brand_kit_id"] = None
+
+    first = make_html_cache_key(onepager, {"_id": ObjectId()}, "bold")
+    second = make_html_cache_key(onepager, {"_id": ObjectId()}, "bold")
+
+    assert first == second
+    assert make_html_cache_key({**onepager, "updated_at": None}, {"_id": ObjectId()}, "bold") is None
+
+
+def test_lru_eviction_bounded_by_size():
+    cache = HTMLRenderCache(max_bytes=10)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    assert cache.get("a") == "aaaa"
+
+    cache.put("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa" and cache.get("c") == "cccc"
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,218 @@
+"""
+Tests for One-Pager Versions Service
+====================================
+
+Unit tests for delta-encoded versions (JSON Patch against the previous
+version, periodic keyframes), their reconstruction, and moving legacy
+embedded version_history. MongoDB is replaced by in-memory fakes.
+
+Run tests:
+    pytest backend/tests/services/test_onepager_versions.py -v
+"""
+
+import asyncio
+import copy
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from backend.services import onepager_versions
+from backend.services.json_patch import apply_patch, make_patch
+from backend.services.onepager_versions import (
+    get_version, list_versions, migrate_embedded_history, record_version, store_pending_version
+)
+
+
+T1 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, field, direction):
+        self.docs = sorted(self.docs, key=lambda d: d[field], reverse=direction < 0)
+        return self
+
+    def skip(self, n):
+        self.docs = self.docs[n:]
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    async def to_list(self, length=None):
+        return [copy.deepcopy(d) for d in self.docs]
+
+
+class FakeVersions:
+    """Enforces the unique (onepager_id, version) index; supports $gte/$lt/$lte."""
+
+    def __init__(self):
+        self.docs = {}
+
+    @staticmethod
+    def _matches(doc, query):
+        for field, cond in query.items():
+            if isinstance(cond, dict):
+                value = doc[field]
+                ok = {"$gte": value >= cond.get("$gte", value), "$lt": "$lt" not in cond or value < cond["$lt"],
+                      "$lte": value <= cond.get("$lte", value)}
+                if not all(ok.values()):
+                    return False
+            elif doc.get(field) != cond:
+                return False
+        return True
+
+    async def update_one(self, query, update, upsert=False):
+        key = (query["onepager_id"], query["version"])
+        if key not in self.docs and upsert:
+            self.docs[key] = copy.deepcopy({**query, **update["$setOnInsert"]})
+
+    async def insert_many(self, docs, ordered=True):
+        inserted = []
+        for doc in docs:
+            key = (doc["onepager_id"], doc["version"])
+            if key not in self.docs:
+                self.docs[key] = copy.deepcopy(doc)
+                inserted.append(key)
+        if len(inserted) < len(docs):
+            raise BulkWriteError({"nInserted": len(inserted), "writeErrors": [{"code": 11000}]})
+        return SimpleNamespace(inserted_ids=inserted)
+
+    async def find_one(self, query):
+        return next((copy.deepcopy(d) for d in self.docs.values() if self._matches(d, query)), None)
+
+    def find(self, query, projection=None):
+        return FakeCursor([d for d in self.docs.values() if self._matches(d, query)])
+
+    async def count_documents(self, query):
+        return sum(1 for d in self.docs.values() if self._matches(d, query))
+
+
+class FakeOnepagers:
+    def __init__(self):
+        self.updates = []
+
+    async def update_one(self, query, update):
+        self.updates.append((query, update))
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(onepager_versions.settings, "version_keyframe_interval", 4)
+    onepager_versions._latest_states.clear()
+    return SimpleNamespace(onepagers=FakeOnepagers(), onepager_versions=FakeVersions())
+
+
+def _content(i):
+    sections = [{"id": f"s{n}", "type": "text", "title": f"Section {n}", "content": "Long copy " * 50}
+                for n in range(8)]
+    sections[i % 8]["title"] = f"Edited {i}"
+    if i % 3 == 0:
+        sections.insert(2, {"id": f"new{i}", "type": "text", "content": "Inserted"})
+    return {"headline": f"Headline {i}", "sections": sections}
+
+
+def test_json_patch_round_trip():
+    old = {"a": 1, "b/c": [1, 2, 3, 4], "d": {"x": "y"}}
+    new = {"b/c": [1, 9, 2, 3, 4], "d": {"x": "z"}, "e": None}
+    assert apply_patch(copy.deepcopy(old), make_patch(old, new)) == new
+    # One inserted list item is one add, not a replace of every following item
+    assert make_patch([1, 2, 3, 4], [1, 9, 2, 3, 4]) == [{"op": "add", "path": "/1", "value": 9}]
+
+
+def test_versions_are_deltas_between_keyframes_and_rebuild_exactly(db):
+    onepager = {"_id": ObjectId(), "user_id": ObjectId(), "layout": []}
+    states = {}
+    for version in range(1, 11):
+        onepager.update(version_count=version, content=_content(version),
+                        layout_params={"spacing": {"section_gap": version}})
+        asyncio.run(record_version(db, onepager, f"Edit {version}", T1))
+        states[version] = copy.deepcopy(onepager["content"])
+
+    stored = db.onepager_versions.docs
+    keyframes = sorted(v for (_, v), doc in stored.items() if "patch" not in doc)
+    assert keyframes == [1, 5, 9]
+
+    # Rebuild from the database only (no in-memory latest state)
+    onepager_versions._latest_states.clear()
+    for version in (1, 4, 7, 10):
+        snapshot = asyncio.run(get_version(db, onepager["_id"], version))
+        assert snapshot["content"] == states[version]
+        assert snapshot["layout_params"] == {"spacing": {"section_gap": version}}
+
+    items, total = asyncio.run(list_versions(db, onepager["_id"], skip=2, limit=3))
+    assert total == 10
+    assert [item["version"] for item in items] == [8, 7, 6]
+    assert [item["content"] for item in items] == [states[8], states[7], states[6]]
+
+
+def test_missing_previous_version_stores_a_keyframe(db):
+    onepager = {"_id": ObjectId(), "user_id": ObjectId(), "version_count": 3, "content": {"headline": "New"}}
+
+    asyncio.run(record_version(db, onepager, "Shorter headline", T1))
+
+    stored = db.onepager_versions.docs[(onepager["_id"], 3)]
+    assert "patch" not in stored and stored["content"] == {"headline": "New"}
+
+
+def test_embedded_history_is_moved_once(db):
+    onepager = {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "content": {"headline": "Current"},
+        "layout_params": {"spacing": {}},
+        "version_history": [
+            {"version": 1, "content": {"headline": "First"}, "layout": [], "created_at": T1},
+            {"version": 2, "content": {"headline": "Second"}, "layout": [], "created_at": T1,
+             "change_description": "Edit"},
+        ],
+    }
+
+    assert asyncio.run(migrate_embedded_history(db, onepager)) == 2
+    assert "patch" in db.onepager_versions.docs[(onepager["_id"], 2)]
+    first = asyncio.run(get_version(db, onepager["_id"], 1))
+    assert first["content"] == {"headline": "First"}
+    assert first["layout_params"] is None  # Not taken from the current document
+    assert asyncio.run(get_version(db, onepager["_id"], 2))["content"] == {"headline": "Second"}
+
+    query, update = db.onepagers.updates[0]
+    assert update == {"$unset": {"version_history": ""}, "$max": {"version_count": 2}}
+
+    # A concurrent request migrating the same history copies nothing twice
+    assert asyncio.run(migrate_embedded_history(db, onepager)) == 0
+    assert len(db.onepager_versions.docs) == 2
+
+
+def test_recording_a_version_again_is_a_no_op(db):
+    onepager = {"_id": ObjectId(), "user_id": ObjectId(), "version_count": 1, "content": _content(1)}
+    asyncio.run(record_version(db, onepager, "First", T1))
+
+    asyncio.run(record_version(db, {**onepager, "content": _content(2)}, "Replayed", T1))
+
+    stored = db.onepager_versions.docs[(onepager["_id"], 1)]
+    assert stored["change_description"] == "First"
+    assert stored["content"] == _content(1)
+
+
+def test_pending_version_is_stored_and_cleared(db):
+    onepager = {
+        "_id": ObjectId(), "user_id": ObjectId(), "version_count": 3, "content": _content(3),
+        "pending_version": {"version": 3, "change_description": "Crashed edit", "created_at": T1}
+    }
+
+    assert asyncio.run(store_pending_version(db, onepager)) is True
+
+    snapshot = asyncio.run(get_version(db, onepager["_id"], 3))
+    assert snapshot["content"] == _content(3)
+    assert snapshot["change_description"] == "Crashed edit"
+    assert db.onepagers.updates == [(
+        {"_id": onepager["_id"], "pending_version.version": 3},
+        {"$unset": {"pending_version": ""}}
+    )]
+    assert asyncio.run(store_pending_version(db, {"_id": onepager["_id"]})) is False
@@ -0,0 +1,177 @@
+"""
+Tests for One-Pager Write Service
+=================================
+
+Unit tests for the single round-trip update pipeline, its optimistic
+concurrency check and the pending version marker. MongoDB is replaced by
+an in-memory fake.
+
+Run tests:
+    pytest backend/tests/services/test_onepager_writes.py -v
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+
+from backend.models.onepager import VERSION_COUNT_EXPR
+from backend.services.onepager_writes import (
+    OnePagerAccessError, OnePagerWriteConflictError, build_update_pipeline, update_onepager_fields
+)
+from backend.services.render_snapshot import apply_set
+
+
+T1 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+T2 = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+class FakeOnepagers:
+    """Applies literals and the version counter; enough to check filters and markers."""
+
+    def __init__(self, doc, concurrent_write=False):
+        self.doc = doc
+        self.concurrent_write = concurrent_write
+        self.filters = []
+        self.lookups = 0
+        self.unsets = []
+
+    async def find_one_and_update(self, query, pipeline, projection=None, return_document=None):
+        self.filters.append(query)
+        if self.concurrent_write:
+            self.doc = {**self.doc, "content": {"headline": "Concurrent"}, "updated_at": datetime.now(timezone.utc)}
+        if any(self.doc.get(field) != value for field, value in query.items()):
+            return None
+        stage = pipeline[0]["$set"]
+        literals = {k: v["$literal"] for k, v in stage.items() if "$literal" in v}
+        self.doc = apply_set(self.doc, literals)
+        if "pending_version" in stage:
+            version = self.doc.get("version_count", 0) + 1
+            self.doc["version_count"] = version
+            self.doc["pending_version"] = {
+                "version": version,
+                "change_description": stage["pending_version"]["change_description"]["$literal"],
+                "created_at": stage["pending_version"]["created_at"]["$literal"]
+            }
+        return self.doc
+
+    async def find_one(self, query, projection=None):
+        self.lookups += 1
+        return self.doc if self.doc["_id"] == query["_id"] else None
+
+    async def update_one(self, query, update):
+        self.unsets.append(query)
+        self.doc.pop("pending_version", None)
+
+
+class FakeVersions:
+    def __init__(self):
+        self.docs = {}
+
+    async def update_one(self, query, update, upsert=False):
+        self.docs.setdefault((query["onepager_id"], query["version"]), {**query, **update["$setOnInsert"]})
+
+    async def find_one(self, query):
+        return self.docs.get((query["onepager_id"], query["version"]))
+
+
+def _db(onepager, **kwargs):
+    return SimpleNamespace(onepagers=FakeOnepagers(dict(onepager), **kwargs), onepager_versions=FakeVersions())
+
+
+def _onepager():
+    return {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "title": "Acme",
+        "updated_at": T1,
+        "version_count": 0,
+        "content": {"headline": "Old", "sections": []},
+    }
+
+
+def test_pipeline_sets_literals_and_counts_versions():
+    pipeline = build_update_pipeline(
+        {"content.headline": "$10M revenue", "updated_at": T2},
+        new_version={"change_description": "Edit", "created_at": T2}
+    )
+
+    stage = pipeline[0]["$set"]
+    assert stage["content.headline"] == {"$literal": "$10M revenue"}
+    assert stage["pending_version"]["version"] == stage["version_count"]
+    plain = build_update_pipeline({"updated_at": T2})[0]["$set"]
+    assert "pending_version" not in plain
+    # Unmigrated documents get their embedded history counted
+    assert plain["version_count"] == VERSION_COUNT_EXPR
+
+
+def test_update_is_one_round_trip_guarded_by_owner_and_read_version():
+    onepager = _onepager()
+    db = _db(onepager)
+
+    updated = asyncio.run(update_onepager_fields(
+        db, onepager, onepager["user_id"], {"content.headline": "New", "updated_at": T2}
+    ))
+
+    assert updated["content"]["headline"] == "New"
+    assert updated["render_snapshot"]["source_updated_at"] == T2
+    assert db.onepagers.filters == [{"_id": onepager["_id"], "user_id": onepager["user_id"], "updated_at": T1}]
+    assert db.onepagers.lookups == 0
+
+
+def test_conflict_is_reported_without_replaying_stale_fields():
+    onepager = _onepager()
+    db = _db(onepager, concurrent_write=True)
+
+    with pytest.raises(OnePagerWriteConflictError):
+        asyncio.run(update_onepager_fields(
+            db, onepager, onepager["user_id"], {"content.headline": "From stale read", "updated_at": T2}
+        ))
+
+    assert db.onepagers.doc["content"]["headline"] == "Concurrent"
+    assert len(db.onepagers.filters) == 1
+    assert db.onepagers.lookups == 1
+
+
+def test_missing_and_foreign_one_pagers():
+    onepager = _onepager()
+
+    with pytest.raises(OnePagerAccessError):
+        asyncio.run(update_onepager_fields(_db(onepager), onepager, ObjectId(), {"updated_at": T2}))
+
+    missing = {**onepager, "_id": ObjectId()}
+    assert asyncio.run(update_onepager_fields(_db(onepager), missing, onepager["user_id"], {"updated_at": T2})) is None
+
+
+def test_versioned_edit_writes_version_and_clears_marker():
+    onepager = _onepager()
+    db = _db(onepager)
+
+    updated = asyncio.run(update_onepager_fields(
+        db, onepager, onepager["user_id"], {"content.headline": "New", "updated_at": T2},
+        change_description="Edit"
+    ))
+
+    assert updated["version_count"] == 1
+    assert "pending_version" not in db.onepagers.doc
+    version_doc = db.onepager_versions.docs[(onepager["_id"], 1)]
+    assert version_doc["content"]["headline"] == "New"
+    assert version_doc["change_description"] == "Edit"
+
+
+def test_version_lost_by_a_crash_is_written_by_the_next_edit():
+    onepager = {
+        **_onepager(),
+        "version_count": 1,
+        "content": {"headline": "Versioned", "sections": []},
+        "pending_version": {"version": 1, "change_description": "Crashed", "created_at": T1}
+    }
+    db = _db(onepager)
+
+    asyncio.run(update_onepager_fields(db, onepager, onepager["user_id"], {"title": "Renamed", "updated_at": T2}))
+
+    version_doc = db.onepager_versions.docs[(onepager["_id"], 1)]
+    assert version_doc["content"]["headline"] == "Versioned"
+    assert version_doc["change_description"] == "Crashed"
@@ -0,0 +1,84 @@
+"""
+Tests for Page Readiness Service
+================================
+
+Unit tests for the network-idle/fonts/images readiness wait that replaced
+the fixed 1-second sleep after set_content().
+
+Run tests:
+    pytest backend/tests/services/test_page_readiness.py -v
+"""
+
+import pytest
+
+from backend.services.page_readiness import load_html_and_wait, readiness_stats
+
+
+class FakePage:
+    """Minimal sync Page: emits request events and simulates a clock."""
+
+    def __init__(self, pending_requests=0, finish_after_ms=0, assets_ready=True):
+        self.listeners = {}
+        self.pending_requests = pending_requests
+        self.finish_after_ms = finish_after_ms
+        self.assets_ready = assets_ready
+        self.waited_ms = 0
+        self.set_content_kwargs = None
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+    def _emit(self, event, payload):
+        for handler in list(self.listeners.get(event, [])):
+            handler(payload)
+
+    def set_content(self, html, **kwargs):
+        self.set_content_kwargs = kwargs
+        self.requests = [object() for _ in range(self.pending_requests)]
+        for request in self.requests:
+            self._emit("request", request)
+
+    def wait_for_timeout(self, ms):
+        self.waited_ms += ms
+        if self.requests and self.waited_ms >= self.finish_after_ms:
+            for request in self.requests:
+                self._emit("requestfinished", request)
+            self.requests = []
+
+    def evaluate(self, script, arg):
+        return self.assets_ready
+
+
+def test_ready_mode_skips_fixed_wait_when_nothing_pending():
+    page = FakePage()
+
+    load_html_and_wait(page, "<html></html>", mode="ready", timeout_ms=5000)
+
+    assert page.waited_ms == 0
+    assert page.set_content_kwargs == {"wait_until": "domcontentloaded"}
+    assert all(not handlers for handlers in page.listeners.values())
+
+
+def test_ready_mode_waits_for_inflight_requests():
+    page = FakePage(pending_requests=2, finish_after_ms=30)
+
+    load_html_and_wait(page, "<html></html>", mode="ready", timeout_ms=5000)
+
+    assert 30 <= page.waited_ms < 1000
+
+
+def test_deadline_counts_as_timeout():
+    before = readiness_stats["timeouts"]
+    page = FakePage(assets_ready=False)
+
+    load_html_and_wait(page, "<html></html>", mode="ready", timeout_ms=50)
+
+    assert readiness_stats["timeouts"] == before + 1
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError):
+        load_html_and_wait(FakePage(), "<html></html>", mode="sleep")
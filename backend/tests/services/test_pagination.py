@@ -0,0 +1,57 @@
+"""
+Tests for Pagination Service
+============================
+
+Unit tests for encoding, decoding and filtering with keyset cursors.
+
+Run tests:
+    pytest backend/tests/services/test_pagination.py -v
+"""
+
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from backend.services.pagination import decode_cursor, encode_cursor, keyset_filter
+
+
+def test_cursor_round_trip():
+    doc = {"_id": ObjectId(), "created_at": datetime(2025, 3, 1, 12, 30, 0, 123000)}
+
+    cursor = encode_cursor(doc)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (doc["created_at"], doc["_id"])
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", encode_cursor({"_id": "xyz", "created_at": datetime(2025, 1, 1)})])
+def test_invalid_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_keyset_filter_selects_documents_after_cursor():
+    created_at = datetime(2025, 3, 1)
+    object_id = ObjectId()
+
+    assert keyset_filter(created_at, object_id) == {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "_id": {"$lt": object_id}}
+    ]}
+
+
+def test_list_route_documents_cursor_and_caps_skip():
+    from fastapi import FastAPI
+
+    from backend.config import settings
+    from backend.onepagers.routes import router
+
+    app = FastAPI()
+    app.include_router(router)
+    operation = app.openapi()["paths"]["/onepagers"]["get"]
+
+    assert "X-Next-Cursor" in operation["responses"]["200"]["headers"]
+    skip = next(p for p in operation["parameters"] if p["name"] == "skip")
+    assert skip["deprecated"] is True
+    assert skip["schema"]["maximum"] == settings.onepager_list_max_skip
@@ -0,0 +1,122 @@
+"""
+Tests for PDF Cache Service
+===========================
+
+Unit tests for content-addressed keys and size-bounded LRU eviction
+across workers sharing the cache directory.
+
+Run tests:
+    pytest backend/tests/services/test_pdf_cache.py -v
+"""
+
+import asyncio
+
+from backend.services import pdf_cache as pdf_cache_module
+from backend.services.font_store import FontStore
+from backend.services.pdf_cache import PDFCache, make_image_cache_key, make_pdf_cache_key
+
+
+def test_key_depends_on_html_format_and_options():
+    base = make_pdf_cache_key("<html>a</html>", "letter")
+
+    assert base == make_pdf_cache_key("<html>a</html>", "letter")
+    assert base != make_pdf_cache_key("<html>b</html>", "letter")
+    assert base != make_pdf_cache_key("<html>a</html>", "a4")
+    assert base != make_pdf_cache_key("<html>a</html>", "letter", landscape=True)
+
+
+def test_key_depends_on_fonts_and_renderer(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_cache_module, "font_store", FontStore(root=tmp_path))
+    before = make_pdf_cache_key("<html>a</html>", "letter")
+
+    (tmp_path / "Inter").mkdir()
+    (tmp_path / "Inter" / "400.woff2").write_bytes(b"wOF2")
+    monkeypatch.setattr(pdf_cache_module, "font_store", FontStore(root=tmp_path))
+    with_fonts = make_pdf_cache_key("<html>a</html>", "letter")
+
+    monkeypatch.setattr(pdf_cache_module, "RENDERER_VERSION", "0.0.0")
+    other_renderer = make_pdf_cache_key("<html>a</html>", "letter")
+
+    assert len({before, with_fonts, other_renderer}) == 3
+
+
+def test_roundtrip_and_hit_counters(tmp_path):
+    cache = PDFCache(root=tmp_path, max_bytes=1024)
+
+    async def scenario():
+        assert await cache.get("k1") is None
+        await cache.put("k1", b"%PDF-1")
+        return await cache.get("k1")
+
+    assert asyncio.run(scenario()) == b"%PDF-1"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_respects_size_bound(tmp_path):
+    cache = PDFCache(root=tmp_path, max_bytes=10)
+    cache.put_sync("a", b"1234")
+    cache.put_sync("b", b"1234")
+    cache.get_sync("a")
+    cache.put_sync("c", b"1234")
+
+    assert cache.get_sync("b") is None
+    assert cache.get_sync("a") == b"1234"
+    assert not (tmp_path / "b.pdf").exists()
+    assert cache.stats()["bytes"] == 8
+
+
+def test_size_bound_is_shared_by_workers(tmp_path, monkeypatch):
+    # Other workers' writes are picked up by the periodic rescan
+    monkeypatch.setattr(pdf_cache_module, "RESCAN_SECONDS", 0)
+    worker_a = PDFCache(root=tmp_path, max_bytes=10)
+    worker_b = PDFCache(root=tmp_path, max_bytes=10)
+    worker_a.put_sync("a", b"1234")
+    worker_b.put_sync("b", b"1234")
+    worker_a.put_sync("c", b"1234")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.pdf", "c.pdf"]
+    assert worker_b.contains("c")
+
+
+def test_directory_is_scanned_only_when_over_the_bound(tmp_path, monkeypatch):
+    cache = PDFCache(root=tmp_path, max_bytes=10)
+    scans = []
+    monkeypatch.setattr(cache, "_scan", lambda real=cache._scan: scans.append(1) or real())
+
+    cache.put_sync("a", b"1234")
+    cache.put_sync("b", b"1234")
+    assert scans == []
+
+    cache.put_sync("c", b"1234")
+    assert len(scans) == 1
+    assert cache.stats()["bytes"] == 8
+
+
+def test_images_are_stored_with_their_extension(tmp_path):
+    cache = PDFCache(root=tmp_path, max_bytes=1024)
+    key = make_image_cache_key("<html>a</html>", {"format": "webp", "width": 816, "height": 1056, "scale": 0.4})
+
+    cache.put_sync(key, b"RIFF")
+
+    assert key.endswith(".webp")
+    assert [p.suffix for p in tmp_path.iterdir()] == [".webp"]
+    assert cache.get_sync(key) == b"RIFF"
+    assert PDFCache(root=tmp_path, max_bytes=1024).stats()["entries"] == 1
+
+
+def test_existing_files_indexed_on_startup(tmp_path):
+    PDFCache(root=tmp_path, max_bytes=1024).put_sync("a", b"1234")
+
+    reopened = PDFCache(root=tmp_path, max_bytes=1024)
+
+    assert reopened.stats()["entries"] == 1
+    assert reopened.get_sync("a") == b"1234"
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = PDFCache(root=tmp_path, max_bytes=0)
+    cache.put_sync("a", b"1234")
+
+    assert cache.get_sync("a") is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,104 @@
+"""
+Tests for PDF Generator Service
+===============================
+
+Unit tests for multi-format rendering and raster capture from a single
+page load. The browser is replaced by a fake page.
+
+Run tests:
+    pytest backend/tests/services/test_pdf_generator.py -v
+"""
+
+import asyncio
+import base64
+
+from backend.services import pdf_generator
+from backend.services.pdf_generator import PDFGenerator, build_raster_options
+
+
+class FakeCDPSession:
+    def __init__(self, page):
+        self.page = page
+
+    def send(self, method, params):
+        self.page.captures.append((self.page.media, params))
+        return {"data": base64.b64encode(params["format"].encode()).decode()}
+
+    def detach(self):
+        pass
+
+
+class FakePage:
+    def __init__(self):
+        self.loads = 0
+        self.printed = []
+        self.captures = []
+        self.media = None
+        self.context = self
+
+    def new_cdp_session(self, page):
+        return FakeCDPSession(page)
+
+    def emulate_media(self, media):
+        self.media = media
+
+    def on(self, event, handler):
+        pass
+
+    def remove_listener(self, event, handler):
+        pass
+
+    def set_viewport_size(self, viewport):
+        pass
+
+    def set_content(self, html, **kwargs):
+        self.loads += 1
+
+    def evaluate(self, script, arg):
+        return True
+
+    def pdf(self, **options):
+        self.printed.append((options["format"], options["landscape"]))
+        return f"%PDF {options['format']} {options['landscape']}".encode()
+
+
+def test_generate_pdfs_loads_html_once(monkeypatch):
+    page = FakePage()
+    monkeypatch.setattr(pdf_generator, "_launch_and_render", lambda render: render(page))
+
+    pdfs = asyncio.run(PDFGenerator().generate_pdfs(
+        "<html></html>",
+        ["letter", "a4", "letter"],
+        orientations=(False, True)
+    ))
+
+    assert page.loads == 1
+    assert list(pdfs) == ["letter", "letter_landscape", "a4", "a4_landscape"]
+    assert pdfs["a4_landscape"] == b"%PDF A4 True"
+    assert len(page.printed) == 4
+
+
+def test_thumbnail_captured_from_same_page_load(monkeypatch):
+    page = FakePage()
+    monkeypatch.setattr(pdf_generator, "_launch_and_render", lambda render: render(page))
+    thumbnail = build_raster_options("webp", "letter", thumbnail_width=408)
+
+    results = asyncio.run(PDFGenerator().generate_pdfs(
+        "<html></html>",
+        ["letter"],
+        images={"thumbnail": thumbnail}
+    ))
+
+    assert page.loads == 1
+    assert results["thumbnail"] == b"webp"
+    media, params = page.captures[0]
+    assert media == "print"
+    assert params["clip"]["width"] == 816 and params["clip"]["scale"] == 0.5
+    assert page.media == "null"
+
+
+def test_build_raster_options_uses_dpi_scale():
+    options = build_raster_options("png", "a4", dpi=192)
+
+    assert options["scale"] == 2.0
+    assert "quality" not in options
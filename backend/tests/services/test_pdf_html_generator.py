@@ -0,0 +1,94 @@
+"""
+Tests for PDF HTML Generator Service
+====================================
+
+Unit tests for template precompilation, the on-disk bytecode cache,
+streamed HTML output and key stats extraction.
+
+Run tests:
+    pytest backend/tests/services/test_pdf_html_generator.py -v
+"""
+
+from bson import ObjectId
+
+from backend.models.brand_kit import BrandKitInDB
+from backend.models.onepager import OnePagerLayout
+from backend.services.pdf_html_generator import (
+    PDFHTMLGenerator, TEMPLATE_MAP, extract_key_stats, stream_html_chunks
+)
+
+
+def test_precompile_fills_bytecode_cache(tmp_path):
+    generator = PDFHTMLGenerator(auto_reload=False, bytecode_cache_dir=str(tmp_path))
+
+    assert generator.precompile() == len(TEMPLATE_MAP)
+    # Templates include shared sections, so there is at least one entry per template
+    assert len(list(tmp_path.iterdir())) >= len(TEMPLATE_MAP)
+
+    template = generator.env.get_template(TEMPLATE_MAP["bold"])
+    assert generator.env.get_template(TEMPLATE_MAP["bold"]) is template
+
+
+def test_stream_html_chunks_flushes_head_with_extra_markup():
+    pieces = ["<html><he", "ad><style></style></he", "ad><body>", "a" * 10, "b" * 10, "</body></html>"]
+
+    chunks = list(stream_html_chunks(pieces, head_extra="<style>x</style>", chunk_size=15))
+
+    assert chunks[0] == "<html><head><style></style><style>x</style></head>"
+    assert "".join(chunks[1:]) == "<body>" + "a" * 10 + "b" * 10 + "</body></html>"
+    assert len(chunks) == 3
+
+
+def test_generate_html_stream_matches_generate_html():
+    generator = PDFHTMLGenerator(bytecode_cache_dir="")
+    onepager = OnePagerLayout(
+        title="Acme",
+        elements=[
+            {"id": "hero", "type": "hero", "order": 0,
+             "content": {"headline": "Hello", "description": "World"}},
+            {"id": "about", "type": "text", "title": "About", "order": 1, "content": "We build tools."},
+        ],
+    )
+    brand_kit = BrandKitInDB(
+        _id=ObjectId(), user_id=ObjectId(), company_name="Acme",
+        color_palette={"primary": "#0ea5e9", "secondary": "#64748b", "accent": "#10b981"},
+    )
+
+    html = generator.generate_html(onepager, brand_kit, template_name="product")
+    chunks = list(generator.generate_html_stream(onepager, brand_kit, template_name="product", head_extra="<!--x-->"))
+
+    assert chunks[0].endswith("<!--x--></head>")
+    assert "".join(chunks) == html.replace("</head>", "<!--x--></head>")
+
+
+def test_extract_key_stats_keeps_pattern_priority_and_memoizes():
+    onepager = OnePagerLayout(
+        title="Acme",
+        elements=[
+            {"id": "a", "type": "text", "order": 0,
+             "content": "$2M revenue from 30% growth over 12 years with 500+ clients and 40 staff"},
+        ],
+    )
+
+    stats = extract_key_stats(onepager)
+    # Pattern order (clients, years, team, growth), not text order
+    assert [s["number"] for s in stats] == ["500+", "12", "40", "30%"]
+    assert stats[0] == {"number": "500+", "label": "Clients", "icon": "👥"}
+
+    stats[0]["number"] = "edited"
+    assert extract_key_stats(onepager)[0]["number"] == "500+"
+
+
+def test_extract_key_stats_falls_back_to_feature_and_benefit_counts():
+    onepager = OnePagerLayout(
+        title="Acme",
+        elements=[
+            {"id": "f", "type": "list", "title": "Key Features", "order": 0, "content": ["a", "b", "c"]},
+            {"id": "b", "type": "list", "title": "Benefits", "order": 1, "content": ["x"]},
+        ],
+    )
+
+    assert extract_key_stats(onepager) == [
+        {"number": "3", "label": "Features", "icon": "⚡"},
+        {"number": "1", "label": "Benefits", "icon": "🎯"},
+    ]
@@ -0,0 +1,78 @@
+"""
+Tests for Render Model Service
+==============================
+
+Unit tests for mapping stored one-pagers and brand kits to template data
+and for render model memoization.
+
+Run tests:
+    pytest backend/tests/services/test_render_model.py -v
+"""
+
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+from backend.models.brand_kit import BrandKitInDB
+from backend.models.onepager import OnePagerLayout
+from backend.services.pdf_html_generator import PDFHTMLGenerator
+from backend.services.render_model import RenderModelCache, build_render_model
+
+
+def _docs():
+    brand_kit_id = ObjectId()
+    onepager = {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "brand_kit_id": brand_kit_id,
+        "title": "Acme",
+        "updated_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "content": {
+            "headline": "Know your numbers",
+            "sections": [
+                {"id": "f", "type": "list", "title": "Features", "content": ["Charts", "Exports"], "order": 7},
+                {"id": "t", "type": "text", "title": "About", "content": "Serving 50+ clients"},
+            ],
+        },
+    }
+    brand_kit = {
+        "_id": brand_kit_id,
+        "user_id": onepager["user_id"],
+        "company_name": "Acme",
+        "color_palette": {"primary": "#112233", "secondary": "#445566", "accent": "#778899"},
+        "logo_url": "https://example.com/logo.png",
+        "updated_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    }
+    return onepager, brand_kit
+
+
+def test_render_model_matches_validated_models():
+    onepager_doc, brand_kit_doc = _docs()
+    model = build_render_model(onepager_doc, brand_kit_doc)
+
+    elements = model["onepager"]["elements"]
+    assert [(e["id"], e["type"], e["order"]) for e in elements] == [
+        ("hero-main", "hero", 0), ("f", "list", 1), ("t", "text", 2)
+    ]
+
+    validated = PDFHTMLGenerator(bytecode_cache_dir="")._render_model_from(
+        OnePagerLayout(title="Acme", elements=elements), BrandKitInDB(**brand_kit_doc)
+    )
+    assert validated["onepager"]["elements"] == elements
+    assert validated["key_stats"] == model["key_stats"]
+    for field in ("color_palette", "typography", "logo", "company_name"):
+        assert validated["brand"][field] == model["brand"][field]
+
+
+def test_render_models_are_memoized_per_version():
+    onepager_doc, brand_kit_doc = _docs()
+    cache = RenderModelCache(max_entries=4)
+
+    model = cache.get_or_build(onepager_doc, brand_kit_doc)
+    assert cache.get_or_build(dict(onepager_doc), brand_kit_doc) is model
+
+    edited = {**onepager_doc, "updated_at": datetime(2024, 1, 2, tzinfo=timezone.utc)}
+    assert cache.get_or_build(edited, brand_kit_doc) is not model
+    rebranded = {**brand_kit_doc, "updated_at": datetime(2024, 1, 2, tzinfo=timezone.utc)}
+    assert cache.get_or_build(onepager_doc, rebranded) is not model
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 3
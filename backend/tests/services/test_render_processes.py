@@ -0,0 +1,76 @@
+"""
+Tests for Render Process Pool Service
+=====================================
+
+Unit tests for running work in render worker processes, spreading
+concurrent renders across them and recovering when a worker dies. No
+browser is launched (warm-up disabled).
+
+Run tests:
+    pytest backend/tests/services/test_render_processes.py -v
+"""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.render_processes import RenderProcessPool, RenderProcessError
+from backend.services.render_scheduler import RenderScheduler, render_capacity
+
+
+def test_crashed_worker_does_not_take_down_the_pool():
+    pool = RenderProcessPool(processes=1)
+
+    async def scenario():
+        await pool.start(warm=False)
+        try:
+            first_pid = await pool._call(os.getpid)
+            assert first_pid != os.getpid()
+
+            with pytest.raises(RenderProcessError):
+                await pool._call(os._exit, 1)
+
+            second_pid = await pool._call(os.getpid)
+            assert second_pid not in (first_pid, os.getpid())
+        finally:
+            await pool.stop()
+
+    asyncio.run(scenario())
+
+    stats = pool.stats()
+    assert stats["restarts"] == 1
+    assert stats["running"] is False
+
+
+def _pid_after_render():
+    time.sleep(0.5)
+    return os.getpid()
+
+
+def test_concurrent_renders_spread_across_processes():
+    config = SimpleNamespace(
+        pdf_render_max_concurrency=0, pdf_render_backend="processes",
+        pdf_render_processes=2, pdf_browser_pool_size=2
+    )
+    pool = RenderProcessPool(processes=config.pdf_render_processes)
+    scheduler = RenderScheduler(max_concurrency=render_capacity(config))
+
+    async def render(user_id):
+        async with scheduler.slot(user_id):
+            return await pool._call(_pid_after_render)
+
+    async def scenario():
+        await pool.start(warm=False)
+        try:
+            return await asyncio.gather(*(render(f"user{i}") for i in range(4)))
+        finally:
+            await pool.stop()
+
+    pids = asyncio.run(scenario())
+
+    assert scheduler.max_concurrency == 2
+    assert len(set(pids)) == 2
+    assert os.getpid() not in pids
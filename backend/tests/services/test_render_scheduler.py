@@ -0,0 +1,112 @@
+"""
+Tests for Render Scheduler Service
+==================================
+
+Unit tests for the render concurrency limit, per-user fair queueing and
+bounded admission (429 backpressure).
+
+Run tests:
+    pytest backend/tests/services/test_render_scheduler.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.render_scheduler import RenderScheduler, RenderQueueFullError
+
+
+def test_concurrency_limit_and_round_robin_between_users():
+    scheduler = RenderScheduler(max_concurrency=1, max_queue=10, max_queued_per_user=10)
+    order = []
+
+    async def render(user, label, gate=None):
+        async with scheduler.slot(user):
+            order.append(label)
+            if gate:
+                await gate.wait()
+
+    async def scenario():
+        gate = asyncio.Event()
+        first = asyncio.create_task(render("alice", "a0", gate))
+        await asyncio.sleep(0)
+        # alice queues three renders before bob queues one
+        tasks = [asyncio.create_task(render("alice", f"a{i}")) for i in range(1, 4)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(render("bob", "b1")))
+        await asyncio.sleep(0)
+
+        assert scheduler.active == 1
+        assert scheduler.queue_depth == 4
+        gate.set()
+        await asyncio.gather(first, *tasks)
+
+    asyncio.run(scenario())
+
+    assert order == ["a0", "a1", "b1", "a2", "a3"]
+    assert scheduler.stats()["peak_queue_depth"] == 4
+
+
+def test_bounded_queue_rejects_with_retry_after():
+    scheduler = RenderScheduler(max_concurrency=1, max_queue=5, max_queued_per_user=1)
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot("alice"):
+                await gate.wait()
+
+        async def queued():
+            async with scheduler.slot("alice"):
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(queued())
+        await asyncio.sleep(0)
+
+        with pytest.raises(RenderQueueFullError) as excinfo:
+            async with scheduler.slot("alice"):
+                pass
+
+        # Unbounded admission still waits instead of failing
+        background = asyncio.create_task(queued_unbounded(scheduler))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(holder, waiter, background)
+        return excinfo.value
+
+    async def queued_unbounded(scheduler):
+        async with scheduler.slot("alice", bounded=False):
+            pass
+
+    error = asyncio.run(scenario())
+
+    assert error.retry_after >= 1
+    assert scheduler.stats()["rejected"] == 1
+    assert scheduler.active == 0 and scheduler.queue_depth == 0
+
+
+def test_cancelled_waiter_leaves_queue():
+    scheduler = RenderScheduler(max_concurrency=1)
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot("alice"):
+                await gate.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert scheduler.queue_depth == 0
+        gate.set()
+        await holder
+
+    asyncio.run(scenario())
+    assert scheduler.active == 0
@@ -0,0 +1,87 @@
+"""
+Tests for Render Snapshot Service
+=================================
+
+Unit tests for the render snapshot stored on one-pager writes and for
+reading it back in place of rebuilding the render model.
+
+Run tests:
+    pytest backend/tests/services/test_render_snapshot.py -v
+"""
+
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+from backend.services.html_cache import make_html_cache_key
+from backend.services.render_model import build_render_model, with_render_snapshot
+from backend.services.render_snapshot import apply_set, get_render_snapshot
+
+
+T1 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+T2 = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+def _onepager():
+    return {
+        "_id": ObjectId(),
+        "user_id": ObjectId(),
+        "title": "Acme",
+        "updated_at": T1,
+        "layout_params": {"color_theme": {"primary": "#112233"}},
+        "content": {
+            "headline": "Know your numbers",
+            "sections": [{"id": "t", "type": "text", "title": "About", "content": "Serving 50+ clients"}],
+        },
+    }
+
+
+def _brand_kit(onepager):
+    return {"_id": ObjectId(), "user_id": onepager["user_id"], "company_name": "Acme"}
+
+
+def test_apply_set_handles_dotted_paths_without_mutating():
+    doc = _onepager()
+    updated = apply_set(doc, {"content.headline": "New", "updated_at": T2})
+
+    assert updated["content"]["headline"] == "New"
+    assert updated["content"]["sections"] == doc["content"]["sections"]
+    assert doc["content"]["headline"] == "Know your numbers"
+    assert doc["updated_at"] == T1
+
+
+def test_snapshot_matches_render_model_built_from_content():
+    doc = _onepager()
+    sections = [{"id": "s", "type": "text", "title": "Growth", "content": "35% growth in 2 years"}]
+    update_doc = with_render_snapshot(doc, {"content.sections": sections, "updated_at": T2})
+    stored = apply_set(doc, update_doc)
+
+    assert get_render_snapshot(stored) is not None
+    assert update_doc["render_hash"] == update_doc["render_snapshot"]["hash"]
+
+    from_snapshot = build_render_model(stored, _brand_kit(stored))
+    from_content = build_render_model({**stored, "render_snapshot": None}, _brand_kit(stored))
+    assert from_snapshot["onepager"] == from_content["onepager"]
+    assert from_snapshot["key_stats"] == from_content["key_stats"]
+
+
+def test_stale_snapshot_is_ignored():
+    doc = apply_set(_onepager(), with_render_snapshot(_onepager(), {"updated_at": T1}))
+    doc["title"] = "Renamed elsewhere"
+    doc["updated_at"] = T2
+
+    assert get_render_snapshot(doc) is None
+    assert build_render_model(doc, _brand_kit(doc))["onepager"]["title"] == "Renamed elsewhere"
+
+
+def test_html_cache_key_follows_render_hash():
+    doc = _onepager()
+    first = apply_set(doc, with_render_snapshot(doc, {"updated_at": T1}))
+    # A write that doesn't change what renders keeps the same key
+    touched = apply_set(first, with_render_snapshot(first, {"updated_at": T2}))
+    brand_kit = _brand_kit(doc)
+
+    assert make_html_cache_key(first, brand_kit, "bold") == make_html_cache_key(touched, brand_kit, "bold")
+
+    edited = apply_set(first, with_render_snapshot(first, {"content.headline": "New", "updated_at": T2}))
+    assert make_html_cache_key(edited, brand_kit, "bold") != make_html_cache_key(first, brand_kit, "bold")
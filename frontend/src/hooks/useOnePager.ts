@@ -44,6 +44,20 @@ export const useOnePager = (id: string) => {
   });
 };
 
+/**
+ * Fetch a page of OnePager version history (newest first)
+ * Used by the version history sidebar
+ */
+export const useOnePagerVersions = (id: string, skip = 0, limit = 20) => {
+  const accessToken = useAuthStore((state) => state.accessToken);
+
+  return useQuery({
+    queryKey: ['onepagerVersions', id, { skip, limit }],
+    queryFn: () => onepagerService.getVersions(id, accessToken!, skip, limit),
+    enabled: !!accessToken && !!id,
+  });
+};
+
 /**
  * Create new OnePager with AI generation
  * Invalidates list cache on success
@@ -97,6 +111,8 @@ export const useIterateOnePager = () => {
     onSuccess: (_, variables) => {
       // Invalidate specific OnePager to refetch updated content
       queryClient.invalidateQueries({ queryKey: ['onepager', variables.id] });
+      // A new version was saved
+      queryClient.invalidateQueries({ queryKey: ['onepagerVersions', variables.id] });
       // Invalidate list (updated_at timestamp changed)
       queryClient.invalidateQueries({ queryKey: ['onepagers'] });
     },
@@ -161,6 +177,8 @@ export const useRestoreOnePagerVersion = () => {
     onSuccess: (_, variables) => {
       // Invalidate specific OnePager to refetch restored content
       queryClient.invalidateQueries({ queryKey: ['onepager', variables.id] });
+      // The restore is saved as a new version
+      queryClient.invalidateQueries({ queryKey: ['onepagerVersions', variables.id] });
       // Invalidate list (updated_at timestamp changed)
       queryClient.invalidateQueries({ queryKey: ['onepagers'] });
     },
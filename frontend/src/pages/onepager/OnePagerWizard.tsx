@@ -22,7 +22,12 @@ import { PDFExportStep } from './steps/PDFExportStep';
 import { StepProgress } from '../../components/onepager/StepProgress';
 import { Sidebar } from '../../components/layouts/Sidebar';
 import { VersionHistorySidebar } from '../../components/onepager/VersionHistorySidebar';
-import { useCreateOnePager, useOnePager, useRestoreOnePagerVersion } from '../../hooks/useOnePager';
+import {
+  useCreateOnePager,
+  useOnePager,
+  useOnePagerVersions,
+  useRestoreOnePagerVersion,
+} from '../../hooks/useOnePager';
 import { toaster } from '../../components/ui/toaster';
 import type { OnePagerCreateData } from '../../types/onepager';
 
@@ -41,6 +46,7 @@ export function OnePagerWizard() {
   
   const createMutation = useCreateOnePager();
   const { data: existingOnePager } = useOnePager(existingOnePagerId || '');
+  const { data: versionPage } = useOnePagerVersions(existingOnePagerId || '');
   const restoreVersionMutation = useRestoreOnePagerVersion();
 
   const [currentStep, setCurrentStep] = useState<WizardStep>(existingOnePagerId ? 'refine' : 'add-content');
@@ -330,8 +336,8 @@ export function OnePagerWizard() {
           {currentStep === 'refine' && existingOnePager && (
             <Box px={6} mt={6}>
               <VersionHistorySidebar
-                versions={(existingOnePager.version_history || []) as any}
-                currentVersion={existingOnePager.version_history?.length || 0}
+                versions={versionPage?.items || []}
+                currentVersion={existingOnePager.version_count || 0}
                 onRestore={handleRestoreVersion}
                 isRestoring={restoreVersionMutation.isPending}
               />
@@ -14,6 +14,7 @@ import type {
   OnePagerUpdateData,
   PDFFormat,
   LayoutSuggestionResponse,
+  VersionListResponse,
 } from '../types/onepager';
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000';
@@ -189,6 +190,32 @@ export const onepagerService = {
     };
   },
 
+  /**
+   * Get a page of OnePager version history (newest first)
+   */
+  async getVersions(
+    id: string,
+    token: string,
+    skip = 0,
+    limit = 20
+  ): Promise<VersionListResponse> {
+    const params = new URLSearchParams({
+      skip: String(skip),
+      limit: String(limit),
+    });
+
+    const response = await axios.get(
+      `${API_BASE_URL}/api/v1/onepagers/${id}/versions?${params}`,
+      {
+        headers: {
+          Authorization: `Bearer ${token}`,
+        },
+      }
+    );
+
+    return response.data;
+  },
+
   /**
    * Restore OnePager to a previous version
    * Reverts content and layout to specified version snapshot
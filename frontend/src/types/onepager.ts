@@ -129,6 +129,16 @@ export interface VersionSnapshot {
   change_description?: string;  // Changed from 'description' to match backend
 }
 
+/**
+ * Page of version history (newest first)
+ */
+export interface VersionListResponse {
+  items: VersionSnapshot[];
+  total: number;
+  skip: number;
+  limit: number;
+}
+
 /**
  * LayoutParams Type Definitions
  * ===============================
@@ -205,7 +215,7 @@ export interface OnePager {
   layout: LayoutBlock[];
   style_overrides: Record<string, any>;
   generation_metadata: GenerationMetadata;
-  version_history: VersionSnapshot[];
+  version_count: number;  // Versions are fetched page by page (VersionListResponse)
   layout_params?: LayoutParams | null;
   design_rationale?: string | null;
   pdf_template: PDFTemplate;  // PDF template for export
@@ -22,7 +22,7 @@ async def list_onepagers():
             print(f"ID: {onepager['_id']}")
             print(f"Title: {onepager['title']}")
             print(f"Sections: {len(onepager['content']['sections'])}")
-            print(f"Version History: {len(onepager.get('version_history', []))}")
+            print(f"Versions: {onepager.get('version_count', len(onepager.get('version_history', [])))}")
             print(f"Updated: {onepager['updated_at']}")
             print("-" * 60)
 